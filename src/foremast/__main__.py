@@ -5,8 +5,9 @@ import logging
 import os
 
 from . import runner, validate
-from .args import add_debug, add_env
-from .consts import LOGGING_FORMAT, SHORT_LOGGING_FORMAT
+from .args import add_debug, add_env, add_shard
+from .consts import (INFRA_WORKERS, LOGGING_FORMAT, REBUILD_ATTEMPTS, REBUILD_RETRY_WAIT, REBUILD_STATE_FILE,
+                     SHORT_LOGGING_FORMAT)
 from .version import print_version
 
 LOG = logging.getLogger(__name__)
@@ -16,6 +17,11 @@ def add_infra(subparsers):
     """Infrastructure subcommands."""
     infra_parser = subparsers.add_parser('infra', help=runner.prepare_infrastructure.__doc__)
     infra_parser.set_defaults(func=runner.prepare_infrastructure)
+    infra_parser.add_argument(
+        '-j', '--jobs', type=int, default=INFRA_WORKERS, help='Number of infrastructure steps to run at the same time')
+    infra_parser.add_argument(
+        '--only', type=lambda value: value.split(','), help='Comma separated steps to run, e.g. iam,secgroups')
+    infra_parser.add_argument('--skip', type=lambda value: value.split(','), help='Comma separated steps to skip')
 
 
 def add_pipeline(subparsers):
@@ -42,11 +48,34 @@ def add_rebuild(subparsers):
         'rebuild', help=runner.rebuild_pipelines.__doc__, formatter_class=argparse.ArgumentDefaultsHelpFormatter)
     rebuild_parser.set_defaults(func=runner.rebuild_pipelines)
     rebuild_parser.add_argument('-a', '--all', action='store_true', help='Rebuild all Pipelines')
+    rebuild_parser.add_argument(
+        '-j', '--jobs', type=int, default=1, help='Number of applications to rebuild at the same time')
     rebuild_parser.add_argument(
         'project',
         nargs='?',
         default=os.getenv('REBUILD_PROJECT'),
         help='Project to rebuild, overrides $REBUILD_PROJECT')
+    add_shard(rebuild_parser)
+    rebuild_parser.add_argument('--results', help='Write JSON results to this file')
+    rebuild_parser.add_argument(
+        '--incremental', action='store_true', help='Skip applications unchanged since their last rebuild')
+    rebuild_parser.add_argument('--force', action='store_true', help='Rebuild unchanged applications too')
+    rebuild_parser.add_argument(
+        '--state-file', default=REBUILD_STATE_FILE, help='JSON file recording the last rebuild of each application')
+    rebuild_parser.add_argument(
+        '--checkpoint', help='JSON file recording progress after each application, rebuild_checkpoint_file with --resume')
+    rebuild_parser.add_argument(
+        '--resume', action='store_true', help='Only rebuild applications pending or failed in --checkpoint')
+    rebuild_parser.add_argument(
+        '--attempts', type=int, default=REBUILD_ATTEMPTS, help='Most attempts to rebuild each application')
+    rebuild_parser.add_argument(
+        '--retry-wait', type=float, default=REBUILD_RETRY_WAIT, help='Seconds before first retry, doubling after')
+
+    report_parser = subparsers.add_parser(
+        'rebuild-report', help=runner.rebuild_report.__doc__, formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    report_parser.set_defaults(func=runner.rebuild_report)
+    report_parser.add_argument('results', nargs='+', help='JSON results files from rebuild --results')
+    report_parser.add_argument('-o', '--output', help='Write merged report to this file instead of stdout')
 
 
 def add_autoscaling(subparsers):
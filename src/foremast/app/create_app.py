@@ -20,12 +20,11 @@ Looks to see if the application exists, and if not creates the application.
 import logging
 from pprint import pformat
 
-import requests
 from gogoutils import Generator
 
-from ..consts import API_URL, APP_FORMATS, DEFAULT_RUN_AS_USER, GATE_CA_BUNDLE, GATE_CLIENT_CERT, LINKS
+from ..consts import API_URL, APP_FORMATS, DEFAULT_RUN_AS_USER, LINKS
 from ..exceptions import ForemastError
-from ..utils import get_template, wait_for_task
+from ..utils import GATE_CACHE, gate_request, get_template, wait_for_task
 
 
 class SpinnakerApp:
@@ -65,10 +64,13 @@ class SpinnakerApp:
             AssertionError: Failure getting accounts from Spinnaker.
         """
         url = '{gate}/credentials'.format(gate=API_URL)
-        response = requests.get(url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
-        assert response.ok, 'Failed to get accounts: {0}'.format(response.text)
 
-        all_accounts = response.json()
+        def load_accounts():
+            response = gate_request(uri=url)
+            assert response.ok, 'Failed to get accounts: {0}'.format(response.text)
+            return response.json()
+
+        all_accounts = GATE_CACHE.get(url, load_accounts)
         self.log.debug('Accounts in Spinnaker:\n%s', all_accounts)
 
         filtered_accounts = []
@@ -92,6 +94,7 @@ class SpinnakerApp:
         self.log.debug('App info:\n%s', pformat(self.appinfo))
         jsondata = self.retrieve_template()
         wait_for_task(jsondata)
+        GATE_CACHE.invalidate('{gate}/applications'.format(gate=API_URL))
 
         self.log.info("Successfully created %s application", self.appname)
         return jsondata
@@ -14,10 +14,12 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Common _argparse_ arguments."""
+import argparse
 import logging
 import os
 
 from .consts import ENVS
+from .utils.shards import parse_shard
 
 
 def add_app(parser):
@@ -64,3 +66,19 @@ def add_artifact_path(parser):
 def add_artifact_version(parser):
     """Add an `artifact-version` flag to _parser_."""
     parser.add_argument('--artifact-version', help='Artifact version for S3 deployments')
+
+
+def shard_type(value):
+    """Convert **INDEX/COUNT** argument for _argparse_."""
+    try:
+        return parse_shard(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+
+
+def add_shard(parser):
+    """Add `shard` flags to the _parser_."""
+    parser.add_argument(
+        '--shard', type=shard_type, help='Only rebuild slice INDEX/COUNT of applications, INDEX counts from 0')
+    parser.add_argument(
+        '--weighted', action='store_true', help='Balance shards by number of accounts for each application')
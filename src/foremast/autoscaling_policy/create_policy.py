@@ -22,10 +22,8 @@ import logging
 import os
 from math import floor
 
-import requests
-
-from ..consts import API_URL, GATE_CA_BUNDLE, GATE_CLIENT_CERT
-from ..utils import get_properties, get_template, wait_for_task
+from ..consts import API_URL
+from ..utils import TaskTracker, gate_request, get_properties, get_template
 
 
 class AutoScalingPolicy:
@@ -40,6 +38,7 @@ class AutoScalingPolicy:
     Attributes:
         log (str): Logger name
         settings (dict): Properties imported from prop_path
+        tracker (TaskTracker): Poller for Spinnaker Tasks submitted together
     """
 
     def __init__(self, app='', prop_path='', env='', region=''):
@@ -52,6 +51,7 @@ class AutoScalingPolicy:
         self.app = app
 
         self.settings = get_properties(properties_file=prop_path, env=self.env, region=self.region)
+        self.tracker = TaskTracker()
 
     def prepare_policy_template(self, scaling_type, period_sec, server_group):
         """Renders scaling policy templates based on configs and variables.
@@ -61,6 +61,9 @@ class AutoScalingPolicy:
             scaling_type (str): ``scale_up`` or ``scaling_down``. Type of policy
             period_sec (int): Period of time to look at metrics for determining scale
             server_group (str): The name of the server group to render template for
+
+        Returns:
+            concurrent.futures.Future: Spinnaker Task creating the policy
         """
         template_kwargs = {
             'app': self.app,
@@ -84,8 +87,7 @@ class AutoScalingPolicy:
 
         rendered_template = get_template(template_file='infrastructure/autoscaling_policy.json.j2', **template_kwargs)
         self.log.info('Creating a %s policy in %s for %s', scaling_type, self.env, self.app)
-        wait_for_task(rendered_template)
-        self.log.info('Successfully created a %s policy in %s for %s', scaling_type, self.env, self.app)
+        return self.tracker.submit(rendered_template)
 
     def create_policy(self):
         """Wrapper function. Gets the server group, sets sane defaults,
@@ -101,18 +103,22 @@ class AutoScalingPolicy:
 
         # Find all existing and remove them
         scaling_policies = self.get_all_existing(server_group)
+        delete_tasks = []
         for policy in scaling_policies:
             for subpolicy in policy:
-                self.delete_existing_policy(subpolicy, server_group)
+                delete_tasks.append(self.delete_existing_policy(subpolicy, server_group))
+        self.tracker.wait_all(delete_tasks)
 
         if self.settings['asg']['scaling_policy']['period_minutes']:
             period_sec = int(self.settings['asg']['scaling_policy']['period_minutes']) * 60
         else:
             period_sec = 1800
 
-        self.prepare_policy_template('scale_up', period_sec, server_group)
+        create_tasks = [self.prepare_policy_template('scale_up', period_sec, server_group)]
         if self.settings['asg']['scaling_policy'].get('scale_down', True):
-            self.prepare_policy_template('scale_down', period_sec, server_group)
+            create_tasks.append(self.prepare_policy_template('scale_down', period_sec, server_group))
+        self.tracker.wait_all(create_tasks)
+        self.log.info('Successfully created %d policies in %s for %s', len(create_tasks), self.env, self.app)
 
     def get_server_group(self):
         """Finds the most recently deployed server group for the application.
@@ -122,7 +128,7 @@ class AutoScalingPolicy:
             server_group (str): Name of the newest server group
         """
         api_url = "{0}/applications/{1}".format(API_URL, self.app)
-        response = requests.get(api_url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+        response = gate_request(uri=api_url)
         for server_group in response.json()['clusters'][self.env]:
             return server_group['serverGroups'][-1]
 
@@ -133,6 +139,9 @@ class AutoScalingPolicy:
         Args:
             scaling_policy (json): the scaling_policy json from Spinnaker that should be deleted
             server_group (str): the affected server_group
+
+        Returns:
+            concurrent.futures.Future: Spinnaker Task deleting the policy
         """
         self.log.info("Deleting policy %s on %s", scaling_policy['policyName'], server_group)
         delete_dict = {
@@ -150,7 +159,7 @@ class AutoScalingPolicy:
                 "user": "foremast-autoscaling-policy"
             }]
         }
-        wait_for_task(json.dumps(delete_dict))
+        return self.tracker.submit(json.dumps(delete_dict))
 
     def get_all_existing(self, server_group):
         """Finds all existing scaling policies for an application
@@ -160,7 +169,7 @@ class AutoScalingPolicy:
         """
         self.log.info("Checking for existing scaling policy")
         url = "{0}/applications/{1}/clusters/{2}/{1}/serverGroups".format(API_URL, self.app, self.env)
-        response = requests.get(url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+        response = gate_request(uri=url)
         assert response.ok, "Error looking for existing Autoscaling Policy for {0}: {1}".format(self.app, response.text)
 
         scalingpolicies = []
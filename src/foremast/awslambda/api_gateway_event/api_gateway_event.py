@@ -16,17 +16,78 @@
 """Handle API Gateway events"""
 
 import logging
+import threading
 
-import boto3
 import botocore
 from tryagain import retries
 
-from foremast.utils import (add_lambda_permissions, get_details, get_env_credential, get_lambda_alias_arn,
-                            get_lambda_arn, get_properties)
+from foremast.utils import (add_lambda_permissions, get_boto_client, get_details, get_env_credential,
+                            get_lambda_alias_arn, get_lambda_arn, get_properties)
 
 LOG = logging.getLogger(__name__)
 
 
+class APIGatewayIndex:
+    """REST APIs, resources, and API Keys in one account and Region.
+
+    Each listing is paginated once and reused by every trigger sharing the
+    index, and items created through :class:`APIGateway` are added as they
+    are made.
+
+    Args:
+        env (str): Environment/account for deployments
+        region (str): AWS Region
+    """
+
+    def __init__(self, env='', region=''):
+        self.client = get_boto_client('apigateway', profile=env, region=region)
+        self.lock = threading.RLock()
+        self._rest_apis = None
+        self._resources = {}
+        self._api_keys = None
+
+    def _list(self, operation, key='name', value='id', **kwargs):
+        """Page through _operation_ and map each item _key_ to _value_."""
+        items = {}
+        for page in self.client.get_paginator(operation).paginate(**kwargs):
+            for item in page['items']:
+                items.setdefault(item[key], item[value])
+        return items
+
+    def rest_apis(self):
+        """Get REST API IDs by name."""
+        with self.lock:
+            if self._rest_apis is None:
+                self._rest_apis = self._list('get_rest_apis')
+            return self._rest_apis
+
+    def resources(self, api_id):
+        """Get resource IDs of REST API _api_id_ by path."""
+        with self.lock:
+            if api_id not in self._resources:
+                self._resources[api_id] = self._list('get_resources', key='path', restApiId=api_id)
+            return self._resources[api_id]
+
+    def api_keys(self):
+        """Get API Key IDs by name."""
+        with self.lock:
+            if self._api_keys is None:
+                self._api_keys = self._list('get_api_keys')
+            return self._api_keys
+
+    def add_rest_api(self, name, api_id):
+        """Remember a newly created REST API."""
+        self.rest_apis()[name] = api_id
+
+    def add_resource(self, api_id, path, resource_id):
+        """Remember a newly created resource."""
+        self.resources(api_id)[path] = resource_id
+
+    def add_api_key(self, name, key_id):
+        """Remember a newly created API Key."""
+        self.api_keys()[name] = key_id
+
+
 class APIGateway:
     """Class to handle API Gateway and Lambda integration.
 
@@ -36,36 +97,37 @@ class APIGateway:
         region (str): AWS Region
         rules (dict): Trigger settings
         prop_path (str): Path to the raw.properties.json
+        permissions (LambdaPermissions, optional): Reconcile trigger
+            permissions with the existing policy.
+        api_index (APIGatewayIndex, optional): REST APIs, resources, and API
+            Keys already listed for _env_ and _region_.
     """
 
-    def __init__(self, app='', env='', region='', rules={}, prop_path=''):
+    def __init__(self, app='', env='', region='', rules={}, prop_path='', permissions=None, api_index=None):
         self.log = logging.getLogger(__name__)
         self.generated = get_details(app=app, env=env)
         self.trigger_settings = rules
+        self.permissions = permissions
         self.app_name = self.generated.app_name()
         self.env = env
         self.account_id = get_env_credential(env=self.env)['accountId']
         self.region = region
         self.properties = get_properties(properties_file=prop_path, env=self.env, region=self.region)
 
-        session = boto3.Session(profile_name=env, region_name=region)
-        self.client = session.client('apigateway')
-        self.lambda_client = session.client('lambda')
+        self.client = get_boto_client('apigateway', profile=env, region=region)
+        self.lambda_client = get_boto_client('lambda', profile=env, region=region)
         self.api_version = self.lambda_client.meta.service_model.api_version
+        self.api_index = api_index or APIGatewayIndex(env=env, region=region)
 
         self.api_id = self.find_api_id()
         self.resource_id, self.parent_id = self.find_resource_ids()
 
     def find_api_id(self):
         """Given API name, find API ID."""
-        allapis = self.client.get_rest_apis()
         api_name = self.trigger_settings['api_name']
-        api_id = None
-        for api in allapis['items']:
-            if api['name'] == api_name:
-                api_id = api['id']
-                self.log.info("Found API for: %s", api_name)
-                break
+        api_id = self.api_index.rest_apis().get(api_name)
+        if api_id:
+            self.log.info("Found API for: %s", api_name)
         else:
             api_id = self.create_api()
 
@@ -73,15 +135,11 @@ class APIGateway:
 
     def find_resource_ids(self):
         """Given a resource path and API Id, find resource Id."""
-        all_resources = self.client.get_resources(restApiId=self.api_id)
-        parent_id = None
-        resource_id = None
-        for resource in all_resources['items']:
-            if resource['path'] == "/":
-                parent_id = resource['id']
-            if resource['path'] == self.trigger_settings['resource']:
-                resource_id = resource['id']
-                self.log.info("Found Resource ID for: %s", resource['path'])
+        all_resources = self.api_index.resources(self.api_id)
+        parent_id = all_resources.get('/')
+        resource_id = all_resources.get(self.trigger_settings.get('resource'))
+        if resource_id:
+            self.log.info("Found Resource ID for: %s", self.trigger_settings.get('resource'))
         return resource_id, parent_id
 
     def add_lambda_integration(self):
@@ -125,7 +183,8 @@ class APIGateway:
             principal=principal,
             env=self.env,
             region=self.region,
-            source_arn=method_api_source_arn)
+            source_arn=method_api_source_arn,
+            permissions=self.permissions)
         add_lambda_permissions(
             function=lambda_alias_arn,
             statement_id=statement_id,
@@ -133,7 +192,8 @@ class APIGateway:
             principal=principal,
             env=self.env,
             region=self.region,
-            source_arn=global_api_source_arn)
+            source_arn=global_api_source_arn,
+            permissions=self.permissions)
         add_lambda_permissions(
             function=lambda_unqualified_arn,
             statement_id=statement_id + self.trigger_settings['method'],
@@ -141,7 +201,8 @@ class APIGateway:
             principal=principal,
             env=self.env,
             region=self.region,
-            source_arn=method_api_source_arn)
+            source_arn=method_api_source_arn,
+            permissions=self.permissions)
         add_lambda_permissions(
             function=lambda_unqualified_arn,
             statement_id=statement_id,
@@ -149,7 +210,8 @@ class APIGateway:
             principal=principal,
             env=self.env,
             region=self.region,
-            source_arn=global_api_source_arn)
+            source_arn=global_api_source_arn,
+            permissions=self.permissions)
 
     @retries(max_attempts=5, wait=2, exceptions=(botocore.exceptions.ClientError))
     def create_api_deployment(self):
@@ -166,17 +228,15 @@ class APIGateway:
 
     def create_api_key(self):
         """Create API Key for API access."""
-        apikeys = self.client.get_api_keys()
-        for key in apikeys['items']:
-            if key['name'] == self.app_name:
-                self.log.info("Key %s already exists", self.app_name)
-                break
+        if self.app_name in self.api_index.api_keys():
+            self.log.info("Key %s already exists", self.app_name)
         else:
-            self.client.create_api_key(
+            created_key = self.client.create_api_key(
                 name=self.app_name, enabled=True, stageKeys=[{
                     'restApiId': self.api_id,
                     'stageName': self.env
                 }])
+            self.api_index.add_api_key(self.app_name, created_key['id'])
             self.log.info("Successfully created API Key %s. Look in the AWS console for the key", self.app_name)
 
     def _format_base_path(self, api_name):
@@ -226,8 +286,10 @@ class APIGateway:
 
     def create_api(self):
         """Create the REST API."""
-        created_api = self.client.create_rest_api(name=self.trigger_settings.get('api_name', self.app_name))
+        api_name = self.trigger_settings.get('api_name', self.app_name)
+        created_api = self.client.create_rest_api(name=api_name)
         api_id = created_api['id']
+        self.api_index.add_rest_api(api_name, api_id)
         self.log.info("Successfully created API")
         return api_id
 
@@ -243,6 +305,7 @@ class APIGateway:
             created_resource = self.client.create_resource(
                 restApiId=self.api_id, parentId=parent_id, pathPart=resource_name)
             self.resource_id = created_resource['id']
+            self.api_index.add_resource(self.api_id, self.trigger_settings.get('resource', ''), self.resource_id)
             self.log.info("Successfully created resource")
         else:
             self.log.info("Resource already exists. To update resource please delete existing resource: %s",
@@ -269,12 +332,22 @@ class APIGateway:
         except botocore.exceptions.ClientError:
             self.log.info("Method %s already exists", self.trigger_settings['method'])
 
-    def setup_lambda_api(self):
-        """A wrapper for all the steps needed to setup the integration."""
+    def setup_lambda_api(self, deploy=True):
+        """A wrapper for all the steps needed to setup the integration.
+
+        Args:
+            deploy (bool): Deploy the API now. Triggers sharing an API can
+                skip this and call :meth:`deploy_api` once afterwards.
+        """
         self.create_resource(self.parent_id)
         self.attach_method(self.resource_id)
         self.add_lambda_integration()
         self.add_permission()
+        if deploy:
+            self.deploy_api()
+
+    def deploy_api(self):
+        """Deploy the API stage, then add its API Key and base path mapping."""
         self.create_api_deployment()
         self.create_api_key()
         self.update_api_mappings()
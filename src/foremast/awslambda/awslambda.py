@@ -22,7 +22,8 @@ import boto3
 from tryagain import retries
 
 from ..exceptions import RequiredKeyNotFound
-from ..utils import get_details, get_lambda_arn, get_properties, get_role_arn, get_security_group_id, get_subnets
+from ..utils import (get_boto_client, get_boto_session, get_details, get_lambda_arn, get_properties, get_role_arn,
+                     get_security_group_id, get_subnets)
 
 LOG = logging.getLogger(__name__)
 
@@ -66,8 +67,8 @@ class LambdaFunction:
 
         self.role_arn = get_role_arn(self.role, self.env, self.region)
 
-        self.session = boto3.Session(profile_name=self.env, region_name=self.region)
-        self.lambda_client = self.session.client('lambda')
+        self.session = get_boto_session(profile=self.env, region=self.region)
+        self.lambda_client = get_boto_client('lambda', profile=self.env, region=self.region)
 
     def _check_lambda(self):
         """Check if lambda function exists.
@@ -91,15 +92,12 @@ class LambdaFunction:
             True if alias exists
             False if alias does not exist
         """
-        aliases = self.lambda_client.list_aliases(FunctionName=self.app_name)
-
         matched_alias = False
-        for alias in aliases['Aliases']:
-            if alias['Name'] == self.env:
-                LOG.info('Found alias %s for function %s', self.env, self.app_name)
-                matched_alias = True
-                break
-        else:
+        try:
+            self.lambda_client.get_alias(FunctionName=self.app_name, Name=self.env)
+            LOG.info('Found alias %s for function %s', self.env, self.app_name)
+            matched_alias = True
+        except boto3.exceptions.botocore.exceptions.ClientError:
             LOG.info('No alias %s found for function %s', self.env, self.app_name)
         return matched_alias
 
@@ -14,14 +14,23 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Create Lambda event triggers."""
-from ..utils import get_properties, remove_all_lambda_permissions
+import collections
+import concurrent.futures
+import functools
+import logging
 
-from .api_gateway_event import APIGateway
+from ..consts import LAMBDA_EVENT_WORKERS
+from ..exceptions import LambdaEventCreationFailed
+from ..utils import LambdaPermissions, get_properties
+
+from .api_gateway_event import APIGateway, APIGatewayIndex
 from .cloudwatch_event import create_cloudwatch_event
 from .cloudwatch_log_event import create_cloudwatch_log_event
 from .s3_event import create_s3_event
 from .sns_event import create_sns_event
 
+LOG = logging.getLogger(__name__)
+
 
 # pylint: disable=too-few-public-methods
 class LambdaEvent:
@@ -41,30 +50,69 @@ class LambdaEvent:
         self.region = region
         self.prop_path = prop_path
         self.properties = get_properties(properties_file=prop_path, env=env, region=region)
+        self.workers = LAMBDA_EVENT_WORKERS
 
     def create_lambda_events(self):
-        """Create all defined lambda events for an lambda application."""
+        """Create all defined lambda events for an lambda application.
 
-        # Clean up lambda permissions before creating triggers
-        remove_all_lambda_permissions(app_name=self.app_name, env=self.env, region=self.region)
+        Triggers of each type, and S3 triggers of each bucket, are created
+        in parallel with up to ``lambda_event_workers`` threads. Trigger
+        permissions already in place are kept, and only permissions no
+        longer used by any trigger are removed once every trigger succeeds.
 
-        triggers = self.properties['lambda_triggers']
+        Raises:
+            LambdaEventCreationFailed: Any trigger failed, after all others
+                were attempted.
 
-        for trigger in triggers:
+        """
+        # Looks up the function and alias ARNs once, shared by every trigger
+        permissions = LambdaPermissions(app_name=self.app_name, env=self.env, region=self.region)
 
-            if trigger['type'] == 'sns':
-                create_sns_event(app_name=self.app_name, env=self.env, region=self.region, rules=trigger)
+        tasks = self._trigger_tasks(permissions)
+        errors = {}
 
-            if trigger['type'] == 'cloudwatch-event':
-                create_cloudwatch_event(app_name=self.app_name, env=self.env, region=self.region, rules=trigger)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(self.workers, 1)) as executor:
+            futures = {executor.submit(task): name for name, task in tasks.items()}
 
-            if trigger['type'] == 'cloudwatch-logs':
-                create_cloudwatch_log_event(app_name=self.app_name, env=self.env, region=self.region, rules=trigger)
+            for future in concurrent.futures.as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as error:  # pylint: disable=broad-except
+                    LOG.error('Failed to create %s trigger for %s: %s', name, self.app_name, error)
+                    errors[name] = error
+
+        if errors:
+            raise LambdaEventCreationFailed('Lambda triggers for {0} failed in {1}: {2}'.format(
+                self.app_name, ', '.join(sorted(errors)), errors))
+
+        # Clean up lambda permissions no trigger asked for
+        permissions.remove_unused()
 
-            if trigger['type'] == 'api-gateway':
-                apigateway = APIGateway(
-                    app=self.app_name, env=self.env, region=self.region, rules=trigger, prop_path=self.prop_path)
-                apigateway.setup_lambda_api()
+    def _trigger_tasks(self, permissions):
+        """Group triggers into tasks that can run in parallel.
+
+        Triggers of the same type share AWS resources, such as an API Gateway
+        REST API, so they run in order within one task.
+
+        Args:
+            permissions (LambdaPermissions): Shared trigger permissions.
+
+        Returns:
+            dict: Callables creating triggers, by trigger type or S3 bucket.
+
+        """
+        triggers = self.properties['lambda_triggers']
+        tasks = {}
+
+        for trigger_type in ('sns', 'cloudwatch-event', 'cloudwatch-logs'):
+            type_triggers = [trigger for trigger in triggers if trigger['type'] == trigger_type]
+            if type_triggers:
+                tasks[trigger_type] = functools.partial(self._create_triggers, type_triggers, permissions)
+
+        api_triggers = [trigger for trigger in triggers if trigger['type'] == 'api-gateway']
+        if api_triggers:
+            tasks['api-gateway'] = functools.partial(self._create_api_gateway_triggers, api_triggers, permissions)
 
         # filter all triggers to isolate s3 triggers so we can operate on the entire group
         s3_triggers = [x for x in triggers if x['type'] == 's3']
@@ -79,5 +127,62 @@ class LambdaEvent:
                 bucket_triggers[bucket] = [s3_trigger]
 
         # apply relevant triggers to each respective bucket all at once.
-        for bucket, triggers in bucket_triggers.items():
-            create_s3_event(app_name=self.app_name, env=self.env, region=self.region, bucket=bucket, triggers=triggers)
+        for bucket, s3_bucket_triggers in bucket_triggers.items():
+            tasks['s3:{0}'.format(bucket)] = functools.partial(
+                create_s3_event,
+                app_name=self.app_name,
+                env=self.env,
+                region=self.region,
+                bucket=bucket,
+                triggers=s3_bucket_triggers,
+                permissions=permissions)
+
+        return tasks
+
+    def _create_triggers(self, triggers, permissions):
+        """Create SNS and CloudWatch _triggers_ in order.
+
+        Args:
+            triggers (list): Trigger settings.
+            permissions (LambdaPermissions): Shared trigger permissions.
+
+        """
+        for trigger in triggers:
+
+            if trigger['type'] == 'sns':
+                create_sns_event(
+                    app_name=self.app_name, env=self.env, region=self.region, rules=trigger, permissions=permissions)
+
+            if trigger['type'] == 'cloudwatch-event':
+                create_cloudwatch_event(
+                    app_name=self.app_name, env=self.env, region=self.region, rules=trigger, permissions=permissions)
+
+            if trigger['type'] == 'cloudwatch-logs':
+                create_cloudwatch_log_event(
+                    app_name=self.app_name, env=self.env, region=self.region, rules=trigger, permissions=permissions)
+
+    def _create_api_gateway_triggers(self, triggers, permissions):
+        """Create API Gateway _triggers_, deploying each REST API once.
+
+        Args:
+            triggers (list): Trigger settings.
+            permissions (LambdaPermissions): Shared trigger permissions.
+
+        """
+        api_index = APIGatewayIndex(env=self.env, region=self.region)
+        apis = collections.OrderedDict()
+
+        for trigger in triggers:
+            apigateway = APIGateway(
+                app=self.app_name,
+                env=self.env,
+                region=self.region,
+                rules=trigger,
+                prop_path=self.prop_path,
+                permissions=permissions,
+                api_index=api_index)
+            apigateway.setup_lambda_api(deploy=False)
+            apis.setdefault(apigateway.api_id, apigateway)
+
+        for apigateway in apis.values():
+            apigateway.deploy_api()
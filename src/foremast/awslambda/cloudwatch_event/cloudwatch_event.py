@@ -18,15 +18,13 @@
 import json
 import logging
 
-import boto3
-
 from ...exceptions import InvalidEventConfiguration
-from ...utils import add_lambda_permissions, get_env_credential, get_lambda_arn
+from ...utils import add_lambda_permissions, get_boto_client, get_env_credential, get_lambda_arn
 
 LOG = logging.getLogger(__name__)
 
 
-def create_cloudwatch_event(app_name, env, region, rules):
+def create_cloudwatch_event(app_name, env, region, rules, permissions=None):
     """Create cloudwatch event for lambda from rules.
 
     Args:
@@ -34,9 +32,10 @@ def create_cloudwatch_event(app_name, env, region, rules):
         env (str): Environment/Account for lambda function
         region (str): AWS region of the lambda function
         rules (dict): Trigger rules from the settings
+        permissions (LambdaPermissions, optional): Reconcile the trigger
+            permission with the existing policy.
     """
-    session = boto3.Session(profile_name=env, region_name=region)
-    cloudwatch_client = session.client('events')
+    cloudwatch_client = get_boto_client('events', profile=env, region=region)
 
     rule_name = rules.get('rule_name')
     schedule = rules.get('schedule')
@@ -71,7 +70,8 @@ def create_cloudwatch_event(app_name, env, region, rules):
         principal=principal,
         source_arn=source_arn,
         env=env,
-        region=region, )
+        region=region,
+        permissions=permissions)
 
     # Create Cloudwatch rule
     cloudwatch_client.put_rule(
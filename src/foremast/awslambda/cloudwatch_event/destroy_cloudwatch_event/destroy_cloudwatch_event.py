@@ -16,8 +16,7 @@
 """Destroy any DNS records."""
 import logging
 
-import boto3
-
+from ....utils import get_boto_client
 from ....utils.get_cloudwatch_event_rule import get_cloudwatch_event_rule
 
 LOG = logging.getLogger(__name__)
@@ -34,8 +33,7 @@ def destroy_cloudwatch_event(app='', env='dev', region=''):
         bool: True upon successful completion.
     """
 
-    session = boto3.Session(profile_name=env, region_name=region)
-    cloudwatch_client = session.client('events')
+    cloudwatch_client = get_boto_client('events', profile=env, region=region)
 
     event_rules = get_cloudwatch_event_rule(app_name=app, account=env, region=region)
 
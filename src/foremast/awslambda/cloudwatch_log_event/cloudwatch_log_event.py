@@ -17,15 +17,13 @@
 
 import logging
 
-import boto3
-
 from ...exceptions import InvalidEventConfiguration
-from ...utils import add_lambda_permissions, get_env_credential, get_lambda_alias_arn
+from ...utils import add_lambda_permissions, get_boto_client, get_env_credential, get_lambda_alias_arn
 
 LOG = logging.getLogger(__name__)
 
 
-def create_cloudwatch_log_event(app_name, env, region, rules):
+def create_cloudwatch_log_event(app_name, env, region, rules, permissions=None):
     """Create cloudwatch log event for lambda from rules.
 
     Args:
@@ -33,10 +31,11 @@ def create_cloudwatch_log_event(app_name, env, region, rules):
         env (str): Environment/Account for lambda function
         region (str): AWS region of the lambda function
         rules (str): Trigger rules from the settings
+        permissions (LambdaPermissions, optional): Reconcile the trigger
+            permission with the existing policy.
     """
 
-    session = boto3.Session(profile_name=env, region_name=region)
-    cloudwatch_client = session.client('logs')
+    cloudwatch_client = get_boto_client('logs', profile=env, region=region)
 
     log_group = rules.get('log_group')
     filter_name = rules.get('filter_name')
@@ -67,7 +66,8 @@ def create_cloudwatch_log_event(app_name, env, region, rules):
         principal=principal,
         source_arn=source_arn,
         env=env,
-        region=region)
+        region=region,
+        permissions=permissions)
 
     cloudwatch_client.put_subscription_filter(
         logGroupName=log_group, filterName=filter_name, filterPattern=filter_pattern, destinationArn=lambda_alias_arn)
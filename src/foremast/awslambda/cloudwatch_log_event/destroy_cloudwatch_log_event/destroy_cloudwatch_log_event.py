@@ -16,7 +16,8 @@
 """Destroy any cloudwatch log events."""
 import logging
 
-import boto3
+from ....utils import get_boto_client
+
 
 LOG = logging.getLogger(__name__)
 
@@ -32,8 +33,7 @@ def destroy_cloudwatch_log_event(app='', env='dev', region=''):
         bool: True upon successful completion.
     """
 
-    session = boto3.Session(profile_name=env, region_name=region)
-    cloudwatch_client = session.client('logs')
+    cloudwatch_client = get_boto_client('logs', profile=env, region=region)
 
     # FIXME: see below
     # TODO: Log group name is required, where do we get it if it is not in application-master-env.json?
@@ -16,9 +16,7 @@
 """Destroy S3 events."""
 import logging
 
-import boto3
-
-from ....utils import get_details
+from ....utils import get_boto_client, get_details
 
 LOG = logging.getLogger(__name__)
 
@@ -42,8 +40,7 @@ def destroy_s3_event(app, env, region):
 
     bucket = generated.s3_app_bucket()
 
-    session = boto3.Session(profile_name=env, region_name=region)
-    s3_client = session.client('s3')
+    s3_client = get_boto_client('s3', profile=env, region=region)
 
     config = {}
 
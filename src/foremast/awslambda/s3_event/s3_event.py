@@ -18,14 +18,12 @@
 import json
 import logging
 
-import boto3
-
-from ...utils import add_lambda_permissions, get_lambda_alias_arn, get_template
+from ...utils import add_lambda_permissions, get_boto_client, get_lambda_alias_arn, get_template
 
 LOG = logging.getLogger(__name__)
 
 
-def create_s3_event(app_name, env, region, bucket, triggers):
+def create_s3_event(app_name, env, region, bucket, triggers, permissions=None):
     """Create S3 lambda events from triggers
 
     Args:
@@ -33,9 +31,10 @@ def create_s3_event(app_name, env, region, bucket, triggers):
         env (str): Environment/Account for lambda function
         region (str): AWS region of the lambda function
         triggers (list): List of triggers from the settings
+        permissions (LambdaPermissions, optional): Reconcile the trigger
+            permission with the existing policy.
     """
-    session = boto3.Session(profile_name=env, region_name=region)
-    s3_client = session.client('s3')
+    s3_client = get_boto_client('s3', profile=env, region=region)
 
     lambda_alias_arn = get_lambda_alias_arn(app_name, env, region)
 
@@ -52,7 +51,8 @@ def create_s3_event(app_name, env, region, bucket, triggers):
         region=region,
         principal=principal,
         statement_id=statement_id,
-        source_arn=source_arn)
+        source_arn=source_arn,
+        permissions=permissions)
 
     # configure events on s3 bucket to trigger lambda function
     template_kwargs = {"lambda_arn": lambda_alias_arn, "triggers": triggers}
@@ -17,8 +17,9 @@
 import argparse
 import logging
 
-from ....args import add_app, add_debug, add_env
+from ....args import add_app, add_debug, add_env, add_properties, add_region
 from ....consts import LOGGING_FORMAT
+from ....utils import get_properties
 from .destroy_sns_event import destroy_sns_event
 
 
@@ -30,11 +31,22 @@ def main():
     add_debug(parser)
     add_app(parser)
     add_env(parser)
+    add_region(parser)
+    add_properties(parser)
+    parser.add_argument(
+        '--scan-all', action='store_true', help='Check every SNS subscription in the account, not only app topics')
     args = parser.parse_args()
 
     logging.getLogger(__package__.split('.')[0]).setLevel(args.debug)
 
-    assert destroy_sns_event(**vars(args))
+    properties = get_properties(properties_file=args.properties, env=args.env, region=args.region)
+
+    assert destroy_sns_event(
+        app_name=args.app,
+        env=args.env,
+        region=args.region,
+        triggers=properties.get('lambda_triggers', []),
+        scan_all=args.scan_all)
 
 
 if __name__ == '__main__':
@@ -17,28 +17,39 @@
 
 import logging
 
-import boto3
-
+from ....utils import get_boto_client, get_lambda_alias_arn, get_lambda_sns_topics
 from ....utils.get_sns_subscriptions import get_sns_subscriptions
 
 LOG = logging.getLogger(__name__)
 
 
-def destroy_sns_event(app_name, env, region):
+def destroy_sns_event(app_name, env, region, triggers=None, scan_all=False):
     """ Destroy all Lambda SNS subscriptions.
 
+    Only topics of the configured SNS _triggers_ and topics still allowed by
+    the alias policy are checked, so subscriptions left by triggers removed
+    from config are found too. With _scan_all_, every subscription in the
+    account is checked instead.
+
     Args:
         app_name (str): name of the lambda function
         env (str): Environment/Account for lambda function
         region (str): AWS region of the lambda function
+        triggers (list, optional): ``lambda_triggers`` from the app settings.
+        scan_all (bool): Check every subscription in the account.
 
     Returns:
         boolean: True if subscription destroyed successfully
     """
-    session = boto3.Session(profile_name=env, region_name=region)
-    sns_client = session.client('sns')
+    sns_client = get_boto_client('sns', profile=env, region=region)
+
+    topics = None
+    if not scan_all:
+        topics = [trigger['topic'] for trigger in triggers or () if trigger.get('type') == 'sns']
+        lambda_alias_arn = get_lambda_alias_arn(app=app_name, account=env, region=region)
+        topics.extend(get_lambda_sns_topics(lambda_alias_arn, env, region))
 
-    lambda_subscriptions = get_sns_subscriptions(app_name=app_name, env=env, region=region)
+    lambda_subscriptions = get_sns_subscriptions(app_name=app_name, env=env, region=region, topics=topics)
 
     for subscription_arn in lambda_subscriptions:
         sns_client.unsubscribe(SubscriptionArn=subscription_arn)
@@ -17,14 +17,12 @@
 
 import logging
 
-import boto3
-
-from ...utils import add_lambda_permissions, get_lambda_alias_arn, get_sns_topic_arn
+from ...utils import add_lambda_permissions, get_boto_client, get_lambda_alias_arn, get_sns_topic_arn
 
 LOG = logging.getLogger(__name__)
 
 
-def create_sns_event(app_name, env, region, rules):
+def create_sns_event(app_name, env, region, rules, permissions=None):
     """Create SNS lambda event from rules.
 
     Args:
@@ -32,9 +30,10 @@ def create_sns_event(app_name, env, region, rules):
         env (str): Environment/Account for lambda function
         region (str): AWS region of the lambda function
         rules (str): Trigger rules from the settings
+        permissions (LambdaPermissions, optional): Reconcile the trigger
+            permission with the existing policy.
     """
-    session = boto3.Session(profile_name=env, region_name=region)
-    sns_client = session.client('sns')
+    sns_client = get_boto_client('sns', profile=env, region=region)
 
     topic_name = rules.get('topic')
     lambda_alias_arn = get_lambda_alias_arn(app=app_name, account=env, region=region)
@@ -50,7 +49,8 @@ def create_sns_event(app_name, env, region, rules):
         principal=principal,
         source_arn=topic_arn,
         env=env,
-        region=region)
+        region=region,
+        permissions=permissions)
 
     sns_client.subscribe(TopicArn=topic_arn, Protocol=protocol, Endpoint=lambda_alias_arn)
     LOG.debug("SNS Lambda event created")
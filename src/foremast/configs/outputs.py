@@ -21,7 +21,7 @@ from pprint import pformat
 import gogoutils
 
 from ..consts import APP_FORMATS
-from ..utils import DeepChainMap, get_template
+from ..utils import DeepChainMap, get_template_data
 
 LOG = logging.getLogger(__name__)
 
@@ -85,13 +85,12 @@ def write_variables(app_configs=None, out_file='', git_short=''):
     for env, configs in app_configs.items():
         if env != 'pipeline':
             instance_profile = generated.iam()['profile']
-            rendered_configs = json.loads(
-                get_template(
-                    'configs/configs.json.j2',
-                    env=env,
-                    app=generated.app_name(),
-                    profile=instance_profile,
-                    formats=generated))
+            rendered_configs = get_template_data(
+                'configs/configs.json.j2',
+                env=env,
+                app=generated.app_name(),
+                profile=instance_profile,
+                formats=generated)
             json_configs[env] = dict(DeepChainMap(configs, rendered_configs))
             region_list = configs.get('regions', rendered_configs['regions'])
             json_configs[env]['regions'] = region_list  # removes regions defined in templates but not configs.
@@ -99,7 +98,7 @@ def write_variables(app_configs=None, out_file='', git_short=''):
                 region_config = json_configs[env][region]
                 json_configs[env][region] = dict(DeepChainMap(region_config, rendered_configs))
         else:
-            default_pipeline_json = json.loads(get_template('configs/pipeline.json.j2', formats=generated))
+            default_pipeline_json = get_template_data('configs/pipeline.json.j2', formats=generated)
             json_configs['pipeline'] = dict(DeepChainMap(configs, default_pipeline_json))
 
     LOG.debug('Compiled configs:\n%s', pformat(json_configs))
@@ -37,13 +37,30 @@ def process_git_configs(git_short=''):
     LOG.info('Processing application.json files from GitLab "%s".', git_short)
     file_lookup = FileLookup(git_short=git_short)
     app_configs = process_configs(file_lookup, 'runway/application-master-{env}.json', 'runway/pipeline.json')
-    commit_obj = file_lookup.project.commits.get('master')
-    config_commit = commit_obj.attributes['id']
+    config_commit = get_config_commit(file_lookup=file_lookup)
     LOG.info('Commit ID used: %s', config_commit)
     app_configs['pipeline']['config_commit'] = config_commit
     return app_configs
 
 
+def get_config_commit(git_short='', file_lookup=None):
+    """Get the commit ID of the runway configs on _master_.
+
+    Args:
+        git_short (str): Short Git representation of repository, e.g.
+            forrest/core.
+        file_lookup (FileLookup, optional): Existing lookup for _git_short_.
+
+    Returns:
+        str: Commit ID.
+    """
+    if file_lookup is None:
+        file_lookup = FileLookup(git_short=git_short)
+
+    commit_obj = file_lookup.project.commits.get('master')
+    return commit_obj.attributes['id']
+
+
 def process_runway_configs(runway_dir=''):
     """Read the _application.json_ files.
 
@@ -200,6 +200,7 @@ REGIONS = set(validate_key_values(CONFIG, 'base', 'regions', default='').split('
 ALLOWED_TYPES = set(
     validate_key_values(CONFIG, 'base', 'types', default='ec2,lambda,s3,datapipeline,rolling').split(','))
 TEMPLATES_PATH = validate_key_values(CONFIG, 'base', 'templates_path')
+TEMPLATES_CACHE_PATH = validate_key_values(CONFIG, 'base', 'templates_cache_path', default=None)
 AMI_JSON_URL = validate_key_values(CONFIG, 'base', 'ami_json_url')
 DEFAULT_RUN_AS_USER = validate_key_values(CONFIG, 'base', 'default_run_as_user', default=None)
 DEFAULT_SECURITYGROUP_RULES = _generate_security_groups('default_securitygroup_rules')
@@ -229,10 +230,28 @@ GITLAB_TOKEN = validate_key_values(CONFIG, 'credentials', 'gitlab_token')
 SLACK_TOKEN = validate_key_values(CONFIG, 'credentials', 'slack_token')
 DEFAULT_TASK_TIMEOUT = validate_key_values(CONFIG, 'task_timeouts', 'default', default=120)
 TASK_TIMEOUTS = json.loads(validate_key_values(CONFIG, 'task_timeouts', 'envs', default="{}"))
+TASK_POLL_INITIAL = float(validate_key_values(CONFIG, 'task_timeouts', 'poll_initial', default=0.5))
+TASK_POLL_MAX = float(validate_key_values(CONFIG, 'task_timeouts', 'poll_max', default=10))
 ASG_WHITELIST = set(validate_key_values(CONFIG, 'whitelists', 'asg_whitelist', default='').split(','))
 APP_FORMATS = extract_formats(CONFIG)
 GATE_CLIENT_CERT = expandvars(expanduser(validate_key_values(CONFIG, 'base', 'gate_client_cert', default='')))
 GATE_CA_BUNDLE = expandvars(expanduser(validate_key_values(CONFIG, 'base', 'gate_ca_bundle', default='')))
+GATE_POOL_SIZE = int(validate_key_values(CONFIG, 'base', 'gate_pool_size', default=10))
+GATE_RETRIES = int(validate_key_values(CONFIG, 'base', 'gate_retries', default=3))
+GATE_TIMEOUT = float(validate_key_values(CONFIG, 'base', 'gate_timeout', default=60))
+GATE_CACHE_TTL = float(validate_key_values(CONFIG, 'base', 'gate_cache_ttl', default=300))
+GATE_CACHE_FILE = expandvars(expanduser(validate_key_values(CONFIG, 'base', 'gate_cache_file', default='')))
+DNS_CACHE_TTL = float(validate_key_values(CONFIG, 'base', 'dns_cache_ttl', default=3600))
+DNS_CACHE_FILE = expandvars(expanduser(validate_key_values(CONFIG, 'base', 'dns_cache_file', default='')))
+BOTO_SHARE_LOADER = str(validate_key_values(CONFIG, 'base', 'boto_share_loader', default=False)).lower() == 'true'
+PIPELINE_WORKERS = int(validate_key_values(CONFIG, 'base', 'pipeline_workers', default=1))
+LAMBDA_EVENT_WORKERS = int(validate_key_values(CONFIG, 'base', 'lambda_event_workers', default=4))
+INFRA_WORKERS = int(validate_key_values(CONFIG, 'base', 'infra_workers', default=4))
+REBUILD_STATE_FILE = validate_key_values(CONFIG, 'base', 'rebuild_state_file', default='~/.foremast/rebuild_state.json')
+REBUILD_CHECKPOINT_FILE = validate_key_values(
+    CONFIG, 'base', 'rebuild_checkpoint_file', default='~/.foremast/rebuild_checkpoint.json')
+REBUILD_ATTEMPTS = int(validate_key_values(CONFIG, 'base', 'rebuild_attempts', default=1))
+REBUILD_RETRY_WAIT = float(validate_key_values(CONFIG, 'base', 'rebuild_retry_wait', default=10))
 LINKS = _convert_string_to_native(validate_key_values(CONFIG, 'links', 'default', default='{}'))
 
 HEADERS = {
@@ -17,11 +17,10 @@
 
 import logging
 
-import boto3
 from awscli.customizations.datapipeline import translator
 
 from ..exceptions import DataPipelineDefinitionError
-from ..utils import get_details, get_properties
+from ..utils import get_boto_client, get_details, get_properties
 
 LOG = logging.getLogger(__name__)
 
@@ -46,8 +45,7 @@ class AWSDataPipeline:
         generated = get_details(app=self.app_name)
         self.group = generated.data['project']
 
-        session = boto3.Session(profile_name=self.env, region_name=self.region)
-        self.client = session.client('datapipeline')
+        self.client = get_boto_client('datapipeline', profile=self.env, region=self.region)
         self.pipeline_id = None
 
     def create_datapipeline(self):
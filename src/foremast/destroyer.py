@@ -13,8 +13,15 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-"""Complete Application destroyer script."""
+"""Complete Application destroyer script.
+
+Resources are destroyed once for the scope they live in: DNS, IAM, and S3
+for each environment, ELB and Security Groups for each environment and
+Region. DNS records go before the ELB they point to, and the ELB before the
+Security Groups it uses. Everything else runs in parallel.
+"""
 import argparse
+import functools
 import logging
 
 from boto3.exceptions import botocore
@@ -23,14 +30,93 @@ from .args import add_app, add_debug
 from .consts import ENVS, LOGGING_FORMAT, REGIONS
 from .dns.destroy_dns.destroy_dns import destroy_dns
 from .elb.destroy_elb.destroy_elb import destroy_elb
-from .exceptions import SpinnakerError
+from .exceptions import DestroyFailed, SpinnakerError
 from .iam.destroy_iam.destroy_iam import destroy_iam
 from .s3.destroy_s3.destroy_s3 import destroy_s3
 from .securitygroup.destroy_sg.destroy_sg import destroy_sg
+from .utils.dag import Step, order_steps, run_steps
 
 LOG = logging.getLogger(__name__)
 
 
+def destroy_resource(resource, func, ignore, **kwargs):
+    """Destroy one Resource, logging expected errors instead of raising.
+
+    Args:
+        resource (str): Resource name for log messages.
+        func (callable): Destroy function to call with _kwargs_.
+        ignore (tuple): Exception types meaning nothing was left to destroy.
+
+    """
+    try:
+        func(**kwargs)
+    except ignore as error:
+        LOG.warning('%s issue for %s: %s', resource, kwargs, error)
+
+
+def destroy_plan(app, envs=None, regions=None):
+    """Build the Steps destroying every Resource of _app_.
+
+    Args:
+        app (str): Spinnaker Application name.
+        envs (list, optional): Environments to destroy in, defaults to all.
+        regions (list, optional): Regions to destroy in, defaults to all.
+
+    Returns:
+        list: :class:`~foremast.utils.dag.Step` objects in dependency order.
+
+    """
+    envs = ENVS if envs is None else envs
+    regions = REGIONS if regions is None else regions
+    client_error = botocore.exceptions.ClientError
+
+    steps = []
+    for env in envs:
+        for resource, func in (('dns', destroy_dns), ('iam', destroy_iam), ('s3', destroy_s3)):
+            name = '{0}:{1}'.format(resource, env)
+            destroy = functools.partial(destroy_resource, resource.upper(), func, client_error, app=app, env=env)
+            steps.append(Step(name, destroy))
+
+        for region in regions:
+            elb_name = 'elb:{0}:{1}'.format(env, region)
+            destroy = functools.partial(
+                destroy_resource, 'ELB', destroy_elb, SpinnakerError, app=app, env=env, region=region)
+            steps.append(Step(elb_name, destroy, depends=['dns:{0}'.format(env)]))
+
+            destroy = functools.partial(
+                destroy_resource, 'SG', destroy_sg, SpinnakerError, app=app, env=env, region=region)
+            steps.append(Step('sg:{0}:{1}'.format(env, region), destroy, depends=[elb_name]))
+
+    return order_steps(steps)
+
+
+def destroy_all(app, envs=None, regions=None, workers=4):
+    """Destroy every Resource of _app_, independent Resources in parallel.
+
+    Args:
+        app (str): Spinnaker Application name.
+        envs (list, optional): Environments to destroy in, defaults to all.
+        regions (list, optional): Regions to destroy in, defaults to all.
+        workers (int): Most Resources to destroy at the same time.
+
+    Returns:
+        list: :class:`~foremast.utils.dag.Step` objects with results.
+
+    Raises:
+        DestroyFailed: Unexpected errors destroying any Resource, raised
+            after all other Resources are done.
+
+    """
+    steps = run_steps(destroy_plan(app, envs=envs, regions=regions), workers=workers, fail_fast=False)
+
+    failed = [step for step in steps if step.status != Step.DONE]
+    if failed:
+        raise DestroyFailed('Failed to destroy: {0}'.format(', '.join(
+            '{0} ({1})'.format(step.name, step.error or step.status) for step in failed)))
+
+    return steps
+
+
 def main():  # noqa
     """Attempt to fully destroy AWS Resources for a Spinnaker Application."""
     logging.basicConfig(format=LOGGING_FORMAT)
@@ -38,6 +124,8 @@ def main():  # noqa
     parser = argparse.ArgumentParser(description=main.__doc__)
     add_debug(parser)
     add_app(parser)
+    parser.add_argument('-j', '--jobs', type=int, default=4, help='Number of Resources to destroy at the same time')
+    parser.add_argument('--dry-run', action='store_true', help='Print the destroy plan without destroying anything')
     args = parser.parse_args()
 
     if args.debug == logging.DEBUG:
@@ -45,36 +133,12 @@ def main():  # noqa
     else:
         LOG.setLevel(args.debug)
 
-    for env in ENVS:
-        for region in REGIONS:
-            LOG.info('DESTROY %s:%s', env, region)
-
-            try:
-                destroy_dns(app=args.app, env=env)
-            except botocore.exceptions.ClientError as error:
-                LOG.warning('DNS issue for %s in %s: %s', env, region, error)
-
-            try:
-                destroy_elb(app=args.app, env=env, region=region)
-            except SpinnakerError:
-                pass
-
-            try:
-                destroy_iam(app=args.app, env=env)
-            except botocore.exceptions.ClientError as error:
-                LOG.warning('IAM issue for %s in %s: %s', env, region, error)
-
-            try:
-                destroy_s3(app=args.app, env=env)
-            except botocore.exceptions.ClientError as error:
-                LOG.warning('S3 issue for %s in %s: %s', env, region, error)
-
-            try:
-                destroy_sg(app=args.app, env=env, region=region)
-            except SpinnakerError:
-                pass
+    if args.dry_run:
+        for step in destroy_plan(args.app):
+            print('{0}{1}'.format(step.name, ' (after {0})'.format(', '.join(step.depends)) if step.depends else ''))
+        return
 
-            LOG.info('Destroyed %s:%s', env, region)
+    destroy_all(args.app, workers=args.jobs)
 
     LOG.info('Destruction complete.')
 
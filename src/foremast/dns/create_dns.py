@@ -17,8 +17,8 @@
 import logging
 
 from ..consts import DOMAIN
-from ..utils import (find_elb, find_elb_dns_zone_id, get_details, get_dns_zone_ids, get_properties,
-                     update_dns_zone_record, update_failover_dns_record)
+from ..utils import (DnsChangePlan, ZoneRecordIndex, find_elb, find_elb_dns_zone_id, get_details, get_dns_zone_ids,
+                     get_properties, update_dns_zone_record, update_failover_dns_record)
 
 
 class SpinnakerDns:
@@ -78,9 +78,11 @@ class SpinnakerDns:
             'dns_ttl': self.dns_ttl,
         }
 
+        plan = DnsChangePlan(env=self.env)
         for zone_id in zone_ids:
             self.log.debug('zone_id: %s', zone_id)
-            update_dns_zone_record(self.env, zone_id, **dns_kwargs)
+            update_dns_zone_record(self.env, zone_id, plan=plan, **dns_kwargs)
+        plan.apply()
 
         return dns_elb
 
@@ -114,8 +116,11 @@ class SpinnakerDns:
             'failover_state': failover_state,
         }
 
+        record_index = ZoneRecordIndex()
+        plan = DnsChangePlan(env=self.env)
         for zone_id in zone_ids:
             self.log.debug('zone_id: %s', zone_id)
-            update_failover_dns_record(self.env, zone_id, **dns_kwargs)
+            update_failover_dns_record(self.env, zone_id, record_index=record_index, plan=plan, **dns_kwargs)
+        plan.apply()
 
         return dns_record
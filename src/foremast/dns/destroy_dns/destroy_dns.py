@@ -17,9 +17,7 @@
 import json
 import logging
 
-import boto3
-
-from ...utils import get_details, get_dns_zone_ids, get_template
+from ...utils import get_boto_client, get_details, get_dns_zone_ids, get_template_data
 
 LOG = logging.getLogger(__name__)
 
@@ -35,7 +33,7 @@ def destroy_dns(app='', env='dev', **_):
     Returns:
         bool: True upon successful completion.
     """
-    client = boto3.Session(profile_name=env).client('route53')
+    client = get_boto_client('route53', profile=env)
 
     generated = get_details(app=app, env=env)
     record = generated.dns_elb()
@@ -76,8 +74,7 @@ def destroy_record(client=None, found_record=None, record='', zone_id=''):
     LOG.debug('Found DNS record: %s', found_record)
 
     if found_record['Name'].strip('.') == record:
-        dns_json = get_template(template_file='destroy/destroy_dns.json.j2', record=json.dumps(found_record))
-        dns_dict = json.loads(dns_json)
+        dns_dict = get_template_data(template_file='destroy/destroy_dns.json.j2', record=json.dumps(found_record))
 
         client.change_resource_record_sets(HostedZoneId=zone_id, ChangeBatch=dns_dict)
         LOG.info('Destroyed "%s" in %s', found_record['Name'], zone_id)
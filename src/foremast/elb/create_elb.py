@@ -18,16 +18,29 @@ import json
 import logging
 from pprint import pformat
 
-import boto3
-
 from ..consts import DEFAULT_ELB_SECURITYGROUPS
-from ..utils import get_properties, get_subnets, get_template, get_vpc_id, remove_duplicate_sg, wait_for_task
+from ..utils import (get_boto_client, get_properties, get_subnets, get_template, get_vpc_id, remove_duplicate_sg,
+                     wait_for_task)
 from .format_listeners import format_listeners
 from .splay_health import splay_health
 
 LOG = logging.getLogger(__name__)
 
 
+def load_elb_data(json_data):
+    """Decode ELB upsert Task when given as JSON text.
+
+    Args:
+        json_data (dict, str): ELB upsert Task.
+
+    Returns:
+        dict: ELB upsert Task.
+    """
+    if isinstance(json_data, str):
+        return json.loads(json_data)
+    return json_data
+
+
 class SpinnakerELB:
     """Create ELBs for Spinnaker.
 
@@ -121,19 +134,19 @@ class SpinnakerELB:
 
         wait_for_task(json_data)
 
-        self.add_listener_policy(json_data)
-        self.add_backend_policy(json_data)
+        elb_data = load_elb_data(json_data)
+        self.add_listener_policy(elb_data)
+        self.add_backend_policy(elb_data)
 
-        self.configure_attributes(json_data)
+        self.configure_attributes(elb_data)
 
     def add_listener_policy(self, json_data):
         """Attaches listerner policies to an ELB
 
         Args:
-            json_data (json): return data from ELB upsert
+            json_data (dict, str): return data from ELB upsert
         """
-        env = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        elbclient = env.client('elb')
+        elbclient = get_boto_client('elb', profile=self.env, region=self.region)
 
         # create stickiness policy if set in configs
         stickiness = {}
@@ -147,7 +160,7 @@ class SpinnakerELB:
                     break
 
         # Attach policies to created ELB
-        for job in json.loads(json_data)['job']:
+        for job in load_elb_data(json_data)['job']:
             for listener in job['listeners']:
                 policies = []
                 ext_port = listener['externalPort']
@@ -164,13 +177,12 @@ class SpinnakerELB:
         """Attaches backend server policies to an ELB
 
         Args:
-            json_data (json): return data from ELB upsert
+            json_data (dict, str): return data from ELB upsert
         """
-        env = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        elbclient = env.client('elb')
+        elbclient = get_boto_client('elb', profile=self.env, region=self.region)
 
         # Attach backend server policies to created ELB
-        for job in json.loads(json_data)['job']:
+        for job in load_elb_data(json_data)['job']:
             for listener in job['listeners']:
                 instance_port = listener['internalPort']
                 backend_policy_list = listener['backendPolicies']
@@ -191,8 +203,7 @@ class SpinnakerELB:
                 }
         """
         stickiness_dict = {}
-        env = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        elbclient = env.client('elb')
+        elbclient = get_boto_client('elb', profile=self.env, region=self.region)
         elb_settings = self.properties['elb']
         for listener in elb_settings.get('ports'):
             if listener.get("stickiness"):
@@ -221,17 +232,16 @@ class SpinnakerELB:
         """Configure load balancer attributes such as idle timeout, connection draining, etc
 
         Args:
-            json_data (json): return data from ELB upsert
+            json_data (dict, str): return data from ELB upsert
         """
-        env = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        elbclient = env.client('elb')
+        elbclient = get_boto_client('elb', profile=self.env, region=self.region)
 
         elb_settings = self.properties['elb']
         LOG.debug('Block ELB Settings Pre Configure Load Balancer Attributes:\n%s', pformat(elb_settings))
 
         # FIXME: Determine why 'job' is not being used
         # pylint: disable=unused-variable
-        for job in json.loads(json_data)['job']:
+        for job in load_elb_data(json_data)['job']:
             load_balancer_attributes = {
                 'CrossZoneLoadBalancing': {
                     'Enabled': True
@@ -14,11 +14,10 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Add the appropriate ELB Listeners."""
-import json
 import logging
 
 from ..exceptions import ForemastTemplateNotFound
-from ..utils import get_env_credential, get_template
+from ..utils import get_env_credential, get_template_data
 
 LOG = logging.getLogger(__name__)
 
@@ -179,8 +178,7 @@ def generate_custom_cert_name(env='', region='', account='', certificate=None):
 
     # TODO: Investigate moving this to a remote API, then fallback to local file if unable to connect
     try:
-        rendered_template = get_template(template_file='infrastructure/iam/tlscert_naming.json.j2', **template_kwargs)
-        tlscert_dict = json.loads(rendered_template)
+        tlscert_dict = get_template_data(template_file='infrastructure/iam/tlscert_naming.json.j2', **template_kwargs)
     except ForemastTemplateNotFound:
         LOG.info('Unable to find TLS Cert Template...falling back to default logic...')
         return cert_name
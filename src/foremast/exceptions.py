@@ -161,6 +161,10 @@ class LambdaAliasDoesNotExist(ForemastError):
     """Lambda function was not found."""
 
 
+class LambdaEventCreationFailed(ForemastError):
+    """One or more Lambda event triggers failed to be created."""
+
+
 class RequiredKeyNotFound(ForemastError):
     """Required key in json config not found."""
 
@@ -179,3 +183,11 @@ class S3SharedBucketNotFound(ForemastError):
 
 class DataPipelineDefinitionError(ForemastError):
     """Error Creating Data Pipeline."""
+
+
+class DestroyFailed(ForemastError):
+    """One or more Application Resources failed to be destroyed."""
+
+
+class InfrastructureStepFailed(ForemastError):
+    """A step preparing Application infrastructure failed."""
@@ -31,7 +31,7 @@ Examples:
 import json
 import logging
 
-from ..utils import get_env_credential, get_template
+from ..utils import get_env_credential, get_template, get_template_data
 
 LOG = logging.getLogger(__name__)
 
@@ -86,7 +86,7 @@ def render_policy_template(  # pylint: disable=too-many-arguments
     """
     statements = []
 
-    rendered_service_policy = get_template(
+    rendered_service_policy = get_template_data(
         'infrastructure/iam/{0}.json.j2'.format(service),
         account_number=account_number,
         app=app,
@@ -96,12 +96,10 @@ def render_policy_template(  # pylint: disable=too-many-arguments
         items=items,
         settings=pipeline_settings)
 
-    try:
-        statement_block = json.loads(rendered_service_policy)
-        statements.append(statement_block)
-    except ValueError:
-        LOG.debug('Need to make %s template into list.', service)
-        statements = json.loads('[{0}]'.format(rendered_service_policy))
+    if isinstance(rendered_service_policy, list):
+        statements.extend(rendered_service_policy)
+    else:
+        statements.append(rendered_service_policy)
 
     LOG.debug('Rendered IAM Policy statements: %s', statements)
 
@@ -17,9 +17,7 @@
 import collections
 import logging
 
-import boto3
-
-from ...utils import get_details
+from ...utils import get_boto_client, get_details
 from ..resource_action import resource_action
 
 LOG = logging.getLogger(__name__)
@@ -35,8 +33,7 @@ def destroy_iam(app='', env='dev', **_):
     Returns:
         True upon successful completion.
     """
-    session = boto3.Session(profile_name=env)
-    client = session.client('iam')
+    client = get_boto_client('iam', profile=env)
 
     generated = get_details(env=env, app=app)
     generated_iam = generated.iam()
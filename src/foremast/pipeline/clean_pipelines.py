@@ -19,9 +19,9 @@ import logging
 import murl
 import requests
 
-from ..consts import API_URL, GATE_CA_BUNDLE, GATE_CLIENT_CERT
+from ..consts import API_URL
 from ..exceptions import SpinnakerPipelineCreationFailed, SpinnakerPipelineDeletionFailed
-from ..utils import check_managed_pipeline, get_all_pipelines, normalize_pipeline_name
+from ..utils import check_managed_pipeline, gate_request, get_all_pipelines, normalize_pipeline_name
 
 LOG = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ def delete_pipeline(app='', pipeline_name=''):
     LOG.warning('Deleting Pipeline: %s', safe_pipeline_name)
 
     url.path = 'pipelines/{app}/{pipeline}'.format(app=app, pipeline=safe_pipeline_name)
-    response = requests.delete(url.url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+    response = gate_request('delete', url.url)
 
     if not response.ok:
         LOG.debug('Delete response code: %d', response.status_code)
@@ -49,7 +49,7 @@ def delete_pipeline(app='', pipeline_name=''):
     return response.text
 
 
-def clean_pipelines(app='', settings=None):
+def clean_pipelines(app='', settings=None, pipelines=None):
     """Delete Pipelines for regions not defined in application.json files.
 
     For Pipelines named **app_name [region]**, _region_ will need to appear
@@ -59,6 +59,8 @@ def clean_pipelines(app='', settings=None):
     Args:
         app (str): Application name
         settings (dict): imported configuration settings
+        pipelines (PipelineIndex, optional): Snapshot of existing Pipelines,
+            fetched from Gate when not given.
 
     Returns:
         True: Upon successful completion.
@@ -67,7 +69,8 @@ def clean_pipelines(app='', settings=None):
         SpinnakerPipelineCreationFailed: Missing application.json file from
         `create-configs`.
     """
-    pipelines = get_all_pipelines(app=app)
+    if pipelines is None:
+        pipelines = get_all_pipelines(app=app)
     envs = settings['pipeline']['env']
 
     LOG.debug('Find Regions in: %s', envs)
@@ -21,7 +21,7 @@ import logging
 from pprint import pformat
 
 from ..consts import ASG_WHITELIST, DEFAULT_EC2_SECURITYGROUPS, EC2_PIPELINE_TYPES
-from ..utils import generate_encoded_user_data, get_template, remove_duplicate_sg
+from ..utils import generate_encoded_user_data, get_template_data, remove_duplicate_sg
 
 LOG = logging.getLogger(__name__)
 
@@ -126,7 +126,7 @@ def construct_pipeline_block(env='',
             {'us-west-2': ['us-west-2a', 'us-west-2b', 'us-west-2c']}.
 
     Returns:
-        dict: Pipeline JSON template rendered with configurations.
+        list: Pipeline Stages rendered with configurations.
 
     """
     LOG.info('%s block for [%s].', env, region)
@@ -162,8 +162,8 @@ def construct_pipeline_block(env='',
     LOG.debug('Block data:\n%s', pformat(data))
 
     template_name = get_template_name(env, pipeline_type)
-    pipeline_json = get_template(template_file=template_name, data=data, formats=generated, **kwargs)
-    return pipeline_json
+    pipeline_block = get_template_data(template_file=template_name, data=data, formats=generated, **kwargs)
+    return pipeline_block
 
 
 def ec2_pipeline_setup(
@@ -18,7 +18,7 @@ import copy
 import logging
 from pprint import pformat
 
-from ..utils import get_template
+from ..utils import get_template_data
 
 LOG = logging.getLogger(__name__)
 
@@ -43,7 +43,7 @@ def construct_datapipeline(env='',
         settings (dict): Environment settings from configurations.
 
     Returns:
-        dict: Pipeline JSON template rendered with configurations.
+        list: Pipeline Stages rendered with configurations.
     """
     LOG.info('%s block for [%s].', env, region)
 
@@ -71,5 +71,5 @@ def construct_datapipeline(env='',
 
     LOG.debug('Block data:\n%s', pformat(data))
 
-    pipeline_json = get_template(template_file=template_name, data=data, formats=generated)
-    return pipeline_json
+    pipeline_block = get_template_data(template_file=template_name, data=data, formats=generated)
+    return pipeline_block
@@ -20,7 +20,7 @@ import logging
 from pprint import pformat
 
 from ..consts import DEFAULT_EC2_SECURITYGROUPS
-from ..utils import generate_encoded_user_data, get_template, remove_duplicate_sg
+from ..utils import generate_encoded_user_data, get_template_data, remove_duplicate_sg
 
 LOG = logging.getLogger(__name__)
 
@@ -48,7 +48,7 @@ def construct_pipeline_block_lambda(env='',
             {'us-west-2': ['us-west-2a', 'us-west-2b', 'us-west-2c']}.
 
     Returns:
-        dict: Pipeline JSON template rendered with configurations.
+        list: Pipeline Stages rendered with configurations.
 
     """
     LOG.info('%s block for [%s].', env, region)
@@ -95,5 +95,5 @@ def construct_pipeline_block_lambda(env='',
 
     LOG.debug('Block data:\n%s', pformat(data))
 
-    pipeline_json = get_template(template_file=template_name, data=data, formats=generated)
-    return pipeline_json
+    pipeline_block = get_template_data(template_file=template_name, data=data, formats=generated)
+    return pipeline_block
@@ -15,16 +15,18 @@
 #   limitations under the License.
 """Create Pipelines for Spinnaker."""
 import collections
+import concurrent.futures
+import copy
 import json
 import logging
 import os
+import threading
 from pprint import pformat
 
-import requests
-
-from ..consts import API_URL, DEFAULT_RUN_AS_USER, EC2_PIPELINE_TYPES, GATE_CA_BUNDLE, GATE_CLIENT_CERT
+from ..consts import API_URL, DEFAULT_RUN_AS_USER, EC2_PIPELINE_TYPES, PIPELINE_WORKERS
 from ..exceptions import SpinnakerPipelineCreationFailed
-from ..utils import ami_lookup, generate_packer_filename, get_details, get_properties, get_subnets, get_template
+from ..utils import (ami_lookup, gate_request, generate_packer_filename, get_details, get_pipeline_index,
+                     get_properties, get_subnet_index, get_template_data, pipeline_digest)
 from .clean_pipelines import clean_pipelines
 from .construct_pipeline_block import construct_pipeline_block
 from .renumerate_stages import renumerate_stages
@@ -57,26 +59,41 @@ class SpinnakerPipeline:
 
         self.settings = get_properties(prop_path)
         self.environments = self.settings['pipeline']['env']
+        self.workers = PIPELINE_WORKERS
+        self.existing_pipelines = None
+        self.existing_pipelines_lock = threading.Lock()
+        self.skipped_pipelines = 0
 
     def post_pipeline(self, pipeline):
         """Send Pipeline JSON to Spinnaker.
 
+        Pipelines matching the config Spinnaker already has are skipped.
+
         Args:
             pipeline (json): json of the pipeline to be created in Spinnaker
+
+        Returns:
+            bool: True when posted, False when unchanged.
         """
         url = "{0}/pipelines".format(API_URL)
 
         if isinstance(pipeline, str):
             pipeline_json = pipeline
+            pipeline_dict = json.loads(pipeline_json)
         else:
             pipeline_json = json.dumps(pipeline)
+            pipeline_dict = pipeline
 
-        pipeline_dict = json.loads(pipeline_json)
+        if self.is_unchanged(pipeline_dict):
+            self.log.info('Pipeline "%s" unchanged in application "%s", skipping.', pipeline_dict['name'],
+                          pipeline_dict['application'])
+            with self.existing_pipelines_lock:
+                self.skipped_pipelines += 1
+            return False
 
         self.log.debug('Pipeline JSON:\n%s', pipeline_json)
 
-        pipeline_response = requests.post(
-            url, data=pipeline_json, headers=self.header, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+        pipeline_response = gate_request('post', url, data=pipeline_json, headers=self.header)
 
         self.log.debug('Pipeline creation response:\n%s', pipeline_response.text)
 
@@ -86,14 +103,35 @@ class SpinnakerPipeline:
 
         self.log.info('Successfully created "%s" pipeline in application "%s".', pipeline_dict['name'],
                       pipeline_dict['application'])
+        return True
+
+    def is_unchanged(self, pipeline):
+        """Check _pipeline_ matches the config already stored in Spinnaker.
+
+        Args:
+            pipeline (dict): Rendered Pipeline.
+
+        Returns:
+            bool: True when posting would not change anything.
+        """
+        if pipeline.get('application') != self.app_name:
+            return False
 
-    def render_wrapper(self, region='us-east-1'):
+        existing = self.get_existing_pipelines().get_config(pipeline)
+        if not existing:
+            return False
+
+        return pipeline_digest(pipeline) == pipeline_digest(existing)
+
+    def render_wrapper(self, region='us-east-1', generated=None):
         """Generate the base Pipeline wrapper.
 
         This renders the non-repeatable stages in a pipeline, like jenkins, baking, tagging and notifications.
 
         Args:
             region (str): AWS Region.
+            generated (gogoutils.Generator, optional): Name formats for the
+                Region being rendered, defaults to _self.generated_.
 
         Returns:
             dict: Rendered Pipeline wrapper.
@@ -138,22 +176,29 @@ class SpinnakerPipeline:
 
         self.log.debug('Wrapper app data:\n%s', pformat(data))
 
-        wrapper = get_template(template_file='pipeline/pipeline_wrapper.json.j2', data=data, formats=self.generated)
+        if generated is None:
+            generated = self.generated
+
+        wrapper = get_template_data(
+            template_file='pipeline/pipeline_wrapper.json.j2', data=data, formats=generated)
 
-        return json.loads(wrapper)
+        return wrapper
 
     def get_existing_pipelines(self):
         """Get existing pipeline configs for specific application.
 
+        Pipelines are fetched from Gate once and the same snapshot is shared
+        by every Region, and with :func:`clean_pipelines`.
+
         Returns:
-            str: Pipeline config json
+            PipelineIndex: Indexed Pipeline configs.
 
         """
-        url = "{0}/applications/{1}/pipelineConfigs".format(API_URL, self.app_name)
-        resp = requests.get(url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
-        assert resp.ok, 'Failed to lookup pipelines for {0}: {1}'.format(self.app_name, resp.text)
+        with self.existing_pipelines_lock:
+            if self.existing_pipelines is None:
+                self.existing_pipelines = get_pipeline_index(app=self.app_name)
 
-        return resp.json()
+        return self.existing_pipelines
 
     def compare_with_existing(self, region='us-east-1', onetime=False):
         """Compare desired pipeline with existing pipelines.
@@ -167,25 +212,16 @@ class SpinnakerPipeline:
 
         """
         pipelines = self.get_existing_pipelines()
-        pipeline_id = None
-        found = False
-        for pipeline in pipelines:
-            correct_app_and_region = (pipeline['application'] == self.app_name) and (region in pipeline['name'])
-            if onetime:
-                onetime_str = "(onetime-{})".format(self.environments[0])
-                if correct_app_and_region and onetime_str in pipeline['name']:
-                    found = True
-            elif correct_app_and_region:
-                found = True
-
-            if found:
-                self.log.info('Existing pipeline found - %s', pipeline['name'])
-                pipeline_id = pipeline['id']
-                break
-        else:
+
+        onetime_env = self.environments[0] if onetime else None
+        pipeline = pipelines.find(self.app_name, region, onetime_env=onetime_env)
+
+        if not pipeline:
             self.log.info('No existing pipeline found')
+            return None
 
-        return pipeline_id
+        self.log.info('Existing pipeline found - %s', pipeline['name'])
+        return pipeline['id']
 
     def create_pipeline(self):
         """Main wrapper for pipeline creation.
@@ -194,8 +230,11 @@ class SpinnakerPipeline:
         3. gets all subnets for template rendering
         4. Renders all of the pipeline blocks as defined in configs
         5. Runs post_pipeline to create pipeline
+
+        Regions are rendered and posted in parallel when _self.workers_ is
+        more than 1, raising once every Region has finished.
         """
-        clean_pipelines(app=self.app_name, settings=self.settings)
+        clean_pipelines(app=self.app_name, settings=self.settings, pipelines=self.get_existing_pipelines())
 
         pipeline_envs = self.environments
         self.log.debug('Envs from pipeline.json: %s', pipeline_envs)
@@ -206,51 +245,111 @@ class SpinnakerPipeline:
                 regions_envs[region].append(env)
         self.log.info('Environments and Regions for Pipelines:\n%s', json.dumps(regions_envs, indent=4))
 
-        subnets = None
-        pipelines = {}
-        for region, envs in regions_envs.items():
-            self.generated.data.update({
-                'region': region,
-            })
+        subnet_index = None
+        if self.settings['pipeline']['type'] in EC2_PIPELINE_TYPES:
+            subnet_index = get_subnet_index()
 
-            # TODO: Overrides for an environment no longer makes sense. Need to
-            # provide override for entire Region possibly.
-            pipelines[region] = self.render_wrapper(region=region)
-
-            previous_env = None
-            for env in envs:
-                self.generated.data.update({
-                    'env': env,
-                })
-
-                pipeline_block_data = {
-                    "env": env,
-                    "generated": self.generated,
-                    "previous_env": previous_env,
-                    "region": region,
-                    "settings": self.settings[env][region],
-                    "pipeline_data": self.settings['pipeline'],
-                }
-
-                if self.settings['pipeline']['type'] in EC2_PIPELINE_TYPES:
-                    if not subnets:
-                        subnets = get_subnets()
-                    try:
-                        region_subnets = {region: subnets[env][region]}
-                    except KeyError:
-                        self.log.info('%s is not available for %s.', env, region)
-                        continue
-                    pipeline_block_data['region_subnets'] = region_subnets
-
-                block = construct_pipeline_block(**pipeline_block_data)
-                pipelines[region]['stages'].extend(json.loads(block))
-                previous_env = env
-
-        self.log.debug('Assembled Pipelines:\n%s', pformat(pipelines))
-
-        for region, pipeline in pipelines.items():
-            renumerate_stages(pipeline)
-
-            self.post_pipeline(pipeline)
+        if self.workers > 1:
+            errors = self.create_pipelines_concurrently(regions_envs, subnet_index=subnet_index)
+            if errors:
+                raise SpinnakerPipelineCreationFailed('Pipelines for {0} failed in {1}: {2}'.format(
+                    self.app_name, ', '.join(sorted(errors)), errors))
+        else:
+            for region, envs in regions_envs.items():
+                self.create_region_pipeline(region, envs, generated=self.generated, subnet_index=subnet_index)
 
+        self.log.info('Skipped %d unchanged Pipelines.', self.skipped_pipelines)
         return True
+
+    def create_pipelines_concurrently(self, regions_envs, subnet_index=None):
+        """Render and post each Region Pipeline in parallel.
+
+        Each Region gets its own copy of _self.generated_ so the Region and
+        Environment being rendered do not leak between workers.
+
+        Args:
+            regions_envs (dict): Environments to deploy to, by Region.
+            subnet_index (SubnetIndex): Subnets for EC2 Pipelines.
+
+        Returns:
+            dict: Exceptions raised, by Region.
+
+        """
+        errors = {}
+        self.log.info('Creating Pipelines for %d Regions with %d workers.', len(regions_envs), self.workers)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {}
+            for region, envs in regions_envs.items():
+                generated = copy.copy(self.generated)
+                generated.data = dict(self.generated.data)
+
+                future = executor.submit(
+                    self.create_region_pipeline, region, envs, generated=generated, subnet_index=subnet_index)
+                futures[future] = region
+
+            for future in concurrent.futures.as_completed(futures):
+                region = futures[future]
+                try:
+                    future.result()
+                except Exception as error:  # pylint: disable=broad-except
+                    self.log.error('Failed to create Pipeline for %s: %s', region, error)
+                    errors[region] = error
+
+        return errors
+
+    def create_region_pipeline(self, region, envs, generated=None, subnet_index=None):
+        """Render and post the Pipeline for a single Region.
+
+        Args:
+            region (str): AWS Region.
+            envs (list): Environments to deploy to, in order.
+            generated (gogoutils.Generator): Name formats to update with the
+                Region and Environment being rendered.
+            subnet_index (SubnetIndex): Subnets for EC2 Pipelines.
+
+        Returns:
+            dict: Pipeline posted to Spinnaker.
+
+        """
+        generated.data.update({
+            'region': region,
+        })
+
+        # TODO: Overrides for an environment no longer makes sense. Need to
+        # provide override for entire Region possibly.
+        pipeline = self.render_wrapper(region=region, generated=generated)
+
+        previous_env = None
+        for env in envs:
+            generated.data.update({
+                'env': env,
+            })
+
+            pipeline_block_data = {
+                "env": env,
+                "generated": generated,
+                "previous_env": previous_env,
+                "region": region,
+                "settings": self.settings[env][region],
+                "pipeline_data": self.settings['pipeline'],
+            }
+
+            if subnet_index:
+                try:
+                    region_subnets = {region: subnet_index.azs(env, region)}
+                except KeyError:
+                    self.log.info('%s is not available for %s.', env, region)
+                    continue
+                pipeline_block_data['region_subnets'] = region_subnets
+
+            block = construct_pipeline_block(**pipeline_block_data)
+            pipeline['stages'].extend(block)
+            previous_env = env
+
+        self.log.debug('Assembled Pipeline for %s:\n%s', region, pformat(pipeline))
+
+        renumerate_stages(pipeline)
+        self.post_pipeline(pipeline)
+
+        return pipeline
@@ -18,7 +18,7 @@ import collections
 import json
 from pprint import pformat
 
-from ..utils import get_template
+from ..utils import get_template_data
 from ..consts import DEFAULT_RUN_AS_USER
 from .clean_pipelines import clean_pipelines
 from .construct_pipeline_block_datapipeline import construct_datapipeline
@@ -72,9 +72,10 @@ class SpinnakerPipelineDataPipeline(SpinnakerPipeline):
 
         self.log.debug('Wrapper app data:\n%s', pformat(data))
 
-        wrapper = get_template(template_file='pipeline/pipeline_wrapper.json.j2', data=data, formats=self.generated)
+        wrapper = get_template_data(
+            template_file='pipeline/pipeline_wrapper.json.j2', data=data, formats=self.generated)
 
-        return json.loads(wrapper)
+        return wrapper
 
     def create_pipeline(self):
         """Main wrapper for pipeline creation.
@@ -83,7 +84,7 @@ class SpinnakerPipelineDataPipeline(SpinnakerPipeline):
         3. Renders all of the pipeline blocks as defined in configs
         4. Runs post_pipeline to create pipeline
         """
-        clean_pipelines(app=self.app_name, settings=self.settings)
+        clean_pipelines(app=self.app_name, settings=self.settings, pipelines=self.get_existing_pipelines())
 
         pipeline_envs = self.environments
         self.log.debug('Envs from pipeline.json: %s', pipeline_envs)
@@ -110,7 +111,7 @@ class SpinnakerPipelineDataPipeline(SpinnakerPipeline):
                     region=region,
                     settings=self.settings[env][region],
                     pipeline_data=self.settings['pipeline'])
-                pipelines[region]['stages'].extend(json.loads(block))
+                pipelines[region]['stages'].extend(block)
 
                 previous_env = env
 
@@ -121,4 +122,5 @@ class SpinnakerPipelineDataPipeline(SpinnakerPipeline):
 
             self.post_pipeline(pipeline)
 
+        self.log.info('Skipped %d unchanged Pipelines.', self.skipped_pipelines)
         return True
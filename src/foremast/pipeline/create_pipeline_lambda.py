@@ -18,7 +18,7 @@ import collections
 import json
 from pprint import pformat
 
-from ..utils import get_subnets, get_template
+from ..utils import get_subnet_index, get_template_data
 from ..consts import DEFAULT_RUN_AS_USER
 from .clean_pipelines import clean_pipelines
 from .construct_pipeline_block_lambda import construct_pipeline_block_lambda
@@ -75,9 +75,10 @@ class SpinnakerPipelineLambda(SpinnakerPipeline):
 
         self.log.debug('Wrapper app data:\n%s', pformat(data))
 
-        wrapper = get_template(template_file='pipeline/pipeline_wrapper.json.j2', data=data, formats=self.generated)
+        wrapper = get_template_data(
+            template_file='pipeline/pipeline_wrapper.json.j2', data=data, formats=self.generated)
 
-        return json.loads(wrapper)
+        return wrapper
 
     def create_pipeline(self):
         """Main wrapper for pipeline creation.
@@ -87,7 +88,7 @@ class SpinnakerPipelineLambda(SpinnakerPipeline):
         4. Renders all of the pipeline blocks as defined in configs
         5. Runs post_pipeline to create pipeline
         """
-        clean_pipelines(app=self.app_name, settings=self.settings)
+        clean_pipelines(app=self.app_name, settings=self.settings, pipelines=self.get_existing_pipelines())
 
         pipeline_envs = self.environments
         self.log.debug('Envs from pipeline.json: %s', pipeline_envs)
@@ -98,7 +99,7 @@ class SpinnakerPipelineLambda(SpinnakerPipeline):
                 regions_envs[region].append(env)
         self.log.info('Environments and Regions for Pipelines:\n%s', json.dumps(regions_envs, indent=4))
 
-        subnets = get_subnets()
+        subnet_index = get_subnet_index()
 
         pipelines = {}
         for region, envs in regions_envs.items():
@@ -109,7 +110,7 @@ class SpinnakerPipelineLambda(SpinnakerPipeline):
             previous_env = None
             for env in envs:
                 try:
-                    region_subnets = {region: subnets[env][region]}
+                    region_subnets = {region: subnet_index.azs(env, region)}
                 except KeyError:
                     self.log.info('%s is not available for %s.', env, region)
                     continue
@@ -122,7 +123,7 @@ class SpinnakerPipelineLambda(SpinnakerPipeline):
                     region_subnets=region_subnets,
                     settings=self.settings[env][region],
                     pipeline_data=self.settings['pipeline'])
-                pipelines[region]['stages'].extend(json.loads(block))
+                pipelines[region]['stages'].extend(block)
 
                 previous_env = env
 
@@ -133,4 +134,5 @@ class SpinnakerPipelineLambda(SpinnakerPipeline):
 
             self.post_pipeline(pipeline)
 
+        self.log.info('Skipped %d unchanged Pipelines.', self.skipped_pipelines)
         return True
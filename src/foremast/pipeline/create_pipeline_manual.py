@@ -35,8 +35,14 @@ class SpinnakerPipelineManual(SpinnakerPipeline):
             json_dict.setdefault('application', self.app_name)
             json_dict.setdefault('name', normalize_pipeline_name(name=json_file))
 
-            json_dict.setdefault('id', get_pipeline_id(app=json_dict['application'], name=json_dict['name']))
+            pipeline_index = None
+            if json_dict['application'] == self.app_name:
+                pipeline_index = self.get_existing_pipelines()
+
+            json_dict.setdefault(
+                'id', get_pipeline_id(app=json_dict['application'], name=json_dict['name'], pipelines=pipeline_index))
 
             self.post_pipeline(json_dict)
 
+        self.log.info('Skipped %d unchanged Pipelines.', self.skipped_pipelines)
         return True
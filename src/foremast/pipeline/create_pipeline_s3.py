@@ -18,7 +18,7 @@ import collections
 import json
 from pprint import pformat
 
-from ..utils import get_template
+from ..utils import get_template_data
 from ..consts import DEFAULT_RUN_AS_USER
 from .clean_pipelines import clean_pipelines
 from .construct_pipeline_block_s3 import construct_pipeline_block_s3
@@ -75,9 +75,10 @@ class SpinnakerPipelineS3(SpinnakerPipeline):
 
         self.log.debug('Wrapper app data:\n%s', pformat(data))
 
-        wrapper = get_template(template_file='pipeline/pipeline_wrapper.json.j2', data=data, formats=self.generated)
+        wrapper = get_template_data(
+            template_file='pipeline/pipeline_wrapper.json.j2', data=data, formats=self.generated)
 
-        return json.loads(wrapper)
+        return wrapper
 
     def create_pipeline(self):
         """Main wrapper for pipeline creation.
@@ -86,7 +87,7 @@ class SpinnakerPipelineS3(SpinnakerPipeline):
         3. Renders all of the pipeline blocks as defined in configs
         4. Runs post_pipeline to create pipeline
         """
-        clean_pipelines(app=self.app_name, settings=self.settings)
+        clean_pipelines(app=self.app_name, settings=self.settings, pipelines=self.get_existing_pipelines())
 
         pipeline_envs = self.environments
         self.log.debug('Envs from pipeline.json: %s', pipeline_envs)
@@ -113,7 +114,7 @@ class SpinnakerPipelineS3(SpinnakerPipeline):
                     region=region,
                     settings=self.settings[env][region],
                     pipeline_data=self.settings['pipeline'])
-                pipelines[region]['stages'].extend(json.loads(block))
+                pipelines[region]['stages'].extend(block)
 
                 previous_env = env
 
@@ -124,4 +125,5 @@ class SpinnakerPipelineS3(SpinnakerPipeline):
 
             self.post_pipeline(pipeline)
 
+        self.log.info('Skipped %d unchanged Pipelines.', self.skipped_pipelines)
         return True
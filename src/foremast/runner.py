@@ -27,31 +27,47 @@ Read environment variables from Jenkins:
 Then run specific prepare jobs.
 """
 import argparse
+import concurrent.futures
+import json
 import logging
 import os
+import tempfile
 
 import gogoutils
+import requests
+import tryagain
+from boto3.exceptions import botocore
 
 from foremast import (app, autoscaling_policy, awslambda, configs, consts, datapipeline, dns, elb, iam, pipeline, s3,
                       securitygroup, slacknotify, utils)
 
 from .args import add_debug
+from .exceptions import InfrastructureStepFailed, SpinnakerTimeout
+from .version import get_version
 
 LOG = logging.getLogger(__name__)
 
+REBUILD_RETRY_ERRORS = (requests.exceptions.RequestException, botocore.exceptions.ClientError, SpinnakerTimeout)
+
 
 class ForemastRunner:
-    """Wrap each pipes module in a way that is easy to invoke."""
+    """Wrap each pipes module in a way that is easy to invoke.
+
+    Args:
+        group (str): Git project, overrides $PROJECT.
+        repo (str): Git repository, overrides $GIT_REPO.
+        work_dir (str): Directory to write generated property files to.
+    """
 
-    def __init__(self):
+    def __init__(self, group=None, repo=None, work_dir='.'):
         """Setup the Runner for all Foremast modules."""
         debug_flag()
 
         self.email = os.getenv("EMAIL")
         self.env = os.getenv("ENV")
-        self.group = os.getenv("PROJECT")
+        self.group = group or os.getenv("PROJECT")
         self.region = os.getenv("REGION")
-        self.repo = os.getenv("GIT_REPO")
+        self.repo = repo or os.getenv("GIT_REPO")
         self.runway_dir = os.getenv("RUNWAY_DIR")
         self.artifact_path = os.getenv("ARTIFACT_PATH")
         self.artifact_version = os.getenv("ARTIFACT_VERSION")
@@ -65,7 +81,7 @@ class ForemastRunner:
         self.trigger_job = generated.jenkins()['name']
         self.git_short = generated.gitlab()['main']
 
-        self.raw_path = "./raw.properties"
+        self.raw_path = os.path.join(work_dir, "raw.properties")
         self.json_path = self.raw_path + ".json"
         self.configs = None
 
@@ -247,39 +263,83 @@ class ForemastRunner:
         os.remove(self.raw_path)
 
 
-def prepare_infrastructure():
-    """Entry point for preparing the infrastructure in a specific env."""
-    runner = ForemastRunner()
+def infrastructure_steps(runner):
+    """Declare the steps preparing infrastructure for _runner_.
 
-    runner.write_configs()
-    runner.create_app()
+    IAM, Archaius, and the Security Group do not depend on each other and
+    run alongside the Spinnaker Application. The ELB waits for the Security
+    Group, DNS for the ELB, and the Slack notification for everything else.
 
+    Args:
+        runner (ForemastRunner): Runner with configs already written.
+
+    Returns:
+        list: :class:`~foremast.utils.dag.Step` objects.
+    """
     archaius = runner.configs[runner.env]['app']['archaius_enabled']
     eureka = runner.configs[runner.env]['app']['eureka_enabled']
     deploy_type = runner.configs['pipeline']['type']
 
+    steps = [utils.Step('app', runner.create_app)]
+
     if deploy_type not in ['s3', 'datapipeline']:
-        runner.create_iam()
+        steps.append(utils.Step('iam', runner.create_iam))
         # TODO: Refactor Archaius to be fully featured
         if archaius:
-            runner.create_archaius()
-        runner.create_secgroups()
+            steps.append(utils.Step('archaius', runner.create_archaius))
+        steps.append(utils.Step('secgroups', runner.create_secgroups, depends=['app']))
 
     if eureka:
         LOG.info("Eureka Enabled, skipping ELB and DNS setup")
     elif deploy_type == "lambda":
         LOG.info("Lambda Enabled, skipping ELB and DNS setup")
-        runner.create_awslambda()
+        steps.append(utils.Step('awslambda', runner.create_awslambda, depends=['app', 'iam', 'secgroups']))
     elif deploy_type == "s3":
-        runner.create_s3app()
+        steps.append(utils.Step('s3app', runner.create_s3app, depends=['app']))
     elif deploy_type == 'datapipeline':
-        runner.create_datapipeline()
+        steps.append(utils.Step('datapipeline', runner.create_datapipeline, depends=['app']))
     else:
         LOG.info("No Eureka, running ELB and DNS setup")
-        runner.create_elb()
-        runner.create_dns()
+        steps.append(utils.Step('elb', runner.create_elb, depends=['app', 'secgroups']))
+        steps.append(utils.Step('dns', runner.create_dns, depends=['elb']))
+
+    steps.append(utils.Step('slack', runner.slack_notify, depends=[step.name for step in steps]))
+    return steps
+
+
+def prepare_infrastructure(*args):
+    """Entry point for preparing the infrastructure in a specific env.
+
+    Raises:
+        InfrastructureStepFailed: A step failed, with its error as the cause.
+    """
+    only = None
+    skip = None
+    jobs = consts.INFRA_WORKERS
+
+    if args:
+        LOG.debug('Incoming arguments: %s', args)
+        command_args, *_ = args
+        only = command_args.parsed.only
+        skip = command_args.parsed.skip
+        jobs = command_args.parsed.jobs
+
+    runner = ForemastRunner()
+    runner.write_configs()
+
+    try:
+        steps = utils.select_steps(infrastructure_steps(runner), only=only, skip=skip)
+    except ValueError as error:
+        LOG.fatal(error)
+        raise SystemExit('Error: {0}'.format(error))
+
+    LOG.info('Running steps %s with %d jobs.', ', '.join(step.name for step in steps), jobs)
+    try:
+        utils.run_steps(steps, workers=jobs)
+    except Exception as error:
+        failed = [step.name for step in steps if step.status == utils.Step.FAILED]
+        raise InfrastructureStepFailed('Step {0} failed: {1}'.format(', '.join(failed), error)) from error
 
-    runner.slack_notify()
     runner.cleanup()
 
 
@@ -308,6 +368,119 @@ def create_scaling_policy():
     runner.cleanup()
 
 
+def rebuild_app(project='', repo='', state=None, force=False):
+    """Rebuild Pipelines for a single application.
+
+    Generated property files are kept in a temporary directory, so many
+    applications can be rebuilt at the same time. With _state_, applications
+    whose runway config commit, templates, and Foremast version are the same
+    as their last rebuild are skipped.
+
+    Args:
+        project (str): Git project of application.
+        repo (str): Git repository of application.
+        state (RebuildState, optional): Last rebuild of each application.
+        force (bool): Rebuild even when nothing changed.
+
+    Returns:
+        bool: True when rebuilt, False when skipped as unchanged.
+    """
+    with tempfile.TemporaryDirectory(prefix='foremast-rebuild-') as work_dir:
+        runner = ForemastRunner(group=project, repo=repo, work_dir=work_dir)
+
+        fingerprint = None
+        if state is not None and not runner.runway_dir:
+            fingerprint = {
+                'config_commit': configs.get_config_commit(git_short=runner.git_short),
+                'templates': utils.get_templates_digest(),
+                'version': get_version(),
+            }
+
+            if not force and state.is_current(runner.app, fingerprint):
+                LOG.info('No changes for %s since last rebuild, skipping.', runner.app)
+                return False
+
+        runner.write_configs()
+        runner.create_pipeline()
+
+    if fingerprint:
+        state.record(runner.app, fingerprint)
+
+    return True
+
+
+def rebuild_app_with_retries(project='', repo='', attempts=1, retry_wait=0, checkpoint=None, **kwargs):
+    """Rebuild an application, retrying failures and saving progress.
+
+    Only errors in _REBUILD_RETRY_ERRORS_, from talking to Gate or AWS, are
+    retried. Other errors, such as bad configs or templates, fail at once.
+
+    Args:
+        project (str): Git project of application.
+        repo (str): Git repository of application.
+        attempts (int): Most attempts to make.
+        retry_wait (float): Seconds to wait before the first retry, doubling
+            for each retry after.
+        checkpoint (RebuildCheckpoint, optional): Progress to update once
+            the application is done or has failed.
+        kwargs: Passed to :func:`rebuild_app`.
+
+    Returns:
+        bool: True when rebuilt, False when skipped as unchanged.
+    """
+    app_name = '{}/{}'.format(project, repo)
+    tries = 0
+
+    def attempt():
+        nonlocal tries
+        tries += 1
+        return rebuild_app(project=project, repo=repo, **kwargs)
+
+    def log_retry():
+        LOG.info('Retrying rebuild of %s, attempt %d of %d.', app_name, tries + 1, attempts)
+
+    try:
+        rebuilt = tryagain.call(
+            attempt,
+            max_attempts=max(attempts, 1),
+            exceptions=REBUILD_RETRY_ERRORS,
+            wait=lambda attempt_number: retry_wait * 2**(attempt_number - 1),
+            pre_retry_hook=log_retry)
+    except Exception as error:
+        if checkpoint:
+            checkpoint.mark(app_name, checkpoint.FAILED, error=error, attempts=tries)
+        raise
+
+    if checkpoint:
+        checkpoint.mark(app_name, checkpoint.DONE, attempts=tries)
+
+    return rebuilt
+
+
+def app_weight(app):
+    """Estimate relative rebuild cost of _app_ from its Spinnaker accounts."""
+    accounts = [account for account in app.get('accounts', '').split(',') if account]
+    return max(len(accounts), 1)
+
+
+def shard_path(path, shard=None):
+    """Give each shard of a rebuild its own copy of the file at _path_.
+
+    Args:
+        path (str): File shared by unsharded rebuilds.
+        shard (tuple, optional): Shard index and count.
+
+    Returns:
+        str: _path_ with the shard added before the extension, e.g.
+        ``rebuild_checkpoint.shard-0-of-4.json``.
+    """
+    if not shard:
+        return path
+
+    root, ext = os.path.splitext(path)
+    return '{0}.shard-{1}-of-{2}{3}'.format(root, shard[0], shard[1], ext)
+
+
 def rebuild_pipelines(*args):
     """Entry point for rebuilding pipelines.
 
@@ -315,12 +488,39 @@ def rebuild_pipelines(*args):
     """
     rebuild_all = False
     rebuild_project = os.getenv("REBUILD_PROJECT")
+    jobs = 1
+    shard = None
+    weighted = False
+    results_file = None
+    state = None
+    force = False
+    checkpoint = None
+    attempts = consts.REBUILD_ATTEMPTS
+    retry_wait = consts.REBUILD_RETRY_WAIT
 
     if args:
         LOG.debug('Incoming arguments: %s', args)
         command_args, *_ = args
         rebuild_all = command_args.parsed.all
         rebuild_project = command_args.parsed.project
+        jobs = command_args.parsed.jobs
+        shard = command_args.parsed.shard
+        weighted = command_args.parsed.weighted
+        results_file = command_args.parsed.results
+        force = command_args.parsed.force
+
+        attempts = command_args.parsed.attempts
+        retry_wait = command_args.parsed.retry_wait
+
+        if command_args.parsed.incremental:
+            state = utils.RebuildState(command_args.parsed.state_file)
+
+        checkpoint_path = command_args.parsed.checkpoint
+        if command_args.parsed.resume and not checkpoint_path:
+            checkpoint_path = shard_path(consts.REBUILD_CHECKPOINT_FILE, shard)
+
+        if checkpoint_path:
+            checkpoint = utils.RebuildCheckpoint(checkpoint_path, resume=command_args.parsed.resume)
 
     if rebuild_project == 'ALL':
         rebuild_all = True
@@ -336,23 +536,155 @@ def rebuild_pipelines(*args):
 
     all_apps = utils.get_all_apps()
 
+    selected_apps = []
     for apps in all_apps:
         if 'repoProjectKey' not in apps:
             LOG.info('Skipping %s. No project key found', apps['name'])
             continue
 
-        app_name = '{}/{}'.format(apps['repoProjectKey'], apps['repoSlug'])
         if apps['repoProjectKey'].lower() == rebuild_project.lower() or rebuild_all:
-            os.environ["PROJECT"] = apps['repoProjectKey']
-            os.environ["GIT_REPO"] = apps['repoSlug']
+            selected_apps.append(apps)
+
+    if shard:
+        shard_index, shard_count = shard
+        selected_apps = utils.select_shard(
+            selected_apps,
+            shard_index,
+            shard_count,
+            key=lambda apps: '{}/{}'.format(apps['repoProjectKey'], apps['repoSlug']),
+            weight=app_weight if weighted else None)
+        LOG.info('Shard %d/%d has %d applications.', shard_index, shard_count, len(selected_apps))
+
+    rebuild_apps = [(apps['repoProjectKey'], apps['repoSlug']) for apps in selected_apps]
+
+    if checkpoint:
+        remaining = checkpoint.remaining(['{}/{}'.format(project, repo) for project, repo in rebuild_apps])
+        LOG.info('%d of %d applications left to rebuild.', len(remaining), len(rebuild_apps))
+        rebuild_apps = [(project, repo) for project, repo in rebuild_apps if '{}/{}'.format(project, repo) in remaining]
+
+    succeeded = []
+    skipped = []
+    failed = {}
+
+    LOG.info('Rebuilding %d applications with %d jobs.', len(rebuild_apps), jobs)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(jobs, 1)) as executor:
+        futures = {}
+        for project, repo in rebuild_apps:
+            app_name = '{}/{}'.format(project, repo)
             LOG.info('Rebuilding pipelines for %s', app_name)
-            runner = ForemastRunner()
+            future = executor.submit(
+                rebuild_app_with_retries,
+                project=project,
+                repo=repo,
+                attempts=attempts,
+                retry_wait=retry_wait,
+                checkpoint=checkpoint,
+                state=state,
+                force=force)
+            futures[future] = app_name
+
+        for future in concurrent.futures.as_completed(futures):
+            app_name = futures[future]
             try:
-                runner.write_configs()
-                runner.create_pipeline()
-                runner.cleanup()
-            except Exception:  # pylint: disable=broad-except
-                LOG.warning('Error updating pipeline for %s', app_name)
+                rebuilt = future.result()
+            except Exception as error:  # pylint: disable=broad-except
+                LOG.warning('Error updating pipeline for %s: %s', app_name, error)
+                failed[app_name] = error
+            else:
+                if rebuilt:
+                    succeeded.append(app_name)
+                else:
+                    skipped.append(app_name)
+
+    LOG.info('Rebuilt %d applications, %d unchanged, %d failed.', len(succeeded), len(skipped), len(failed))
+    for app_name in sorted(failed):
+        LOG.error('Failed to rebuild %s: %s', app_name, failed[app_name])
+
+    if results_file:
+        write_rebuild_results(results_file, succeeded=succeeded, failed=failed, shard=shard, skipped=skipped)
+
+    return succeeded, failed, skipped
+
+
+def write_rebuild_results(results_file, succeeded=(), failed=None, shard=None, skipped=()):
+    """Write rebuild results as JSON for :func:`rebuild_report` to merge.
+
+    Args:
+        results_file (str): Path of JSON file to write.
+        succeeded (list): Rebuilt application names.
+        failed (dict): Exceptions for applications that failed.
+        shard (tuple, optional): Shard index and count rebuilt.
+        skipped (list): Unchanged application names.
+    """
+    results = {
+        'shard': list(shard) if shard else None,
+        'skipped': sorted(skipped),
+        'succeeded': sorted(succeeded),
+        'failed': {app_name: str(error) for app_name, error in (failed or {}).items()},
+    }
+
+    with open(results_file, 'wt') as results_handle:
+        json.dump(results, results_handle, indent=4, sort_keys=True)
+
+    LOG.info('Wrote rebuild results to %s.', results_file)
+
+
+def merge_rebuild_results(results_files):
+    """Combine rebuild result files from each shard.
+
+    Args:
+        results_files (list): Paths of JSON files from
+            :func:`write_rebuild_results`.
+
+    Returns:
+        dict: Combined report with _succeeded_, _skipped_, _failed_, and any
+        _missing_shards_ when not every shard reported.
+    """
+    report = {'succeeded': [], 'skipped': [], 'failed': {}, 'shards': [], 'missing_shards': []}
+    shard_counts = set()
+
+    for results_file in results_files:
+        with open(results_file, 'rt') as results_handle:
+            results = json.load(results_handle)
+
+        report['succeeded'].extend(results['succeeded'])
+        report['skipped'].extend(results.get('skipped', []))
+        report['failed'].update(results['failed'])
+
+        if results.get('shard'):
+            shard_index, shard_count = results['shard']
+            report['shards'].append(shard_index)
+            shard_counts.add(shard_count)
+
+    report['succeeded'].sort()
+    report['skipped'].sort()
+    report['shards'].sort()
+
+    for shard_count in shard_counts:
+        report['missing_shards'].extend(
+            shard_index for shard_index in range(shard_count) if shard_index not in report['shards'])
+
+    return report
+
+
+def rebuild_report(*args):
+    """Merge rebuild result files from sharded runs into one report."""
+    command_args, *_ = args
+    report = merge_rebuild_results(command_args.parsed.results)
+
+    LOG.info('Rebuilt %d applications, %d unchanged, %d failed.', len(report['succeeded']), len(report['skipped']),
+             len(report['failed']))
+    if report['missing_shards']:
+        LOG.warning('No results for shards: %s', report['missing_shards'])
+
+    report_json = json.dumps(report, indent=4, sort_keys=True)
+    if command_args.parsed.output:
+        with open(command_args.parsed.output, 'wt') as report_handle:
+            report_handle.write(report_json)
+    else:
+        print(report_json)
+
+    return report
 
 
 def deploy_s3app():
@@ -18,7 +18,7 @@ import logging
 
 import boto3
 
-from ..utils import get_details
+from ..utils import get_boto_resource, get_details
 
 LOG = logging.getLogger(__name__)
 
@@ -37,8 +37,7 @@ def init_properties(env='dev', app='unnecessary', **_):
         True when application.properties was found.
         False when application.properties needed to be created.
     """
-    aws_env = boto3.session.Session(profile_name=env)
-    s3client = aws_env.resource('s3')
+    s3client = get_boto_resource('s3', profile=env)
 
     generated = get_details(app=app, env=env)
     archaius = generated.archaius()
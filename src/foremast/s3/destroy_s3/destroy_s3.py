@@ -16,9 +16,7 @@
 """Destroy any S3 Resources."""
 import logging
 
-import boto3
-
-from ...utils import get_details
+from ...utils import get_boto_resource, get_details
 
 LOG = logging.getLogger(__name__)
 
@@ -33,8 +31,7 @@ def destroy_s3(app='', env='dev', **_):
     Returns:
         boolean: True if destroyed sucessfully
     """
-    session = boto3.Session(profile_name=env)
-    client = session.resource('s3')
+    client = get_boto_resource('s3', profile=env)
 
     generated = get_details(app=app, env=env)
     archaius = generated.archaius()
@@ -17,11 +17,11 @@
 import json
 import logging
 
-import boto3
 from botocore.client import ClientError
 
 from ..exceptions import S3SharedBucketNotFound
-from ..utils import generate_s3_tags, get_details, get_dns_zone_ids, get_properties, update_dns_zone_record
+from ..utils import (DnsChangePlan, generate_s3_tags, get_boto_client, get_details, get_dns_zone_ids,
+                     get_properties, update_dns_zone_record)
 
 LOG = logging.getLogger(__name__)
 
@@ -43,8 +43,7 @@ class S3Apps:
         self.app_name = app
         self.env = env
         self.region = region
-        boto_sess = boto3.session.Session(profile_name=env)
-        self.s3client = boto_sess.client('s3')
+        self.s3client = get_boto_client('s3', profile=env)
         self.generated = get_details(app=app, env=env, region=self.region)
         self.properties = get_properties(prop_path, env=self.env, region=self.region)
         self.s3props = self.properties['s3']
@@ -146,9 +145,11 @@ class S3Apps:
             'dns_ttl': self.properties['dns']['ttl']
         }
 
+        plan = DnsChangePlan(env=self.env)
         for zone_id in zone_ids:
             LOG.debug('zone_id: %s', zone_id)
-            update_dns_zone_record(self.env, zone_id, **dns_kwargs)
+            update_dns_zone_record(self.env, zone_id, plan=plan, **dns_kwargs)
+        plan.apply()
         LOG.info("Created DNS %s for Bucket", self.bucket)
 
     def _put_bucket_cors(self):
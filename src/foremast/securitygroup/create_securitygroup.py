@@ -43,14 +43,14 @@ import ipaddress
 import logging
 from contextlib import suppress
 
-import boto3
 from boto3.exceptions import botocore
 from deepmerge import conservative_merger
 
 from ..consts import DEFAULT_SECURITYGROUP_RULES
 from ..exceptions import (ForemastConfigurationFileError, SpinnakerSecurityGroupCreationFailed,
                           SpinnakerSecurityGroupError)
-from ..utils import get_details, get_properties, get_security_group_id, get_template, get_vpc_id, wait_for_task
+from ..utils import (get_boto_client, get_boto_resource, get_details, get_properties, get_security_group_id,
+                     get_template, get_vpc_id, wait_for_task)
 
 
 class SpinnakerSecurityGroup:
@@ -124,8 +124,7 @@ class SpinnakerSecurityGroup:
         Returns:
             True: Upon successful completion.
         """
-        session = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        resource = session.resource('ec2')
+        resource = get_boto_resource('ec2', profile=self.env, region=self.region)
         group_id = get_security_group_id(self.app_name, self.env, self.region)
         security_group = resource.SecurityGroup(group_id)
 
@@ -158,8 +157,7 @@ class SpinnakerSecurityGroup:
             SpinnakerSecurityGroupError: boto3 call failed to add CIDR block to
                 Security Group.
         """
-        session = boto3.session.Session(profile_name=self.env, region_name=self.region)
-        client = session.client('ec2')
+        client = get_boto_client('ec2', profile=self.env, region=self.region)
 
         group_id = get_security_group_id(self.app_name, self.env, self.region)
 
@@ -35,6 +35,10 @@ from .templates import *
 from .warn_user import *
 from .get_cloudwatch_event_rule import get_cloudwatch_event_rule
 from .awslambda import *
-from .get_sns_subscriptions import get_sns_subscriptions
-from .get_sns_topic_arn import get_sns_topic_arn
+from .get_sns_subscriptions import get_lambda_sns_topics, get_sns_subscriptions
+from .get_sns_topic_arn import SNS_TOPIC_CACHE, get_sns_topic_arn, get_sns_topic_index
 from .roles import *
+from .shards import *
+from .rebuild_state import *
+from .boto_clients import *
+from .dag import *
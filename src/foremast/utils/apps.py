@@ -18,10 +18,10 @@ import logging
 
 import gogoutils
 import murl
-import requests
 
-from ..consts import API_URL, APP_FORMATS, GATE_CA_BUNDLE, GATE_CLIENT_CERT
+from ..consts import API_URL, APP_FORMATS
 from ..exceptions import SpinnakerAppNotFound
+from .gate import GATE_CACHE, gate_request
 
 LOG = logging.getLogger(__name__)
 
@@ -36,14 +36,19 @@ def get_all_apps():
     LOG.info('Retreiving list of all Spinnaker applications')
     url = murl.Url(API_URL)
     url.path = 'applications'
-    response = requests.get(url.url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
 
-    assert response.ok, 'Could not retrieve application list'
+    def load_apps():
+        response = gate_request(uri=url.url)
 
-    pipelines = response.json()
+        assert response.ok, 'Could not retrieve application list'
+
+        return response.json()
+
+    pipelines = GATE_CACHE.get(url.url, load_apps)
     LOG.debug('All Applications:\n%s', pipelines)
 
-    return pipelines
+    # Copy so callers changing the list do not change the cached value
+    return list(pipelines)
 
 
 def get_details(app='groupproject', env='dev', region='us-east-1'):
@@ -61,7 +66,7 @@ def get_details(app='groupproject', env='dev', region='us-east-1'):
     api = murl.Url(API_URL)
     api.path = 'applications/{app}'.format(app=app)
 
-    request = requests.get(api.url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+    request = gate_request(uri=api.url)
 
     if not request.ok:
         raise SpinnakerAppNotFound('"{0}" not found.'.format(app))
@@ -16,18 +16,31 @@
 """Lambda related utilities."""
 import json
 import logging
+import threading
 
 import boto3
 
 from ..exceptions import LambdaAliasDoesNotExist, LambdaFunctionDoesNotExist
+from .boto_clients import get_boto_client
+from .cache import TTLCache
 
 LOG = logging.getLogger(__name__)
 FOREMAST_PREFIX = "foremast-"
 
+LAMBDA_ARN_CACHE = TTLCache(ttl=3600)
+
+
+def is_not_found(error):
+    """Check a boto3 _error_ means the Lambda resource does not exist."""
+    return error.response.get('Error', {}).get('Code') == 'ResourceNotFoundException'
+
 
 def get_lambda_arn(app, account, region):
     """Get lambda ARN.
 
+    The function is looked up by name with ``get_function`` and its ARN kept
+    in :data:`LAMBDA_ARN_CACHE` for the rest of the run.
+
     Args:
         account (str): AWS account name.
         region (str): Region name, e.g. us-east-1
@@ -36,33 +49,37 @@ def get_lambda_arn(app, account, region):
     Returns:
         str: ARN for requested lambda function
 
+    Raises:
+        LambdaFunctionDoesNotExist: Function _app_ not found.
+
     """
-    session = boto3.Session(profile_name=account, region_name=region)
-    lambda_client = session.client('lambda')
 
-    lambda_arn = None
-    paginator = lambda_client.get_paginator('list_functions')
+    def load_arn():
+        """Look up function ARN from Lambda."""
+        lambda_client = get_boto_client('lambda', profile=account, region=region)
 
-    for lambda_functions in paginator.paginate():
-        for lambda_function in lambda_functions['Functions']:
-            if lambda_function['FunctionName'] == app:
-                lambda_arn = lambda_function['FunctionArn']
-                LOG.debug("Lambda ARN for lambda function %s is %s.", app, lambda_arn)
-                break
-        if lambda_arn:
-            break
+        try:
+            lambda_function = lambda_client.get_function(FunctionName=app)
+        except boto3.exceptions.botocore.exceptions.ClientError as error:
+            if not is_not_found(error):
+                raise
+            LOG.fatal('Lambda function with name %s not found in %s %s', app, account, region)
+            raise LambdaFunctionDoesNotExist(
+                'Lambda function with name {0} not found in {1} {2}'.format(app, account, region))
 
-    if not lambda_arn:
-        LOG.fatal('Lambda function with name %s not found in %s %s', app, account, region)
-        raise LambdaFunctionDoesNotExist(
-            'Lambda function with name {0} not found in {1} {2}'.format(app, account, region))
+        lambda_arn = lambda_function['Configuration']['FunctionArn']
+        LOG.debug("Lambda ARN for lambda function %s is %s.", app, lambda_arn)
+        return lambda_arn
 
-    return lambda_arn
+    return LAMBDA_ARN_CACHE.get('function:{0}:{1}:{2}'.format(account, region, app), load_arn)
 
 
 def get_lambda_alias_arn(app, account, region):
     """Get lambda alias ARN. Assumes that account name is equal to alias name.
 
+    The alias is looked up by name with ``get_alias`` and its ARN kept in
+    :data:`LAMBDA_ARN_CACHE` for the rest of the run.
+
     Args:
         account (str): AWS account name.
         region (str): Region name, e.g. us-east-1
@@ -71,24 +88,28 @@ def get_lambda_alias_arn(app, account, region):
     Returns:
         str: ARN for requested lambda alias
 
+    Raises:
+        LambdaAliasDoesNotExist: Alias _account_ of function _app_ not found.
+
     """
-    session = boto3.Session(profile_name=account, region_name=region)
-    lambda_client = session.client('lambda')
-
-    lambda_aliases = lambda_client.list_aliases(FunctionName=app)
-
-    matched_alias = None
-    for alias in lambda_aliases['Aliases']:
-        if alias['Name'] == account:
-            lambda_alias_arn = alias['AliasArn']
-            LOG.info('Found ARN for alias %s for function %s', account, app)
-            matched_alias = lambda_alias_arn
-            break
-    else:
-        fatal_message = 'Lambda alias {0} of function {1} not found'.format(account, app)
-        LOG.fatal(fatal_message)
-        raise LambdaAliasDoesNotExist(fatal_message)
-    return matched_alias
+
+    def load_arn():
+        """Look up alias ARN from Lambda."""
+        lambda_client = get_boto_client('lambda', profile=account, region=region)
+
+        try:
+            alias = lambda_client.get_alias(FunctionName=app, Name=account)
+        except boto3.exceptions.botocore.exceptions.ClientError as error:
+            if not is_not_found(error):
+                raise
+            fatal_message = 'Lambda alias {0} of function {1} not found'.format(account, app)
+            LOG.fatal(fatal_message)
+            raise LambdaAliasDoesNotExist(fatal_message)
+
+        LOG.info('Found ARN for alias %s for function %s', account, app)
+        return alias['AliasArn']
+
+    return LAMBDA_ARN_CACHE.get('alias:{0}:{1}:{2}'.format(account, region, app), load_arn)
 
 
 def add_lambda_permissions(function='',
@@ -97,7 +118,8 @@ def add_lambda_permissions(function='',
                            principal='',
                            source_arn='',
                            env='',
-                           region='us-east-1'):
+                           region='us-east-1',
+                           permissions=None):
     """Add permission to Lambda for the event trigger.
 
     Args:
@@ -108,9 +130,16 @@ def add_lambda_permissions(function='',
         source_arn (str): ARN of the source of the event. Only needed for S3
         env (str): Environment/account of function
         region (str): AWS region of function
+        permissions (LambdaPermissions, optional): Reconcile with the
+            existing policy, only adding the permission when missing or
+            changed.
     """
-    session = boto3.Session(profile_name=env, region_name=region)
-    lambda_client = session.client('lambda')
+    if permissions is not None:
+        permissions.add(
+            function=function, statement_id=statement_id, action=action, principal=principal, source_arn=source_arn)
+        return
+
+    lambda_client = get_boto_client('lambda', profile=env, region=region)
     response_action = None
     prefixed_sid = FOREMAST_PREFIX + statement_id
 
@@ -135,6 +164,156 @@ def add_lambda_permissions(function='',
     LOG.info(response_action)
 
 
+def statement_matches(statement, action='lambda:InvokeFunction', principal='', source_arn=''):
+    """Check an existing policy _statement_ grants the same permission.
+
+    Args:
+        statement (dict): Statement from a Lambda function policy.
+        action (str): Lambda action to allow.
+        principal (str): AWS service or account ID allowed.
+        source_arn (str): ARN of the source of the event.
+
+    Returns:
+        bool: True when _statement_ does not need replacing.
+
+    """
+    principals = statement.get('Principal', {})
+    if isinstance(principals, dict):
+        principals = list(principals.values())
+    else:
+        principals = [principals]
+
+    principal_matches = any(
+        value == principal or value == 'arn:aws:iam::{0}:root'.format(principal) for value in principals)
+    current_source = statement.get('Condition', {}).get('ArnLike', {}).get('AWS:SourceArn', '')
+
+    return statement.get('Action') == action and principal_matches and current_source == (source_arn or '')
+
+
+class LambdaPermissions:
+    """Reconcile Foremast managed permissions of a Lambda function and alias.
+
+    Existing policies are read once. Requested permissions already in place
+    are left alone, changed ones are replaced, and :meth:`remove_unused`
+    drops managed statements nobody requested, so triggers keep working
+    during a deploy.
+
+    Args:
+        app_name (str): Application name
+        env (str): AWS environment
+        region (str): AWS region
+    """
+
+    def __init__(self, app_name='', env='', region='us-east-1'):
+        self.lambda_client = get_boto_client('lambda', profile=env, region=region)
+        self.prefixes = (FOREMAST_PREFIX, app_name + '_')
+        self.lock = threading.Lock()
+        self.desired = set()
+        self.policies = {}
+
+        for arn in (get_lambda_arn(app_name, env, region), get_lambda_alias_arn(app_name, env, region)):
+            self._policy(arn)
+
+    def _policy(self, function):
+        """Get managed statements of _function_ by Sid, reading the policy once."""
+        if function not in self.policies:
+            try:
+                response = self.lambda_client.get_policy(FunctionName=function)
+                statements = json.loads(response['Policy'])['Statement']
+                LOG.debug("Found Policy: %s", response)
+            except boto3.exceptions.botocore.exceptions.ClientError as error:
+                LOG.info("No policy exists for function %s", function)
+                LOG.debug(error)
+                statements = []
+
+            self.policies[function] = {}
+            for statement in statements:
+                if statement['Sid'].startswith(self.prefixes):
+                    self.policies[function][statement['Sid']] = statement
+                else:
+                    LOG.info('Skipping permission %s - Not managed by Foremast', statement['Sid'])
+
+        return self.policies[function]
+
+    def add(self, function='', statement_id='', action='lambda:InvokeFunction', principal='', source_arn=''):
+        """Make sure _function_ has the permission, adding or replacing it when needed.
+
+        Args:
+            function (str): Lambda function name or ARN
+            statement_id (str): IAM policy statement (principal) id, without
+                the Foremast prefix
+            action (str): Lambda action to allow
+            principal (str): AWS principal to add permissions
+            source_arn (str): ARN of the source of the event
+
+        """
+        prefixed_sid = FOREMAST_PREFIX + statement_id
+
+        with self.lock:
+            self.desired.add((function, prefixed_sid))
+            current = self._policy(function).get(prefixed_sid)
+
+            if current and statement_matches(current, action=action, principal=principal, source_arn=source_arn):
+                LOG.info('Permission with Sid %s unchanged', prefixed_sid)
+                return
+
+            if current:
+                LOG.info('Replacing changed permission with Sid %s', prefixed_sid)
+                self.lambda_client.remove_permission(FunctionName=function, StatementId=prefixed_sid)
+
+            add_permissions_kwargs = {
+                'FunctionName': function,
+                'StatementId': prefixed_sid,
+                'Action': action,
+                'Principal': principal,
+            }
+            if source_arn:
+                add_permissions_kwargs['SourceArn'] = source_arn
+
+            try:
+                self.lambda_client.add_permission(**add_permissions_kwargs)
+            except boto3.exceptions.botocore.exceptions.ClientError as error:
+                LOG.info('Did not add permissions with Sid: %s', prefixed_sid)
+                LOG.debug('Add permission error: %s', error)
+                return
+
+            LOG.info('Add permission with Sid: %s', prefixed_sid)
+            self._policy(function)[prefixed_sid] = {
+                'Sid': prefixed_sid,
+                'Action': action,
+                'Principal': {
+                    'Service': principal
+                },
+                'Condition': {
+                    'ArnLike': {
+                        'AWS:SourceArn': source_arn
+                    }
+                } if source_arn else {},
+            }
+
+    def remove_unused(self):
+        """Remove managed permissions not requested with :meth:`add`.
+
+        Returns:
+            list: Removed (function, Sid) pairs.
+
+        """
+        removed = []
+
+        with self.lock:
+            for function, statements in self.policies.items():
+                for sid in list(statements):
+                    if (function, sid) in self.desired:
+                        continue
+
+                    self.lambda_client.remove_permission(FunctionName=function, StatementId=sid)
+                    del statements[sid]
+                    removed.append((function, sid))
+                    LOG.info('removed permission: %s', sid)
+
+        return removed
+
+
 def remove_all_lambda_permissions(app_name='', env='', region='us-east-1'):
     """Remove all foremast-* permissions from lambda.
 
@@ -143,8 +322,7 @@ def remove_all_lambda_permissions(app_name='', env='', region='us-east-1'):
         env (str): AWS environment
         region (str): AWS region
     """
-    session = boto3.Session(profile_name=env, region_name=region)
-    lambda_client = session.client('lambda')
+    lambda_client = get_boto_client('lambda', profile=env, region=region)
     legacy_prefix = app_name + "_"
 
     lambda_arn = get_lambda_arn(app_name, env, region)
@@ -0,0 +1,128 @@
+#   Foremast - Pipeline Tooling
+#
+#   Copyright 2018 Gogo, LLC
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Shared boto3 Sessions and clients.
+
+Building a :class:`boto3.Session` reads the AWS credential and config files,
+and each new client loads botocore service models. Sessions and clients are
+kept for the life of the process, keyed by profile, region, and service.
+
+Examples:
+    Reuse one Route 53 client for every lookup::
+
+        client = get_boto_client('route53', profile='dev')
+
+    Resources are not thread safe, so a new one is made from the shared
+    Session each time::
+
+        s3_resource = get_boto_resource('s3', profile='dev')
+
+"""
+import logging
+import threading
+
+import boto3
+import botocore.loaders
+import botocore.session
+
+from ..consts import BOTO_SHARE_LOADER
+
+LOG = logging.getLogger(__name__)
+
+BOTO_LOCK = threading.RLock()
+BOTO_SESSIONS = {}
+BOTO_CLIENTS = {}
+BOTO_LOADER = {'loader': None}
+
+
+def get_boto_session(profile=None, region=None):
+    """Get the shared Session for _profile_ and _region_.
+
+    Args:
+        profile (str): AWS credentials profile, usually the environment.
+        region (str, optional): AWS Region, defaults to the profile setting.
+
+    Returns:
+        boto3.Session: Session shared by every caller.
+
+    """
+    key = (profile, region)
+
+    with BOTO_LOCK:
+        session = BOTO_SESSIONS.get(key)
+
+        if session is None:
+            LOG.debug('New boto3 Session for %s', key)
+            botocore_session = botocore.session.get_session()
+
+            if BOTO_SHARE_LOADER:
+                if BOTO_LOADER['loader'] is None:
+                    BOTO_LOADER['loader'] = botocore.loaders.create_loader()
+                botocore_session.register_component('data_loader', BOTO_LOADER['loader'])
+
+            session = boto3.Session(profile_name=profile, region_name=region, botocore_session=botocore_session)
+            BOTO_SESSIONS[key] = session
+
+    return session
+
+
+def get_boto_client(service, profile=None, region=None):
+    """Get the shared client for _service_.
+
+    Clients are thread safe, so one client serves every caller.
+
+    Args:
+        service (str): AWS service name, e.g. route53.
+        profile (str): AWS credentials profile, usually the environment.
+        region (str, optional): AWS Region, defaults to the profile setting.
+
+    Returns:
+        botocore.client.BaseClient: Client for _service_.
+
+    """
+    key = (profile, region, service)
+
+    with BOTO_LOCK:
+        client = BOTO_CLIENTS.get(key)
+
+        if client is None:
+            LOG.debug('New boto3 client for %s', key)
+            client = get_boto_session(profile=profile, region=region).client(service)
+            BOTO_CLIENTS[key] = client
+
+    return client
+
+
+def get_boto_resource(service, profile=None, region=None):
+    """Get a new resource for _service_ from the shared Session.
+
+    Args:
+        service (str): AWS service name, e.g. s3.
+        profile (str): AWS credentials profile, usually the environment.
+        region (str, optional): AWS Region, defaults to the profile setting.
+
+    Returns:
+        boto3.resources.base.ServiceResource: Resource for _service_.
+
+    """
+    with BOTO_LOCK:
+        return get_boto_session(profile=profile, region=region).resource(service)
+
+
+def clear_boto_clients():
+    """Drop shared Sessions and clients, e.g. after credentials change."""
+    with BOTO_LOCK:
+        BOTO_SESSIONS.clear()
+        BOTO_CLIENTS.clear()
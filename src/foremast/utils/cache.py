@@ -0,0 +1,147 @@
+#   Foremast - Pipeline Tooling
+#
+#   Copyright 2018 Gogo, LLC
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Time limited cache for read mostly lookups.
+
+Examples:
+    Load a value once and reuse it until it expires::
+
+        cache = TTLCache(ttl=300)
+        vpcs = cache.get('/vpcs', load_vpcs)
+        # load_vpcs() called
+        vpcs = cache.get('/vpcs', load_vpcs)
+        # cached value returned
+
+    Drop values known to be stale::
+
+        cache.invalidate('/vpcs')
+        cache.invalidate()
+        # all values dropped
+
+"""
+import collections
+import json
+import logging
+import os
+import threading
+import time
+
+LOG = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Cache values for a limited time.
+
+    Values are kept in memory and, when _path_ is given, in a JSON file so
+    other processes can reuse them. Values must be JSON serializable when
+    using a file.
+
+    Args:
+        ttl (float): Seconds a value stays fresh.
+        path (str): Optional JSON file backing the cache.
+    """
+
+    def __init__(self, ttl=300, path=''):
+        self.ttl = ttl
+        self.path = path
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.key_locks = collections.defaultdict(threading.Lock)
+
+        if self.path:
+            self.entries.update(self._read_file())
+
+    def get(self, key, loader, ttl=None):
+        """Get fresh value for _key_, calling _loader_ when missing.
+
+        Args:
+            key (str): Cache key.
+            loader (callable): Takes no arguments and returns a new value.
+            ttl (float, optional): Seconds to keep a new value, defaults to
+                _self.ttl_.
+
+        Returns:
+            object: Cached or newly loaded value.
+
+        """
+        with self.lock:
+            key_lock = self.key_locks[key]
+
+        with key_lock:
+            with self.lock:
+                entry = self.entries.get(key)
+
+            if entry and entry['expires'] > time.time():
+                LOG.debug('Cache hit: %s', key)
+                return entry['value']
+
+            LOG.debug('Cache miss: %s', key)
+            value = loader()
+            self.set(key, value, ttl=ttl)
+
+        return value
+
+    def set(self, key, value, ttl=None):
+        """Store _value_ for _key_.
+
+        Args:
+            key (str): Cache key.
+            value (object): Value to store.
+            ttl (float, optional): Seconds to keep value, defaults to
+                _self.ttl_.
+
+        """
+        if ttl is None:
+            ttl = self.ttl
+
+        with self.lock:
+            self.entries[key] = {'expires': time.time() + ttl, 'value': value}
+            self._write_file()
+
+    def invalidate(self, key=None):
+        """Drop cached value for _key_, or all values when _key_ is None."""
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+            self._write_file()
+
+        LOG.debug('Cache invalidated: %s', key or 'all')
+
+    def _read_file(self):
+        """Load unexpired entries from _self.path_."""
+        try:
+            with open(self.path, 'rt') as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError):
+            LOG.debug('No usable cache file: %s', self.path)
+            return {}
+
+        now = time.time()
+        return {key: entry for key, entry in entries.items() if entry.get('expires', 0) > now}
+
+    def _write_file(self):
+        """Save entries to _self.path_, replacing the file atomically."""
+        if not self.path:
+            return
+
+        temp_path = '{0}.{1}.tmp'.format(self.path, os.getpid())
+        try:
+            with open(temp_path, 'wt') as cache_file:
+                json.dump(self.entries, cache_file)
+            os.replace(temp_path, self.path)
+        except (OSError, TypeError) as error:
+            LOG.warning('Could not write cache file %s: %s', self.path, error)
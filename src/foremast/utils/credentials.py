@@ -17,9 +17,9 @@
 import logging
 
 import murl
-import requests
 
-from ..consts import API_URL, GATE_CA_BUNDLE, GATE_CLIENT_CERT
+from ..consts import API_URL
+from .gate import GATE_CACHE, gate_request
 
 LOG = logging.getLogger(__name__)
 
@@ -74,10 +74,14 @@ def get_env_credential(env='dev'):
     """
     url = murl.Url(API_URL)
     url.path = '/'.join(['credentials', env])
-    credential_response = requests.get(url.url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
 
-    assert credential_response.ok, 'Could not get credentials from Spinnaker.'
+    def load_credential():
+        credential_response = gate_request(uri=url.url)
 
-    credential = credential_response.json()
+        assert credential_response.ok, 'Could not get credentials from Spinnaker.'
+
+        return credential_response.json()
+
+    credential = GATE_CACHE.get(url.url, load_credential)
     LOG.debug('Credentials found:\n%s', credential)
     return credential
@@ -0,0 +1,202 @@
+#   Foremast - Pipeline Tooling
+#
+#   Copyright 2018 Gogo, LLC
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Run steps in dependency order, in parallel where possible.
+
+Examples:
+    Create the Security Group and IAM together, then the ELB::
+
+        steps = [
+            Step('secgroups', create_secgroups),
+            Step('iam', create_iam),
+            Step('elb', create_elb, depends=['secgroups']),
+        ]
+        run_steps(steps, workers=2)
+
+"""
+import concurrent.futures
+import logging
+import time
+
+LOG = logging.getLogger(__name__)
+
+__all__ = ['Step', 'order_steps', 'run_steps', 'select_steps']
+
+
+class Step:
+    """One unit of work in a dependency graph.
+
+    Args:
+        name (str): Unique name of the step.
+        func (callable): Takes no arguments and does the work.
+        depends (list): Names of steps that must finish first.
+    """
+
+    PENDING = 'pending'
+    DONE = 'done'
+    FAILED = 'failed'
+    SKIPPED = 'skipped'
+
+    def __init__(self, name, func, depends=()):
+        self.name = name
+        self.func = func
+        self.depends = list(depends)
+        self.status = self.PENDING
+        self.error = None
+        self.duration = None
+
+    def __repr__(self):
+        return 'Step({0!r}, depends={1!r}, status={2!r})'.format(self.name, self.depends, self.status)
+
+    def run(self):
+        """Call _self.func_, recording status, error, and duration."""
+        start = time.time()
+        try:
+            self.func()
+        except Exception as error:  # pylint: disable=broad-except
+            self.status = self.FAILED
+            self.error = error
+            raise
+        else:
+            self.status = self.DONE
+        finally:
+            self.duration = time.time() - start
+            LOG.info('Step %s %s in %.1fs', self.name, self.status, self.duration)
+
+
+def order_steps(steps):
+    """Sort _steps_ so each comes after the steps it depends on.
+
+    Steps without dependencies between them keep their given order.
+
+    Args:
+        steps (list): :class:`Step` objects.
+
+    Returns:
+        list: Steps in dependency order.
+
+    Raises:
+        ValueError: A dependency is missing or steps depend on each other in
+            a cycle.
+
+    """
+    names = [step.name for step in steps]
+    for step in steps:
+        missing = set(step.depends) - set(names)
+        if missing:
+            raise ValueError('Step {0} depends on unknown steps: {1}'.format(step.name, ', '.join(sorted(missing))))
+
+    ordered = []
+    placed = set()
+    remaining = list(steps)
+    while remaining:
+        ready = [step for step in remaining if placed.issuperset(step.depends)]
+        if not ready:
+            raise ValueError('Steps depend on each other: {0}'.format(', '.join(step.name for step in remaining)))
+
+        for step in ready:
+            ordered.append(step)
+            placed.add(step.name)
+            remaining.remove(step)
+
+    return ordered
+
+
+def select_steps(steps, only=None, skip=None):
+    """Keep the _steps_ named in _only_ and not in _skip_.
+
+    Dependencies on removed steps are dropped, as if already done.
+
+    Args:
+        steps (list): :class:`Step` objects.
+        only (list, optional): Names of steps to keep, defaults to all.
+        skip (list, optional): Names of steps to remove.
+
+    Returns:
+        list: Selected steps.
+
+    Raises:
+        ValueError: _only_ or _skip_ names an unknown step.
+
+    """
+    names = [step.name for step in steps]
+    unknown = set(only or ()).union(skip or ()) - set(names)
+    if unknown:
+        raise ValueError('Unknown steps: {0}, choose from: {1}'.format(', '.join(sorted(unknown)), ', '.join(names)))
+
+    selected = [step for step in steps if (not only or step.name in only) and step.name not in (skip or ())]
+    selected_names = {step.name for step in selected}
+    for step in selected:
+        step.depends = [name for name in step.depends if name in selected_names]
+
+    return selected
+
+
+def run_steps(steps, workers=1, fail_fast=True):
+    """Run _steps_ once their dependencies finish, up to _workers_ at a time.
+
+    Steps depending on a failed step are skipped. With _fail_fast_, no new
+    steps start after the first failure and its error is raised once running
+    steps finish. Otherwise every step that can run does, and failures are
+    left on each step for the caller to report.
+
+    Args:
+        steps (list): :class:`Step` objects.
+        workers (int): Most steps to run at the same time.
+        fail_fast (bool): Stop at the first failed step.
+
+    Returns:
+        list: _steps_ in dependency order, with status, error, and duration.
+
+    Raises:
+        Exception: Error of the first failed step, when _fail_fast_.
+
+    """
+    ordered = order_steps(steps)
+    by_name = {step.name: step for step in ordered}
+    waiting = list(ordered)
+    running = {}
+    first_error = None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while waiting or running:
+            for step in list(waiting):
+                statuses = [by_name[name].status for name in step.depends]
+
+                if first_error is not None or any(status in (Step.FAILED, Step.SKIPPED) for status in statuses):
+                    LOG.info('Skipping step %s', step.name)
+                    step.status = Step.SKIPPED
+                    waiting.remove(step)
+                elif all(status == Step.DONE for status in statuses) and len(running) < max(1, workers):
+                    LOG.debug('Starting step %s', step.name)
+                    running[executor.submit(step.run)] = step
+                    waiting.remove(step)
+
+            if not running:
+                continue
+
+            finished, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                step = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    LOG.error('Step %s failed: %s', step.name, error)
+                    if fail_fast and first_error is None:
+                        first_error = error
+
+    if first_error is not None:
+        raise first_error
+
+    return ordered
@@ -14,19 +14,55 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Retrieve Route 53 Hosted Zone IDs."""
-import json
+import collections
 import logging
+import threading
 from pprint import pformat
 
-import boto3
 from boto3.exceptions import botocore
 
-from ..consts import DOMAIN
+from ..consts import DNS_CACHE_FILE, DNS_CACHE_TTL, DOMAIN
 from ..exceptions import PrimaryDNSRecordNotFound
-from ..utils import get_template
+from .boto_clients import get_boto_client
+from .cache import TTLCache
+from .templates import get_template_data
 
 LOG = logging.getLogger(__name__)
 
+HOSTED_ZONE_CACHE = TTLCache(ttl=DNS_CACHE_TTL, path=DNS_CACHE_FILE)
+
+
+def list_hosted_zones(env='dev', domain=None):
+    """List Route 53 Hosted Zones for _env_, cached in :data:`HOSTED_ZONE_CACHE`.
+
+    The cache lasts ``dns_cache_ttl`` seconds and can be kept in
+    ``dns_cache_file`` so separate Foremast commands reuse it.
+
+    Args:
+        env (str): Deployment environment.
+        domain (str, optional): Base domain, _env_ is prepended. Defaults
+            to ``domain`` from the Foremast configuration.
+
+    Returns:
+        list: Hosted Zones with _Id_, _Name_, and _PrivateZone_.
+
+    """
+    domain = domain or DOMAIN
+
+    def load_zones():
+        """Look up Hosted Zones from Route 53."""
+        client = get_boto_client('route53', profile=env)
+        response = client.list_hosted_zones_by_name(DNSName='.'.join([env, domain]))
+
+        zones = []
+        for zone in response['HostedZones']:
+            LOG.debug('Found Hosted Zone: %s', zone)
+            zones.append({'Id': zone['Id'], 'Name': zone['Name'], 'PrivateZone': zone['Config']['PrivateZone']})
+            HOSTED_ZONE_CACHE.set('route53:zone:{0}:{1}'.format(env, zone['Id']), zone['Name'].rstrip('.'))
+        return zones
+
+    return HOSTED_ZONE_CACHE.get('route53:zones:{0}:{1}'.format(env, domain), load_zones)
+
 
 def get_dns_zone_ids(env='dev', facing='internal'):
     """Get Route 53 Hosted Zone IDs for _env_.
@@ -40,63 +76,216 @@ def get_dns_zone_ids(env='dev', facing='internal'):
         internal.
 
     """
-    client = boto3.Session(profile_name=env).client('route53')
-
-    zones = client.list_hosted_zones_by_name(DNSName='.'.join([env, DOMAIN]))
-
     zone_ids = []
-    for zone in zones['HostedZones']:
-        LOG.debug('Found Hosted Zone: %s', zone)
-
-        if facing == 'external' or zone['Config']['PrivateZone']:
-            LOG.info('Using %(Id)s for "%(Name)s", %(Config)s', zone)
+    for zone in list_hosted_zones(env=env):
+        if facing == 'external' or zone['PrivateZone']:
+            LOG.info('Using %(Id)s for "%(Name)s", PrivateZone: %(PrivateZone)s', zone)
             zone_ids.append(zone['Id'])
 
     LOG.debug('Zone IDs: %s', zone_ids)
     return zone_ids
 
 
-def update_dns_zone_record(env, zone_id, **kwargs):
+def get_hosted_zone_name(env, zone_id):
+    """Get the domain name of a Hosted Zone, cached in :data:`HOSTED_ZONE_CACHE`.
+
+    Args:
+        env (str): Deployment environment.
+        zone_id (str): Route53 zone id.
+
+    Returns:
+        str: Hosted Zone name without the trailing dot.
+
+    """
+
+    def load_zone_name():
+        """Look up Hosted Zone name from Route 53."""
+        client = get_boto_client('route53', profile=env)
+        hosted_zone_info = client.get_hosted_zone(Id=zone_id)
+        return hosted_zone_info['HostedZone']['Name'].rstrip('.')
+
+    return HOSTED_ZONE_CACHE.get('route53:zone:{0}:{1}'.format(env, zone_id), load_zone_name)
+
+
+class DnsChangePlan:
+    """Route 53 changes for an application, sent as one batch per Hosted Zone.
+
+    Route 53 applies each batch atomically, so every record in a Hosted Zone
+    changes together. A later change to the same record replaces the earlier
+    one.
+
+    Args:
+        env (str): Deployment environment.
+    """
+
+    def __init__(self, env='dev'):
+        self.env = env
+        self.changes = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def add(self, zone_id, change_batch):
+        """Add the Changes in _change_batch_ for _zone_id_.
+
+        Args:
+            zone_id (str): Route53 zone id.
+            change_batch (dict): Route 53 ChangeBatch with a Changes list.
+
+        """
+        with self.lock:
+            zone_changes = self.changes.setdefault(zone_id, collections.OrderedDict())
+            for change in change_batch['Changes']:
+                record = change['ResourceRecordSet']
+                key = (record['Name'].rstrip('.').lower(), record['Type'], record.get('SetIdentifier'))
+                zone_changes[key] = change
+
+    def delete(self, zone_id, record):
+        """Add a DELETE of _record_ for _zone_id_."""
+        self.add(zone_id, {'Changes': [{'Action': 'DELETE', 'ResourceRecordSet': record}]})
+
+    def apply(self):
+        """Send one ChangeBatch for each Hosted Zone with changes.
+
+        Returns:
+            dict: Route 53 responses by Hosted Zone ID. Hosted Zones that
+            rejected their batch are left out.
+
+        """
+        client = get_boto_client('route53', profile=self.env)
+
+        with self.lock:
+            changes, self.changes = self.changes, collections.OrderedDict()
+
+        responses = {}
+        for zone_id, zone_changes in changes.items():
+            change_batch = {'Comment': 'Automatic Update', 'Changes': list(zone_changes.values())}
+            LOG.info('Sending %d DNS changes to Hosted Zone %s', len(change_batch['Changes']), zone_id)
+            LOG.debug('ChangeBatch: \n%s', pformat(change_batch))
+
+            try:
+                responses[zone_id] = client.change_resource_record_sets(HostedZoneId=zone_id, ChangeBatch=change_batch)
+                LOG.info('Changed DNS records in Hosted Zone %s', zone_id)
+            except botocore.exceptions.ClientError as error:
+                LOG.info('Error changing DNS records in Hosted Zone %s', zone_id)
+                LOG.debug(error)
+
+        LOG.debug('Route53 JSON Responses: \n%s', pformat(responses))
+        return responses
+
+
+def update_dns_zone_record(env, zone_id, plan=None, **kwargs):
     """Create a Route53 CNAME record in _env_ zone.
 
     Args:
         env (str): Deployment environment.
         zone_id (str): Route53 zone id.
+        plan (DnsChangePlan, optional): Add the change to _plan_ instead of
+            sending it now.
 
     Keyword Args:
         dns_name (str): FQDN of application's dns entry to add/update.
         dns_name_aws (str): FQDN of AWS resource
         dns_ttl (int): DNS time-to-live (ttl)
     """
-    client = boto3.Session(profile_name=env).client('route53')
-    response = {}
-
-    hosted_zone_info = client.get_hosted_zone(Id=zone_id)
-    zone_name = hosted_zone_info['HostedZone']['Name'].rstrip('.')
+    zone_name = get_hosted_zone_name(env, zone_id)
     dns_name = kwargs.get('dns_name')
 
     if dns_name and dns_name.endswith(zone_name):
         dns_name_aws = kwargs.get('dns_name_aws')
         # This is what will be added to DNS
-        dns_json = get_template(template_file='infrastructure/dns_upsert.json.j2', **kwargs)
-        LOG.info('Attempting to create DNS record %s (%s) in Hosted Zone %s (%s)', dns_name, dns_name_aws, zone_id,
-                 zone_name)
-        try:
-            response = client.change_resource_record_sets(
-                HostedZoneId=zone_id,
-                ChangeBatch=json.loads(dns_json), )
-            LOG.info('Upserted DNS record %s (%s) in Hosted Zone %s (%s)', dns_name, dns_name_aws, zone_id, zone_name)
-        except botocore.exceptions.ClientError as error:
-            LOG.info('Error creating DNS record %s (%s) in Hosted Zone %s (%s)', dns_name, dns_name_aws, zone_id,
-                     zone_name)
-            LOG.debug(error)
+        dns_data = get_template_data(template_file='infrastructure/dns_upsert.json.j2', **kwargs)
+        LOG.info('Planning DNS record %s (%s) in Hosted Zone %s (%s)', dns_name, dns_name_aws, zone_id, zone_name)
+
+        zone_plan = plan or DnsChangePlan(env=env)
+        zone_plan.add(zone_id, dns_data)
+        if plan is None:
+            zone_plan.apply()
     else:
         LOG.info('Skipping creating DNS record %s in non-matching Hosted Zone %s (%s)', dns_name, zone_id, zone_name)
 
-    LOG.debug('Route53 JSON Response: \n%s', pformat(response))
 
+def list_dns_records(env, zone_id, dns_name, record_type=None):
+    """List records named _dns_name_ in a Hosted Zone.
+
+    Route 53 sorts records by name and type, so the listing starts at
+    _dns_name_ and stops at the first record with another name instead of
+    reading the whole Hosted Zone.
+
+    Args:
+        env (str): Deployment environment.
+        zone_id (str): Route53 zone id.
+        dns_name (str): FQDN of records to list.
+        record_type (str, optional): Only list records of this type, e.g.
+            CNAME.
+
+    Returns:
+        list: Records named _dns_name_, empty when none exist.
+
+    """
+    client = get_boto_client('route53', profile=env)
+    dns_name = dns_name.rstrip('.').lower()
+
+    params = {'HostedZoneId': zone_id, 'StartRecordName': dns_name}
+    if record_type:
+        params['StartRecordType'] = record_type
+
+    records = []
+    while True:
+        response = client.list_resource_record_sets(**params)
+
+        for record in response['ResourceRecordSets']:
+            if record['Name'].rstrip('.').lower() != dns_name:
+                return records
+            if record_type and record.get('Type') != record_type:
+                return records
+            records.append(record)
+
+        if not response.get('IsTruncated'):
+            return records
 
-def find_existing_record(env, zone_id, dns_name, check_key=None, check_value=None):
+        params['StartRecordName'] = response['NextRecordName']
+        params['StartRecordType'] = response['NextRecordType']
+        params.pop('StartRecordIdentifier', None)
+        if 'NextRecordIdentifier' in response:
+            params['StartRecordIdentifier'] = response['NextRecordIdentifier']
+
+
+class ZoneRecordIndex:
+    """Records already listed from Route 53 Hosted Zones during one run.
+
+    Each name is listed once per Hosted Zone, so checking the same name for
+    several record types costs one call.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.lock = threading.Lock()
+
+    def get(self, env, zone_id, dns_name):
+        """Get records named _dns_name_ in _zone_id_, listing on first use.
+
+        Args:
+            env (str): Deployment environment.
+            zone_id (str): Route53 zone id.
+            dns_name (str): FQDN of records to list.
+
+        Returns:
+            list: Records named _dns_name_.
+
+        """
+        key = (zone_id, dns_name.rstrip('.').lower())
+
+        with self.lock:
+            if key not in self.records:
+                self.records[key] = list_dns_records(env, zone_id, dns_name)
+            return self.records[key]
+
+    def invalidate(self, zone_id, dns_name):
+        """Drop listed records for _dns_name_ after changing them."""
+        with self.lock:
+            self.records.pop((zone_id, dns_name.rstrip('.').lower()), None)
+
+
+def find_existing_record(env, zone_id, dns_name, check_key=None, check_value=None, record_index=None):
     """Check if a specific DNS record exists.
 
     Args:
@@ -105,25 +294,28 @@ def find_existing_record(env, zone_id, dns_name, check_key=None, check_value=Non
         dns_name (str): FQDN of application's dns entry to add/update.
         check_key(str): Key to look for in record. Example: "Type"
         check_value(str): Value to look for with check_key. Example: "CNAME"
+        record_index (ZoneRecordIndex, optional): Reuse records listed
+            earlier in this run.
 
     Returns:
         json: Found Record. Returns None if no record found
 
     """
-    client = boto3.Session(profile_name=env).client('route53')
-    pager = client.get_paginator('list_resource_record_sets')
-    existingrecord = None
-    for rset in pager.paginate(HostedZoneId=zone_id):
-        for record in rset['ResourceRecordSets']:
-            if check_key:
-                if record['Name'].rstrip('.') == dns_name and record.get(check_key) == check_value:
-                    LOG.info("Found existing record: %s", record)
-                    existingrecord = record
-                    break
-    return existingrecord
-
-
-def delete_existing_cname(env, zone_id, dns_name):
+    if record_index:
+        records = record_index.get(env, zone_id, dns_name)
+    elif check_key == 'Type':
+        records = list_dns_records(env, zone_id, dns_name, record_type=check_value)
+    else:
+        records = list_dns_records(env, zone_id, dns_name)
+
+    for record in records:
+        if check_key and record.get(check_key) == check_value:
+            LOG.info("Found existing record: %s", record)
+            return record
+    return None
+
+
+def delete_existing_cname(env, zone_id, dns_name, record_index=None, plan=None):
     """Delete an existing CNAME record.
 
     This is used when updating to multi-region for deleting old records. The
@@ -133,27 +325,35 @@ def delete_existing_cname(env, zone_id, dns_name):
         env (str): Deployment environment.
         zone_id (str): Route53 zone id.
         dns_name (str): FQDN of application's dns entry to add/update.
+        record_index (ZoneRecordIndex, optional): Reuse records listed
+            earlier in this run.
+        plan (DnsChangePlan, optional): Add the DELETE to _plan_ instead of
+            sending it now.
     """
-    client = boto3.Session(profile_name=env).client('route53')
-    startrecord = None
-    newrecord_name = dns_name
-    startrecord = find_existing_record(env, zone_id, newrecord_name, check_key='Type', check_value='CNAME')
+    startrecord = find_existing_record(
+        env, zone_id, dns_name, check_key='Type', check_value='CNAME', record_index=record_index)
     if startrecord:
-        LOG.info("Deleting old record: %s", newrecord_name)
-        _response = client.change_resource_record_sets(
-            HostedZoneId=zone_id, ChangeBatch={'Changes': [{
-                'Action': 'DELETE',
-                'ResourceRecordSet': startrecord
-            }]})
-        LOG.debug('Response from deleting %s: %s', dns_name, _response)
+        LOG.info("Deleting old record: %s", dns_name)
+        zone_plan = plan or DnsChangePlan(env=env)
+        zone_plan.delete(zone_id, startrecord)
+        if plan is None:
+            zone_plan.apply()
+        if record_index:
+            record_index.invalidate(zone_id, dns_name)
 
 
-def update_failover_dns_record(env, zone_id, **kwargs):
+def update_failover_dns_record(env, zone_id, record_index=None, plan=None, **kwargs):
     """Create a Failover Route53 alias record in _env_ zone.
 
+    Any CNAME with the same name is deleted in the same batch.
+
     Args:
         env (str): Deployment environment.
         zone_id (str): Route53 zone id.
+        record_index (ZoneRecordIndex, optional): Reuse records listed
+            earlier in this run.
+        plan (DnsChangePlan, optional): Add the changes to _plan_ instead of
+            sending them now.
 
     Keyword Args:
         dns_name (str): FQDN of application's dns entry to add/update.
@@ -163,36 +363,34 @@ def update_failover_dns_record(env, zone_id, **kwargs):
         failover_state (str): if the record is primary or secondary
         primary_region (str): Primary AWS region for DNS
     """
-    client = boto3.Session(profile_name=env).client('route53')
-    response = {}
-
-    hosted_zone_info = client.get_hosted_zone(Id=zone_id)
-    zone_name = hosted_zone_info['HostedZone']['Name'].rstrip('.')
+    zone_name = get_hosted_zone_name(env, zone_id)
     dns_name = kwargs.get('dns_name')
 
     # Check that the primary record exists
     failover_state = kwargs.get('failover_state')
     if failover_state.lower() != 'primary':
-        primary_record = find_existing_record(env, zone_id, dns_name, check_key='Failover', check_value='PRIMARY')
+        primary_record = find_existing_record(
+            env, zone_id, dns_name, check_key='Failover', check_value='PRIMARY', record_index=record_index)
         if not primary_record:
             raise PrimaryDNSRecordNotFound("Primary Failover DNS record not found: {}".format(dns_name))
 
     if dns_name and dns_name.endswith(zone_name):
-        dns_json = get_template(template_file='infrastructure/dns_failover_upsert.json.j2', **kwargs)
-        LOG.info('Attempting to create DNS Failover record %s (%s) in Hosted Zone %s (%s)', dns_name,
-                 kwargs['elb_aws_dns'], zone_id, zone_name)
+        dns_data = get_template_data(template_file='infrastructure/dns_failover_upsert.json.j2', **kwargs)
+        LOG.info('Planning DNS Failover record %s (%s) in Hosted Zone %s (%s)', dns_name, kwargs['elb_aws_dns'],
+                 zone_id, zone_name)
+
+        zone_plan = plan or DnsChangePlan(env=env)
         try:
-            delete_existing_cname(env, zone_id, dns_name)
-            response = client.change_resource_record_sets(
-                HostedZoneId=zone_id,
-                ChangeBatch=json.loads(dns_json), )
-            LOG.info('Upserted DNS Failover record %s (%s) in Hosted Zone %s (%s)', dns_name, kwargs['elb_aws_dns'],
-                     zone_id, zone_name)
+            delete_existing_cname(env, zone_id, dns_name, record_index=record_index, plan=zone_plan)
+            zone_plan.add(zone_id, dns_data)
+            if plan is None:
+                zone_plan.apply()
         except botocore.exceptions.ClientError as error:
             LOG.info('Error creating DNS Failover record %s (%s) in Hosted Zone %s (%s)', dns_name,
                      kwargs['elb_aws_dns'], zone_id, zone_name)
             LOG.debug(error)
+
+        if record_index:
+            record_index.invalidate(zone_id, dns_name)
     else:
         LOG.info('Skipping creating DNS record %s in non-matching Hosted Zone %s (%s)', dns_name, zone_id, zone_name)
-
-    LOG.debug('Route53 JSON Response: \n%s', pformat(response))
@@ -16,12 +16,12 @@
 """Search for ELB DNS name."""
 import logging
 
-import boto3
-import requests
 from tryagain import retries
 
-from ..consts import API_URL, GATE_CA_BUNDLE, GATE_CLIENT_CERT
+from ..consts import API_URL
 from ..exceptions import SpinnakerElbNotFound
+from .boto_clients import get_boto_client
+from .gate import gate_request
 
 LOG = logging.getLogger(__name__)
 
@@ -42,7 +42,7 @@ def find_elb(name='', env='', region=''):
     LOG.info('Find %s ELB in %s [%s].', name, env, region)
 
     url = '{0}/applications/{1}/loadBalancers'.format(API_URL, name)
-    response = requests.get(url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+    response = gate_request(uri=url)
     assert response.ok
 
     elb_dns = None
@@ -71,6 +71,6 @@ def find_elb_dns_zone_id(name='', env='dev', region='us-east-1'):
 
     """
     LOG.info('Find %s ELB DNS Zone ID in %s [%s].', name, env, region)
-    client = boto3.Session(profile_name=env).client('elb', region_name=region)
+    client = get_boto_client('elb', profile=env, region=region)
     elbs = client.describe_load_balancers(LoadBalancerNames=[name])
     return elbs['LoadBalancerDescriptions'][0]['CanonicalHostedZoneNameID']
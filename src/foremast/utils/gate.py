@@ -96,17 +96,94 @@ Examples:
         e.edgeforrest.get()
         # Fails because e.path == '/applications/coreforrest/edgeforrest'
 
+    All requests share one process wide :class:`requests.Session` so
+    connections to Gate, including the x509 handshake, are reused::
+
+        response = gate_request(uri='/applications')
+        # gate_session().request('get', API_URL + '/applications')
+
+    Read mostly reference data, like VPCs and Subnets, is kept in
+    :data:`GATE_CACHE` for ``gate_cache_ttl`` seconds::
+
+        vpcs = GATE_CACHE.get('/vpcs', load_vpcs)
+
 """
 import json
 import logging
+import threading
 
 import murl
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from ..consts import API_URL, HEADERS
+from ..consts import (API_URL, GATE_CA_BUNDLE, GATE_CACHE_FILE, GATE_CACHE_TTL, GATE_CLIENT_CERT, GATE_POOL_SIZE,
+                      GATE_RETRIES, GATE_TIMEOUT, HEADERS)
+from .cache import TTLCache
 
 LOG = logging.getLogger(__name__)
 
+GATE_CACHE = TTLCache(ttl=GATE_CACHE_TTL, path=GATE_CACHE_FILE)
+GATE_SESSION = None
+GATE_SESSION_LOCK = threading.Lock()
+
+
+def gate_session():
+    """Get the shared Gate API Session.
+
+    The Session is created on first use and reused for the life of the
+    process. Connections are pooled up to ``gate_pool_size`` and idempotent
+    requests are retried ``gate_retries`` times on connection errors and 5xx
+    responses.
+
+    Returns:
+        requests.Session: Session configured with Gate certificates.
+
+    """
+    global GATE_SESSION  # pylint: disable=global-statement
+
+    with GATE_SESSION_LOCK:
+        if GATE_SESSION is None:
+            retry = Retry(
+                total=GATE_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False, )
+            adapter = HTTPAdapter(pool_connections=GATE_POOL_SIZE, pool_maxsize=GATE_POOL_SIZE, max_retries=retry)
+
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.verify = GATE_CA_BUNDLE
+            session.cert = GATE_CLIENT_CERT
+
+            LOG.debug('Created Gate Session with pool size %d', GATE_POOL_SIZE)
+            GATE_SESSION = session
+
+    return GATE_SESSION
+
+
+def gate_request(method='get', uri='', **kwargs):
+    """Issue request to Gate API through the shared Session.
+
+    Args:
+        method (str): HTTP method, e.g. get, post.
+        uri (str): Full URL or path beginning with ``/`` relative to
+            _API_URL_.
+        kwargs: Extra arguments for :meth:`requests.Session.request`.
+
+    Returns:
+        requests.models.Response: Response from Gate.
+
+    """
+    if uri.startswith('/'):
+        uri = '{0}{1}'.format(API_URL, uri)
+
+    kwargs.setdefault('timeout', GATE_TIMEOUT)
+
+    LOG.debug('Gate %s request: %s', method.upper(), uri)
+    return gate_session().request(method, uri, **kwargs)
+
 
 class Gate:
     """Dynamic Gate API interface.
@@ -154,8 +231,7 @@ class Gate:
         url = self.normalize_url()
         request_kwargs = self.assemble_request_kwargs(json_data, kwargs)
 
-        # pylint: disable=not-callable
-        response = getattr(requests, self.verb)(url.url, **request_kwargs)
+        response = gate_request(self.verb, url.url, **request_kwargs)
 
         assert response.ok, 'Gate API {0} request to {1} failed: {2}'.format(self.verb.upper(), self.path,
                                                                              response.text)
@@ -1,17 +1,15 @@
 """CloudWatch Event functions."""
 import logging
 
-import boto3
-
 from ..utils.awslambda import get_lambda_alias_arn
+from .boto_clients import get_boto_client
 
 LOG = logging.getLogger(__name__)
 
 
 def get_cloudwatch_event_rule(app_name, account, region):
     """Get CloudWatch Event rule names."""
-    session = boto3.Session(profile_name=account, region_name=region)
-    cloudwatch_client = session.client('events')
+    cloudwatch_client = get_boto_client('events', profile=account, region=region)
 
     lambda_alias_arn = get_lambda_alias_arn(app=app_name, account=account, region=region)
     rule_names = cloudwatch_client.list_rule_names_by_target(TargetArn=lambda_alias_arn)
@@ -1,33 +1,120 @@
 """SNS Subscription functions."""
+import json
 import logging
 
-import boto3
+from boto3.exceptions import botocore
 
 from ..utils.awslambda import get_lambda_alias_arn
+from ..exceptions import SNSTopicNotFound
+from .boto_clients import get_boto_client
+from .get_sns_topic_arn import get_sns_topic_arn
 
 LOG = logging.getLogger(__name__)
 
 
-def get_sns_subscriptions(app_name, env, region):
+def get_lambda_sns_topics(lambda_alias_arn, env, region):
+    """Get topics allowed to invoke a Lambda alias by its policy.
+
+    Args:
+        lambda_alias_arn (str): ARN of the Lambda alias.
+        env (str): Environment/Account of the function.
+        region (str): AWS region of the function.
+
+    Returns:
+        list: SNS topic ARNs.
+
+    """
+    lambda_client = get_boto_client('lambda', profile=env, region=region)
+
+    try:
+        policy = json.loads(lambda_client.get_policy(FunctionName=lambda_alias_arn)['Policy'])
+    except botocore.exceptions.ClientError as error:
+        LOG.debug('No policy for %s: %s', lambda_alias_arn, error)
+        return []
+
+    topics = []
+    for statement in policy['Statement']:
+        principal = statement.get('Principal', {})
+        if not isinstance(principal, dict) or principal.get('Service') != 'sns.amazonaws.com':
+            continue
+
+        topic_arn = statement.get('Condition', {}).get('ArnLike', {}).get('AWS:SourceArn')
+        if topic_arn and topic_arn not in topics:
+            topics.append(topic_arn)
+
+    return topics
+
+
+def get_sns_subscriptions(app_name, env, region, topics=None):
     """List SNS lambda subscriptions.
 
+    With _topics_, only their subscriptions are listed, so the cost follows
+    the number of topics instead of every subscription in the account.
+    Without, every page of account subscriptions is scanned, which is slow
+    in large accounts and only meant as a fallback.
+
+    Args:
+        app_name (str): name of the lambda function
+        env (str): Environment/Account for lambda function
+        region (str): AWS region of the lambda function
+        topics (list, optional): Topic names or ARNs to check. Defaults to
+            scanning all subscriptions.
+
     Returns:
         list: List of Lambda subscribed SNS ARNs.
 
     """
-    session = boto3.Session(profile_name=env, region_name=region)
-    sns_client = session.client('sns')
+    sns_client = get_boto_client('sns', profile=env, region=region)
 
     lambda_alias_arn = get_lambda_alias_arn(app=app_name, account=env, region=region)
 
-    lambda_subscriptions = []
-    subscriptions = sns_client.list_subscriptions()
+    if topics is None:
+        pages = sns_client.get_paginator('list_subscriptions').paginate()
+    else:
+        pages = list_topic_subscriptions(sns_client, topics, env, region)
 
-    for subscription in subscriptions['Subscriptions']:
-        if subscription['Protocol'] == "lambda" and subscription['Endpoint'] == lambda_alias_arn:
-            lambda_subscriptions.append(subscription['SubscriptionArn'])
+    lambda_subscriptions = []
+    for page in pages:
+        for subscription in page['Subscriptions']:
+            if subscription['Protocol'] == "lambda" and subscription['Endpoint'] == lambda_alias_arn:
+                lambda_subscriptions.append(subscription['SubscriptionArn'])
 
     if not lambda_subscriptions:
         LOG.debug('SNS subscription for function %s not found', lambda_alias_arn)
 
     return lambda_subscriptions
+
+
+def list_topic_subscriptions(sns_client, topics, env, region):
+    """Yield pages of subscriptions for each of _topics_.
+
+    Args:
+        sns_client (botocore.client.SNS): Client to list with.
+        topics (list): Topic names or ARNs.
+        env (str): Environment/Account of the topics.
+        region (str): AWS region of the topics.
+
+    Yields:
+        dict: Page of ``list_subscriptions_by_topic`` results.
+
+    """
+    paginator = sns_client.get_paginator('list_subscriptions_by_topic')
+    topic_arns = []
+
+    for topic in topics:
+        try:
+            topic_arn = get_sns_topic_arn(topic, env, region)
+        except SNSTopicNotFound as error:
+            LOG.info('Skipping missing topic %s', topic)
+            LOG.debug(error)
+            continue
+
+        if topic_arn in topic_arns:
+            continue
+        topic_arns.append(topic_arn)
+
+        try:
+            yield from paginator.paginate(TopicArn=topic_arn)
+        except botocore.exceptions.ClientError as error:
+            LOG.info('Could not list subscriptions of topic %s', topic_arn)
+            LOG.debug(error)
@@ -1,16 +1,49 @@
 """SNS Topic functions."""
 import logging
 
-import boto3
-
 from ..exceptions import SNSTopicNotFound
+from .boto_clients import get_boto_client
+from .cache import TTLCache
 
 LOG = logging.getLogger(__name__)
 
+SNS_TOPIC_CACHE = TTLCache(ttl=300)
+
+
+def get_sns_topic_index(account, region):
+    """Get ARNs of all SNS topics by name, cached in :data:`SNS_TOPIC_CACHE`.
+
+    Args:
+        account (str): Environment, e.g. dev
+        region (str): Region name, e.g. us-east-1
+
+    Returns:
+        dict: Topic ARNs keyed by topic name.
+
+    """
+
+    def load_topics():
+        """List every page of SNS topics."""
+        sns_client = get_boto_client('sns', profile=account, region=region)
+        paginator = sns_client.get_paginator('list_topics')
+
+        topics = {}
+        for page in paginator.paginate():
+            for topic in page['Topics']:
+                topics[topic['TopicArn'].split(':')[-1]] = topic['TopicArn']
+
+        LOG.debug('Found %d SNS topics in %s %s', len(topics), account, region)
+        return topics
+
+    return SNS_TOPIC_CACHE.get('{0}:{1}'.format(account, region), load_topics)
+
 
 def get_sns_topic_arn(topic_name, account, region):
     """Get SNS topic ARN.
 
+    Topics created since the index was cached are found by listing topics
+    again once before giving up.
+
     Args:
         topic_name (str): Name of the topic to lookup.
         account (str): Environment, e.g. dev
@@ -22,18 +55,13 @@ def get_sns_topic_arn(topic_name, account, region):
     """
     if topic_name.count(':') == 5 and topic_name.startswith('arn:aws:sns:'):
         return topic_name
-    session = boto3.Session(profile_name=account, region_name=region)
-    sns_client = session.client('sns')
-
-    topics = sns_client.list_topics()['Topics']
-
-    matched_topic = None
-    for topic in topics:
-        topic_arn = topic['TopicArn']
-        if topic_name == topic_arn.split(':')[-1]:
-            matched_topic = topic_arn
-            break
-    else:
+
+    topic_arn = get_sns_topic_index(account, region).get(topic_name)
+    if not topic_arn:
+        SNS_TOPIC_CACHE.invalidate('{0}:{1}'.format(account, region))
+        topic_arn = get_sns_topic_index(account, region).get(topic_name)
+
+    if not topic_arn:
         LOG.critical("No topic with name %s found.", topic_name)
         raise SNSTopicNotFound('No topic with name {0} found'.format(topic_name))
-    return matched_topic
+    return topic_arn
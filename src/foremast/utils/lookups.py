@@ -17,6 +17,7 @@
 import json
 import logging
 import os
+import threading
 from base64 import b64decode
 
 import gitlab
@@ -28,6 +29,28 @@ from .warn_user import warn_user
 
 LOG = logging.getLogger(__name__)
 
+GITLAB_SERVER = None
+GITLAB_SERVER_LOCK = threading.Lock()
+
+
+def gitlab_server():
+    """Get the shared GitLab API client.
+
+    The client is created on first use so every :class:`FileLookup` reuses
+    the same connection pool.
+
+    Returns:
+        gitlab.Gitlab: GitLab API client.
+
+    """
+    global GITLAB_SERVER  # pylint: disable=global-statement
+
+    with GITLAB_SERVER_LOCK:
+        if GITLAB_SERVER is None:
+            GITLAB_SERVER = gitlab.Gitlab(GIT_URL, private_token=GITLAB_TOKEN, api_version=4)
+
+    return GITLAB_SERVER
+
 
 def ami_lookup(region='us-east-1', name='tomcat8'):
     """Look up AMI ID.
@@ -129,7 +152,7 @@ class FileLookup():
                 code.
 
         """
-        self.server = gitlab.Gitlab(GIT_URL, private_token=GITLAB_TOKEN, api_version=4)
+        self.server = gitlab_server()
         project = self.server.projects.get(self.git_short)
 
         if not project:
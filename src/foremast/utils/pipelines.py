@@ -14,15 +14,22 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Check Pipeline name to match format."""
+import hashlib
+import json
 import logging
+import re
 
 import murl
-import requests
 
-from ..consts import API_URL, GATE_CA_BUNDLE, GATE_CLIENT_CERT
+from ..consts import API_URL
+from .gate import gate_request
 
 LOG = logging.getLogger(__name__)
 
+PIPELINE_REGION_REGEX = re.compile(r'\[(?P<region>[^\]]+)\]')
+PIPELINE_ONETIME_REGEX = re.compile(r'\(onetime-(?P<env>[^)]+)\)')
+PIPELINE_VOLATILE_KEYS = frozenset(('index', 'lastModifiedBy', 'updateTs'))
+
 
 def check_managed_pipeline(name='', app_name=''):
     """Check a Pipeline name is a managed format **app_name [region]**.
@@ -74,7 +81,7 @@ def get_all_pipelines(app=''):
     """
     url = murl.Url(API_URL)
     url.path = 'applications/{app}/pipelineConfigs'.format(app=app)
-    response = requests.get(url.url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+    response = gate_request(uri=url.url)
 
     assert response.ok, 'Could not retrieve Pipelines for {0}.'.format(app)
 
@@ -84,29 +91,146 @@ def get_all_pipelines(app=''):
     return pipelines
 
 
-def get_pipeline_id(app='', name=''):
+class PipelineIndex:
+    """Pipeline configs from Gate indexed for direct lookups.
+
+    Managed Pipelines are keyed by ``(application, region, onetime_env)``,
+    parsed from names like **app [us-east-1]** and
+    **app [us-east-1] (onetime-dev)**. The first Pipeline listed wins when
+    several share a key, matching a linear search of the same list.
+
+    Args:
+        pipelines (list): Pipeline configs returned by Gate.
+    """
+
+    def __init__(self, pipelines):
+        self.pipelines = list(pipelines)
+        self.ids = {}
+        self.names = {}
+        self.regions = {}
+
+        for pipeline in self.pipelines:
+            name = pipeline['name']
+            self.names.setdefault(name, pipeline)
+            self.ids.setdefault(pipeline.get('id'), pipeline)
+
+            region_match = PIPELINE_REGION_REGEX.search(name)
+            if not region_match:
+                continue
+
+            onetime_match = PIPELINE_ONETIME_REGEX.search(name)
+            onetime_env = onetime_match.group('env') if onetime_match else None
+
+            key = (pipeline.get('application'), region_match.group('region'), onetime_env)
+            self.regions.setdefault(key, pipeline)
+
+    def __iter__(self):
+        return iter(self.pipelines)
+
+    def __len__(self):
+        return len(self.pipelines)
+
+    def find(self, app, region, onetime_env=None):
+        """Get managed Pipeline for _app_ in _region_.
+
+        Args:
+            app (str): Name of Spinnaker Application.
+            region (str): AWS Region.
+            onetime_env (str, optional): Environment of onetime Pipeline.
+
+        Returns:
+            dict: Pipeline config.
+            None: No Pipeline found.
+
+        """
+        return self.regions.get((app, region, onetime_env))
+
+    def get_config(self, pipeline):
+        """Get stored config matching _pipeline_ by ID, or name without an ID.
+
+        Args:
+            pipeline (dict): Rendered Pipeline.
+
+        Returns:
+            dict: Existing Pipeline config.
+            None: Pipeline not stored yet.
+
+        """
+        if pipeline.get('id'):
+            return self.ids.get(pipeline['id'])
+        return self.names.get(pipeline.get('name'))
+
+    def get_id(self, name):
+        """Get ID for Pipeline _name_.
+
+        Args:
+            name (str): Name of Pipeline.
+
+        Returns:
+            str: ID of specified Pipeline.
+            None: Pipeline not found.
+
+        """
+        pipeline = self.names.get(name)
+        if pipeline:
+            return pipeline['id']
+        return None
+
+
+def pipeline_digest(pipeline):
+    """Hash Pipeline config in a canonical form.
+
+    Keys Spinnaker updates on every save, like ``updateTs``, are left out so
+    a stored config and the same rendered config hash equally.
+
+    Args:
+        pipeline (dict): Pipeline config.
+
+    Returns:
+        str: SHA-256 hex digest.
+
+    """
+    stable = {key: value for key, value in pipeline.items() if key not in PIPELINE_VOLATILE_KEYS}
+    canonical_json = json.dumps(stable, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical_json.encode()).hexdigest()
+
+
+def get_pipeline_index(app=''):
+    """Fetch Pipelines in _app_ once and index them.
+
+    Args:
+        app (str): Name of Spinnaker Application.
+
+    Returns:
+        PipelineIndex: Indexed Pipelines.
+
+    """
+    return PipelineIndex(get_all_pipelines(app=app))
+
+
+def get_pipeline_id(app='', name='', pipelines=None):
     """Get the ID for Pipeline _name_.
 
     Args:
         app (str): Name of Spinnaker Application to search.
         name (str): Name of Pipeline to get ID for.
+        pipelines (PipelineIndex, optional): Snapshot of Pipelines to search
+            instead of fetching them again.
 
     Returns:
         str: ID of specified Pipeline.
         None: Pipeline or Spinnaker Appliation not found.
 
     """
-    return_id = None
-
-    pipelines = get_all_pipelines(app=app)
+    if pipelines is None:
+        pipelines = get_all_pipelines(app=app)
 
-    for pipeline in pipelines:
-        LOG.debug('ID of %(name)s: %(id)s', pipeline)
+    if not isinstance(pipelines, PipelineIndex):
+        pipelines = PipelineIndex(pipelines)
 
-        if pipeline['name'] == name:
-            return_id = pipeline['id']
-            LOG.info('Pipeline %s found, ID: %s', name, return_id)
-            break
+    return_id = pipelines.get_id(name)
+    if return_id is not None:
+        LOG.info('Pipeline %s found, ID: %s', name, return_id)
 
     return return_id
 
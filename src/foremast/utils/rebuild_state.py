@@ -0,0 +1,180 @@
+#   Foremast - Pipeline Tooling
+#
+#   Copyright 2018 Gogo, LLC
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Remember what each application was last rebuilt from, and rebuild progress.
+
+Examples:
+    Skip applications rebuilt from the same inputs::
+
+        state = RebuildState('~/.foremast/rebuild_state.json')
+        fingerprint = {'config_commit': 'abc123', 'templates': '9f86d0', 'version': '5.0.0'}
+        if not state.is_current('coreforrest', fingerprint):
+            rebuild()
+            state.record('coreforrest', fingerprint)
+
+    Continue an interrupted rebuild::
+
+        checkpoint = RebuildCheckpoint('~/.foremast/rebuild_checkpoint.json', resume=True)
+        for app in checkpoint.remaining(all_apps):
+            rebuild(app)
+            checkpoint.mark(app, RebuildCheckpoint.DONE)
+
+"""
+import json
+import logging
+import os
+import threading
+
+LOG = logging.getLogger(__name__)
+
+
+class RebuildState:
+    """Last rebuild inputs for each application, kept in a JSON file.
+
+    Args:
+        path (str): JSON file to load and save state.
+    """
+
+    def __init__(self, path=''):
+        self.path = os.path.expandvars(os.path.expanduser(path))
+        self.lock = threading.Lock()
+        self.apps = self._read_file()
+
+    def is_current(self, app, fingerprint):
+        """Check _app_ was last rebuilt from _fingerprint_.
+
+        Args:
+            app (str): Spinnaker Application name.
+            fingerprint (dict): Inputs that change rendered Pipelines.
+
+        Returns:
+            bool: True when nothing changed since the last rebuild.
+
+        """
+        with self.lock:
+            return self.apps.get(app) == fingerprint
+
+    def record(self, app, fingerprint):
+        """Save _fingerprint_ as the last rebuild of _app_.
+
+        Args:
+            app (str): Spinnaker Application name.
+            fingerprint (dict): Inputs that change rendered Pipelines.
+
+        """
+        with self.lock:
+            self.apps[app] = fingerprint
+            self._write_file()
+
+    def _read_file(self):
+        """Load state from _self.path_."""
+        apps = read_json_file(self.path)
+        if apps is None:
+            LOG.info('No usable rebuild state in %s, rebuilding everything.', self.path)
+            return {}
+        return apps
+
+    def _write_file(self):
+        """Save state to _self.path_."""
+        write_json_file(self.path, self.apps)
+
+
+class RebuildCheckpoint:
+    """Progress of a rebuild, saved after every application.
+
+    Each application is _pending_, _done_, or _failed_ with the error and
+    number of attempts made.
+
+    Args:
+        path (str): JSON file to save progress to.
+        resume (bool): Continue from progress already in _path_ instead of
+            starting over.
+    """
+
+    PENDING = 'pending'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, path='', resume=False):
+        self.path = os.path.expandvars(os.path.expanduser(path))
+        self.lock = threading.Lock()
+        self.apps = {}
+
+        if resume:
+            self.apps = read_json_file(self.path) or {}
+            LOG.info('Resuming rebuild from %s.', self.path)
+
+    def remaining(self, app_names):
+        """Get _app_names_ not rebuilt yet, and mark them pending.
+
+        Args:
+            app_names (list): Applications selected for rebuild.
+
+        Returns:
+            list: Applications still to rebuild, in order.
+
+        """
+        with self.lock:
+            remaining = [name for name in app_names if self.status(name) != self.DONE]
+            for name in remaining:
+                self.apps.setdefault(name, {'status': self.PENDING, 'attempts': 0})
+            write_json_file(self.path, self.apps)
+
+        return remaining
+
+    def status(self, app_name):
+        """Get progress of _app_name_, _None_ when never started."""
+        return self.apps.get(app_name, {}).get('status')
+
+    def mark(self, app_name, status, error=None, attempts=0):
+        """Save progress for _app_name_.
+
+        Args:
+            app_name (str): Application rebuilt.
+            status (str): One of _PENDING_, _DONE_, or _FAILED_.
+            error (Exception, optional): Error from last attempt.
+            attempts (int): Attempts made in this run.
+
+        """
+        with self.lock:
+            entry = self.apps.setdefault(app_name, {'attempts': 0})
+            entry['status'] = status
+            entry['attempts'] = entry.get('attempts', 0) + attempts
+            if error is None:
+                entry.pop('error', None)
+            else:
+                entry['error'] = '{0}: {1}'.format(type(error).__name__, error)
+            write_json_file(self.path, self.apps)
+
+
+def read_json_file(path):
+    """Load JSON from _path_, _None_ when missing or unreadable."""
+    try:
+        with open(path, 'rt') as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_file(path, data):
+    """Save _data_ as JSON to _path_, replacing the file atomically."""
+    json_dir = os.path.dirname(path)
+    if json_dir:
+        os.makedirs(json_dir, exist_ok=True)
+
+    temp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+    with open(temp_path, 'wt') as json_file:
+        json.dump(data, json_file, indent=4, sort_keys=True)
+    os.replace(temp_path, path)
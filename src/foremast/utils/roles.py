@@ -1,7 +1,8 @@
 """IAM Role functions."""
 import logging
 
-import boto3
+from .boto_clients import get_boto_client
+
 
 LOG = logging.getLogger(__name__)
 
@@ -18,8 +19,7 @@ def get_role_arn(role_name, env, region):
         ARN if role found
 
     """
-    session = boto3.Session(profile_name=env, region_name=region)
-    iam_client = session.client('iam')
+    iam_client = get_boto_client('iam', profile=env, region=region)
 
     LOG.debug('Searching for %s.', role_name)
 
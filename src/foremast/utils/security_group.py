@@ -16,11 +16,11 @@
 """Get security group id."""
 import logging
 
-import requests
 from tryagain import retries
 
-from ..consts import API_URL, GATE_CA_BUNDLE, GATE_CLIENT_CERT, SECURITYGROUP_REPLACEMENTS
+from ..consts import API_URL, SECURITYGROUP_REPLACEMENTS
 from ..exceptions import SpinnakerSecurityGroupError
+from .gate import gate_request
 from .vpc import get_vpc_id
 
 LOG = logging.getLogger(__name__)
@@ -49,7 +49,7 @@ def get_security_group_id(name='', env='', region=''):
     LOG.info('Find %s sg in %s [%s] in %s', name, env, region, vpc_id)
 
     url = '{0}/securityGroups/{1}/{2}/{3}?vpcId={4}'.format(API_URL, env, region, name, vpc_id)
-    response = requests.get(url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+    response = gate_request(uri=url)
     assert response.ok
 
     result = response.json()
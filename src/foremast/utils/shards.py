@@ -0,0 +1,92 @@
+#   Foremast - Pipeline Tooling
+#
+#   Copyright 2018 Gogo, LLC
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Split work into deterministic shards for separate machines."""
+import hashlib
+import logging
+
+LOG = logging.getLogger(__name__)
+
+
+def parse_shard(shard=''):
+    """Parse a shard written as **INDEX/COUNT**.
+
+    Args:
+        shard (str): Shard number counting from 0 and total shards, e.g.
+            ``0/4``.
+
+    Returns:
+        tuple: Shard index and count.
+
+    Raises:
+        ValueError: Shard is malformed or the index is out of range.
+
+    """
+    index, _, count = shard.partition('/')
+    index, count = int(index), int(count)
+
+    if count < 1 or not 0 <= index < count:
+        raise ValueError('Shard must be INDEX/COUNT with 0 <= INDEX < COUNT: {0}'.format(shard))
+
+    return index, count
+
+
+def stable_shard(key, count):
+    """Get shard for _key_, the same for every process and Python version.
+
+    Args:
+        key (str): Name of item to place.
+        count (int): Total shards.
+
+    Returns:
+        int: Shard index.
+
+    """
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return int(digest, 16) % count
+
+
+def select_shard(items, index, count, key, weight=None):
+    """Select the _items_ belonging to shard _index_ of _count_.
+
+    Without _weight_, items are placed by a stable hash of their _key_, so
+    the split does not depend on item order. With _weight_, items are
+    spread so each shard gets a similar total weight, heaviest first, which
+    relies on every shard seeing the same items.
+
+    Args:
+        items (list): Items to split.
+        index (int): Shard to select.
+        count (int): Total shards.
+        key (callable): Get unique name of an item.
+        weight (callable, optional): Get relative cost of an item.
+
+    Returns:
+        list: Items in shard _index_, in their original order.
+
+    """
+    if weight is None:
+        return [item for item in items if stable_shard(key(item), count) == index]
+
+    loads = [0] * count
+    selected = set()
+    for item in sorted(items, key=lambda item: (-weight(item), key(item))):
+        shard = min(range(count), key=lambda shard: (loads[shard], shard))
+        loads[shard] += weight(item)
+        if shard == index:
+            selected.add(key(item))
+
+    LOG.debug('Shard weights: %s', loads)
+    return [item for item in items if key(item) in selected]
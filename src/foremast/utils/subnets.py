@@ -15,20 +15,140 @@
 #   limitations under the License.
 """Get available Subnets for specific Targets."""
 import logging
-from collections import defaultdict
+import threading
 from pprint import pformat
 
-import requests
 from tryagain import retries
 
-from ..consts import API_URL, GATE_CA_BUNDLE, GATE_CLIENT_CERT
+from ..consts import API_URL
 from ..exceptions import SpinnakerSubnetError, SpinnakerTimeout
+from .gate import GATE_CACHE, gate_request
 
 LOG = logging.getLogger(__name__)
 
+SUBNET_INDEX_LOCK = threading.Lock()
+SUBNET_INDEX_CACHE = {'payload': None, 'index': None}
+
+
+class SubnetIndex:
+    """Subnets from Gate indexed for direct lookups.
+
+    Availability Zones and Subnet IDs are keyed by ``(account, region,
+    target, purpose)``. A _purpose_ of ``None`` matches Subnets of any
+    purpose.
+
+    Args:
+        subnets (list): Subnets returned by Gate ``/subnets/aws``.
+    """
+
+    def __init__(self, subnets):
+        self.availability_zones = {}
+        self.subnet_ids = {}
+        self.accounts = {}
+
+        for subnet in subnets:
+            LOG.debug('Subnet: %(account)s\t%(region)s\t%(target)s\t%(vpcId)s\t' '%(availabilityZone)s', subnet)
+
+            account = subnet['account']
+            region = subnet['region']
+            target = subnet['target']
+            purpose = subnet['purpose']
+            availability_zone = subnet['availabilityZone']
+
+            for key in ((account, region, target, None), (account, region, target, purpose)):
+                zones = self.availability_zones.setdefault(key, [])
+                if availability_zone not in zones:
+                    zones.append(availability_zone)
+
+            self.subnet_ids.setdefault((account, region, target, purpose), []).append(subnet['id'])
+
+            regions = self.accounts.setdefault(target, {}).setdefault(account, {})
+            regions[region] = self.availability_zones[(account, region, target, None)]
+
+    def azs(self, account, region, target='ec2', purpose=None):
+        """Get Availability Zones.
+
+        Args:
+            account (str): Account or environment name.
+            region (str): AWS Region.
+            target (str): Type of Subnets, e.g. ec2 or elb.
+            purpose (str, optional): Subnet purpose, defaults to any.
+
+        Returns:
+            list: Availability Zones.
+
+        Raises:
+            KeyError: No Subnets match.
+
+        """
+        return self.availability_zones[(account, region, target, purpose)]
+
+    def ids(self, account, region, target='ec2', purpose='internal'):
+        """Get Subnet IDs.
+
+        Args:
+            account (str): Account or environment name.
+            region (str): AWS Region.
+            target (str): Type of Subnets, e.g. ec2 or elb.
+            purpose (str): Subnet purpose, e.g. internal or external.
+
+        Returns:
+            list: Subnet IDs.
+
+        Raises:
+            KeyError: No Subnets match.
+
+        """
+        return self.subnet_ids[(account, region, target, purpose)]
+
+    def az_dict(self, target='ec2'):
+        """Get Availability Zones for all accounts.
+
+        Args:
+            target (str): Type of Subnets, e.g. ec2 or elb.
+
+        Returns:
+            dict: Availability Zones in ``{$account: {$region: [$zones]}}``.
+
+        """
+        az_dict = {}
+        for account, regions in self.accounts.get(target, {}).items():
+            az_dict[account] = {region: list(zones) for region, zones in regions.items()}
+        return az_dict
+
 
-# TODO: split up into get_az, and get_subnet_id
 @retries(max_attempts=6, wait=2.0, exceptions=SpinnakerTimeout)  # noqa
+def get_subnet_index():
+    """Get index of all Subnets known to Spinnaker.
+
+    The index is built once for each Subnet list fetched from Gate.
+
+    Returns:
+        SubnetIndex: Indexed Subnets.
+
+    Raises:
+        :obj:`foremast.exceptions.SpinnakerTimeout`: Gate API had an error.
+
+    """
+    subnet_url = '{0}/subnets/aws'.format(API_URL)
+
+    def load_subnets():
+        subnet_response = gate_request(uri=subnet_url)
+
+        if not subnet_response.ok:
+            raise SpinnakerTimeout(subnet_response.text)
+
+        return subnet_response.json()
+
+    subnet_list = GATE_CACHE.get(subnet_url, load_subnets)
+
+    with SUBNET_INDEX_LOCK:
+        if SUBNET_INDEX_CACHE['payload'] is not subnet_list:
+            LOG.debug('Indexing %d Subnets', len(subnet_list))
+            SUBNET_INDEX_CACHE.update(payload=subnet_list, index=SubnetIndex(subnet_list))
+        return SUBNET_INDEX_CACHE['index']
+
+
 def get_subnets(
         target='ec2',
         purpose='internal',
@@ -47,48 +167,18 @@ def get_subnets(
         or
         { $account: $region: [ $availabilityzone] }
     """
-    account_az_dict = defaultdict(defaultdict)
-    subnet_id_dict = defaultdict(defaultdict)
-
-    subnet_url = '{0}/subnets/aws'.format(API_URL)
-    subnet_response = requests.get(subnet_url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
-
-    if not subnet_response.ok:
-        raise SpinnakerTimeout(subnet_response.text)
-
-    subnet_list = subnet_response.json()
-
-    for subnet in subnet_list:
-        LOG.debug('Subnet: %(account)s\t%(region)s\t%(target)s\t%(vpcId)s\t' '%(availabilityZone)s', subnet)
-
-        if subnet['target'] == target:
-            availability_zone = subnet['availabilityZone']
-            account = subnet['account']
-            subnet_region = subnet['region']
-            subnet_id = subnet['id']
-            try:
-                if availability_zone not in account_az_dict[account][subnet_region]:
-                    account_az_dict[account][subnet_region].append(availability_zone)
-            except KeyError:
-                account_az_dict[account][subnet_region] = [availability_zone]
-            # get list of all subnet IDs with correct purpose
-            if subnet['purpose'] == purpose:
-                try:
-                    subnet_id_dict[account][subnet_region].append(subnet_id)
-                except KeyError:
-                    subnet_id_dict[account][subnet_region] = [subnet_id]
-
-            LOG.debug('%s regions: %s', account, list(account_az_dict[account].keys()))
+    subnet_index = get_subnet_index()
 
     if all([env, region]):
         try:
-            region_dict = {region: account_az_dict[env][region]}
-            region_dict['subnet_ids'] = {region: subnet_id_dict[env][region]}
+            region_dict = {region: list(subnet_index.azs(env, region, target=target))}
+            region_dict['subnet_ids'] = {region: list(subnet_index.ids(env, region, target=target, purpose=purpose))}
             LOG.debug('Region dict: %s', region_dict)
             return region_dict
         except KeyError:
             raise SpinnakerSubnetError(env=env, region=region)
 
-    LOG.debug('AZ dict:\n%s', pformat(dict(account_az_dict)))
+    account_az_dict = subnet_index.az_dict(target=target)
+    LOG.debug('AZ dict:\n%s', pformat(account_az_dict))
 
     return account_az_dict
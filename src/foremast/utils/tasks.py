@@ -13,15 +13,17 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """POST a new task or check status of running task."""
+import itertools
 import json
 import logging
-from functools import partial
+import random
+import threading
+import time
+from concurrent.futures import Future
 
-import requests
-from tryagain import call as retry_call
-
-from ..consts import API_URL, DEFAULT_TASK_TIMEOUT, GATE_CA_BUNDLE, GATE_CLIENT_CERT, HEADERS, TASK_TIMEOUTS
+from ..consts import API_URL, DEFAULT_TASK_TIMEOUT, HEADERS, TASK_POLL_INITIAL, TASK_POLL_MAX, TASK_TIMEOUTS
 from ..exceptions import SpinnakerTaskError, SpinnakerTaskInconclusiveError
+from .gate import gate_request
 
 LOG = logging.getLogger(__name__)
 
@@ -46,7 +48,7 @@ def post_task(task_data, task_uri='/tasks'):
     else:
         task_json = json.dumps(task_data)
 
-    resp = requests.post(url, data=task_json, headers=HEADERS, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+    resp = gate_request('post', url, data=task_json, headers=HEADERS)
     resp_json = resp.json()
 
     LOG.debug(resp_json)
@@ -76,7 +78,7 @@ def _check_task(taskid):
     LOG.info('Checking taskid %s', taskid)
 
     url = '{}/tasks/{}'.format(API_URL, taskid)
-    task_response = requests.get(url, headers=HEADERS, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
+    task_response = gate_request(uri=url, headers=HEADERS)
 
     LOG.debug(task_response.json())
 
@@ -94,13 +96,50 @@ def _check_task(taskid):
         raise ValueError
 
 
-def check_task(taskid, timeout=DEFAULT_TASK_TIMEOUT, wait=2):
+def _backoff(deadline, cap):
+    """Yield jittered, exponentially growing pauses until _deadline_."""
+    interval = TASK_POLL_INITIAL
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        yield min(random.uniform(interval / 2, interval), remaining)
+        interval = min(interval * 2, cap)
+
+
+def poll_intervals(timeout=DEFAULT_TASK_TIMEOUT, wait=None):
+    """Generate pauses between Task status polls.
+
+    With a fixed _wait_, ``timeout / wait`` polls are made. Otherwise the
+    first polls follow quickly after _TASK_POLL_INITIAL_ seconds and back off
+    exponentially with jitter, capped at the smaller of _TASK_POLL_MAX_ and a
+    tenth of _timeout_, until _timeout_ is spent.
+
+    Args:
+        timeout (int, optional): Seconds to keep polling.
+        wait (int, optional): Fixed seconds to pause between polls.
+
+    Returns:
+        iterator: Seconds to pause before each following poll.
+
+    """
+    timeout = float(timeout)
+
+    if wait:
+        return itertools.repeat(wait, max(int(timeout / wait) - 1, 0))
+
+    cap = max(TASK_POLL_INITIAL, min(TASK_POLL_MAX, timeout / 10))
+    return _backoff(time.monotonic() + timeout, cap)
+
+
+def check_task(taskid, timeout=DEFAULT_TASK_TIMEOUT, wait=None):
     """Wrap check_task.
 
     Args:
         taskid (str): Existing Spinnaker Task ID.
         timeout (int, optional): Consider Task failed after given seconds.
-        wait (int, optional): Seconds to pause between polling attempts.
+        wait (int, optional): Seconds to pause between polling attempts,
+            defaults to adaptive backoff from :func:`poll_intervals`.
 
     Returns:
         str: Task status.
@@ -111,29 +150,39 @@ def check_task(taskid, timeout=DEFAULT_TASK_TIMEOUT, wait=2):
             reach a terminal state before the given time out.
 
     """
-    max_attempts = int(timeout / wait)
-    try:
-        return retry_call(
-            partial(_check_task, taskid),
-            max_attempts=max_attempts,
-            wait=wait,
-            exceptions=(AssertionError, ValueError), )
-    except ValueError:
-        raise SpinnakerTaskInconclusiveError('Task failed to complete in {0} seconds: {1}'.format(timeout, taskid))
-
-
-def wait_for_task(task_data, task_uri='/tasks'):
-    """Run task and check the result.
+    start = time.monotonic()
+    intervals = poll_intervals(timeout=timeout, wait=wait)
+
+    polls = 0
+    while True:
+        polls += 1
+        try:
+            status = _check_task(taskid)
+        except (AssertionError, ValueError) as error:
+            pause = next(intervals, None)
+            if pause is None:
+                LOG.info('Task %s unfinished after %d polls', taskid, polls)
+                if isinstance(error, AssertionError):
+                    raise
+                raise SpinnakerTaskInconclusiveError('Task failed to complete in {0} seconds: {1}'.format(
+                    timeout, taskid))
+            time.sleep(pause)
+        else:
+            LOG.info('Task %s finished after %d polls in %.1f seconds', taskid, polls, time.monotonic() - start)
+            return status
+
+
+def get_task_timeout(task_data):
+    """Find the configured timeout for a Task.
 
     Args:
-        task_data (str): the task json to execute
+        task_data (str): Task JSON definition.
 
     Returns:
-        str: Task status.
+        int: Seconds to wait for the Task from _TASK_TIMEOUTS_ matching the
+        Task credentials and type, otherwise _DEFAULT_TASK_TIMEOUT_.
 
     """
-    taskid = post_task(task_data, task_uri)
-
     if isinstance(task_data, str):
         json_data = json.loads(task_data)
     else:
@@ -147,5 +196,165 @@ def wait_for_task(task_data, task_uri='/tasks'):
     timeout = TASK_TIMEOUTS.get(env, dict()).get(task_type, DEFAULT_TASK_TIMEOUT)
 
     LOG.debug("Task %s will timeout after %s", task_type, timeout)
+    return timeout
+
+
+def wait_for_task(task_data, task_uri='/tasks'):
+    """Run task and check the result.
+
+    Args:
+        task_data (str): the task json to execute
+
+    Returns:
+        str: Task status.
+
+    """
+    taskid = post_task(task_data, task_uri)
+
+    timeout = get_task_timeout(task_data)
 
     return check_task(taskid, timeout)
+
+
+class TaskTracker:
+    """Poll many in flight Spinnaker Tasks on a single schedule.
+
+    Tasks are submitted without blocking and a single background thread polls
+    every pending Task that is due, resolving the returned
+    :class:`concurrent.futures.Future` once the Task finishes. Each Task
+    follows its own :func:`poll_intervals` schedule.
+
+    Args:
+        wait (int, optional): Fixed seconds between polls of each Task,
+            defaults to adaptive backoff.
+
+    Examples:
+        Submit independent Tasks and wait for all of them::
+
+            tracker = TaskTracker()
+            futures = [tracker.submit(task) for task in tasks]
+            statuses = tracker.wait_all(futures)
+
+    """
+
+    def __init__(self, wait=None):
+        self.wait = wait
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.poller = None
+
+    def submit(self, task_data, task_uri='/tasks'):
+        """POST a new Task and track it.
+
+        Args:
+            task_data (str): Task JSON definition.
+            task_uri (str): Gate endpoint to POST Task to.
+
+        Returns:
+            concurrent.futures.Future: Resolves to Task status.
+
+        """
+        taskid = post_task(task_data, task_uri)
+        return self.track(taskid, timeout=get_task_timeout(task_data))
+
+    def track(self, taskid, timeout=DEFAULT_TASK_TIMEOUT):
+        """Track an existing Task.
+
+        Args:
+            taskid (str): Existing Spinnaker Task ID.
+            timeout (int, optional): Consider Task failed after given seconds.
+
+        Returns:
+            concurrent.futures.Future: Resolves to Task status, or raises
+            :obj:`foremast.exceptions.SpinnakerTaskError` when the Task fails
+            or does not finish in _timeout_.
+
+        """
+        future = Future()
+        intervals = poll_intervals(timeout=timeout, wait=self.wait)
+
+        with self.lock:
+            self.pending[taskid] = {
+                'future': future,
+                'intervals': intervals,
+                'next_poll': time.monotonic(),
+                'polls': 0,
+                'timeout': timeout,
+            }
+
+            if self.poller is None:
+                self.poller = threading.Thread(target=self._poll, name='foremast-task-tracker', daemon=True)
+                self.poller.start()
+
+        return future
+
+    def wait_all(self, futures=None):
+        """Block until Tasks finish.
+
+        Args:
+            futures (list, optional): Futures from :meth:`submit` or
+                :meth:`track`, defaults to all pending Tasks.
+
+        Returns:
+            list: Task statuses in the order of _futures_.
+
+        Raises:
+            :obj:`foremast.exceptions.SpinnakerTaskError`: First Task that
+                failed.
+
+        """
+        if futures is None:
+            with self.lock:
+                futures = [task['future'] for task in self.pending.values()]
+
+        return [future.result() for future in futures]
+
+    def _poll(self):
+        """Check due Tasks until none remain."""
+        while True:
+            with self.lock:
+                if not self.pending:
+                    self.poller = None
+                    return
+                pending = dict(self.pending)
+
+            now = time.monotonic()
+            for taskid, task in pending.items():
+                if task['next_poll'] > now:
+                    continue
+
+                task['polls'] += 1
+                try:
+                    status = _check_task(taskid)
+                except (AssertionError, ValueError):
+                    pause = next(task['intervals'], None)
+                    if pause is None:
+                        error = SpinnakerTaskInconclusiveError('Task failed to complete in {0} seconds: {1}'.format(
+                            task['timeout'], taskid))
+                        self._resolve(taskid, task, exception=error)
+                    else:
+                        task['next_poll'] = time.monotonic() + pause
+                except Exception as error:  # pylint: disable=broad-except
+                    self._resolve(taskid, task, exception=error)
+                else:
+                    self._resolve(taskid, task, result=status)
+
+            with self.lock:
+                next_poll = min((task['next_poll'] for task in self.pending.values()), default=now)
+            time.sleep(max(next_poll - time.monotonic(), 0))
+
+    def _resolve(self, taskid, task, result=None, exception=None):
+        """Stop tracking _taskid_ and set the outcome on its Future."""
+        with self.lock:
+            self.pending.pop(taskid, None)
+
+        LOG.info('Task %s resolved after %d polls', taskid, task['polls'])
+
+        future = task['future']
+        if future.done():
+            return
+
+        if exception:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
@@ -14,34 +14,61 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 """Render Jinja2 template."""
+import functools
+import hashlib
+import json
 import logging
 import os
 import pathlib
 
 import jinja2
 
-from ..consts import TEMPLATES_PATH
+from ..consts import TEMPLATES_CACHE_PATH, TEMPLATES_PATH
 from ..exceptions import ForemastTemplateNotFound
 
 LOG = logging.getLogger(__name__)
 
 HERE = pathlib.Path(__file__).parent.absolute()
 LOCAL_TEMPLATES = HERE.joinpath('../templates/').resolve()
+JSON_DECODER = json.JSONDecoder()
+WHITESPACE = ' \t\n\r'
 
 
-def get_template_object(template_file=''):
-    """Retrieve template.
+@functools.lru_cache(maxsize=None)
+def get_jinja_environment(template_paths):
+    """Get Jinja2 Environment for _template_paths_.
+
+    Environments are reused so parsed templates stay in memory. Compiled
+    templates are also kept in a :class:`jinja2.FileSystemBytecodeCache` so
+    other processes skip compiling them.
 
     Args:
-        template_file (str): Name of template file.
+        template_paths (tuple): Directories to search for templates.
 
     Returns:
-        jinja2.Template: Template ready to render.
+        jinja2.Environment: Environment loading from _template_paths_.
+
+    """
+    if TEMPLATES_CACHE_PATH:
+        cache_path = pathlib.Path(TEMPLATES_CACHE_PATH).expanduser()
+        cache_path.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(directory=str(cache_path))
+    else:
+        bytecode_cache = jinja2.FileSystemBytecodeCache()
+
+    LOG.debug('New Jinja2 Environment for %s', template_paths)
+    return jinja2.Environment(loader=jinja2.FileSystemLoader(list(template_paths)), bytecode_cache=bytecode_cache)
+
+
+def get_template_paths():
+    """Get directories to search for templates, in priority order.
+
+    Returns:
+        tuple: External template directory, when configured, then the
+        templates shipped with Foremast.
 
     Raises:
         AssertionError: Configured path for templates does not exist.
-        :obj:`foremast.exceptions.ForemastTemplateNotFound`: Requested template
-            is not available.
 
     """
     jinja_template_paths_obj = []
@@ -52,9 +79,48 @@ def get_template_object(template_file=''):
         jinja_template_paths_obj.append(external_templates)
 
     jinja_template_paths_obj.append(LOCAL_TEMPLATES)
-    jinja_template_paths = [str(path) for path in jinja_template_paths_obj]
+    return tuple(str(path) for path in jinja_template_paths_obj)
+
+
+@functools.lru_cache(maxsize=None)
+def get_templates_digest(template_paths=None):
+    """Hash every template that could be rendered.
+
+    Args:
+        template_paths (tuple, optional): Directories to hash, defaults to
+            :func:`get_template_paths`.
+
+    Returns:
+        str: SHA-256 hex digest of template names and contents.
+
+    """
+    digest = hashlib.sha256()
+
+    for template_path in template_paths or get_template_paths():
+        root = pathlib.Path(template_path)
+        for template in sorted(path for path in root.rglob('*') if path.is_file()):
+            digest.update(str(template.relative_to(root)).encode())
+            digest.update(template.read_bytes())
+
+    return digest.hexdigest()
+
+
+def get_template_object(template_file=''):
+    """Retrieve template.
+
+    Args:
+        template_file (str): Name of template file.
+
+    Returns:
+        jinja2.Template: Template ready to render.
 
-    jinjaenv = jinja2.Environment(loader=jinja2.FileSystemLoader(jinja_template_paths))
+    Raises:
+        AssertionError: Configured path for templates does not exist.
+        :obj:`foremast.exceptions.ForemastTemplateNotFound`: Requested template
+            is not available.
+
+    """
+    jinjaenv = get_jinja_environment(get_template_paths())
 
     try:
         template = jinjaenv.get_template(template_file)
@@ -88,3 +154,64 @@ def get_template(template_file='', **kwargs):
     LOG.debug('Rendered JSON:\n%s', rendered_json)
 
     return rendered_json
+
+
+def decode_json_values(rendered_json=''):
+    """Decode one or more comma separated JSON values in a single pass.
+
+    Args:
+        rendered_json (str): JSON text, e.g. ``{"a": 1}, {"b": 2}``.
+
+    Returns:
+        list: Decoded values in order, empty for whitespace only text.
+
+    Raises:
+        ValueError: Text is not valid JSON.
+
+    """
+    values = []
+    end = len(rendered_json)
+    index = 0
+
+    while True:
+        while index < end and rendered_json[index] in WHITESPACE:
+            index += 1
+
+        if index >= end and not values:
+            return values
+
+        value, index = JSON_DECODER.raw_decode(rendered_json, index)
+        values.append(value)
+
+        while index < end and rendered_json[index] in WHITESPACE:
+            index += 1
+
+        if index >= end:
+            return values
+
+        if rendered_json[index] != ',':
+            raise ValueError('Expecting "," delimiter: char {0}'.format(index))
+        index += 1
+
+
+def get_template_data(template_file='', **kwargs):
+    """Render a JSON template into native Python objects.
+
+    Templates rendering several comma separated JSON values, like IAM Policy
+    statements, are returned as a list of those values.
+
+    Args:
+        template_file (str): name of the template file
+        kwargs: Keywords to use for rendering the Jinja2 template.
+
+    Returns:
+        dict: Rendered template data, or list for templates rendering many
+        values, no values, or a JSON array.
+
+    """
+    rendered_json = get_template(template_file=template_file, **kwargs)
+    values = decode_json_values(rendered_json)
+
+    if len(values) == 1:
+        return values[0]
+    return values
@@ -16,10 +16,9 @@
 """Get VPC ID."""
 import logging
 
-import requests
-
-from ..consts import API_URL, GATE_CA_BUNDLE, GATE_CLIENT_CERT
+from ..consts import API_URL
 from ..exceptions import SpinnakerVPCIDNotFound, SpinnakerVPCNotFound
+from .gate import GATE_CACHE, gate_request
 
 LOG = logging.getLogger(__name__)
 
@@ -42,12 +41,16 @@ def get_vpc_id(account, region):
 
     """
     url = '{0}/vpcs'.format(API_URL)
-    response = requests.get(url, verify=GATE_CA_BUNDLE, cert=GATE_CLIENT_CERT)
 
-    if not response.ok:
-        raise SpinnakerVPCNotFound(response.text)
+    def load_vpcs():
+        response = gate_request(uri=url)
+
+        if not response.ok:
+            raise SpinnakerVPCNotFound(response.text)
+
+        return response.json()
 
-    vpcs = response.json()
+    vpcs = GATE_CACHE.get(url, load_vpcs)
 
     for vpc in vpcs:
         LOG.debug('VPC: %(name)s, %(account)s, %(region)s => %(id)s', vpc)
@@ -1,12 +1,12 @@
 """Test API Gateway functions."""
 from unittest import mock
 
-from foremast.awslambda.api_gateway_event.api_gateway_event import APIGateway
+from foremast.awslambda.api_gateway_event.api_gateway_event import APIGateway, APIGatewayIndex
 
 TEST_RULES = {'api_name': 1, 'method': 'PUT'}
 
 
-@mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.boto3')
+@mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_boto_client')
 @mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_details')
 @mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_env_credential')
 @mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_properties')
@@ -16,7 +16,7 @@ def test_apigateway(get_properties, get_env_credential, get_details, boto3):
     assert test
 
 
-@mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.boto3')
+@mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_boto_client')
 @mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_details')
 @mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_env_credential')
 @mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_properties')
@@ -27,3 +27,46 @@ def test_create_resource(get_properties, get_env_credential, get_details, boto3)
     test.create_resource()
 
     test.client.create_resource.assert_called_with(restApiId='', parentId='', pathPart='')
+
+
+@mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_boto_client')
+def test_apigateway_index(boto3):
+    """Paginated listings are indexed once and updated with new items."""
+    pages = {
+        'get_rest_apis': [{'items': [{'name': 'api1', 'id': 'a1'}]}, {'items': [{'name': 'api2', 'id': 'a2'}]}],
+        'get_resources': [{'items': [{'path': '/', 'id': 'root'}, {'path': '/path', 'id': 'r1'}]}],
+        'get_api_keys': [{'items': []}],
+    }
+    client = boto3.return_value
+    client.get_paginator.side_effect = lambda operation: mock.Mock(paginate=mock.Mock(return_value=pages[operation]))
+
+    index = APIGatewayIndex(env='dev', region='us-east-1')
+    assert index.rest_apis() == {'api1': 'a1', 'api2': 'a2'}
+    assert index.resources('a2') == {'/': 'root', '/path': 'r1'}
+    index.add_api_key('app', 'key1')
+    index.add_resource('a2', '/new', 'r2')
+
+    assert index.api_keys() == {'app': 'key1'}
+    assert index.resources('a2')['/new'] == 'r2'
+    assert client.get_paginator.call_count == 3
+
+
+@mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_boto_client')
+@mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_details')
+@mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_env_credential')
+@mock.patch('foremast.awslambda.api_gateway_event.api_gateway_event.get_properties')
+def test_apigateway_shared_index(get_properties, get_env_credential, get_details, boto3):
+    """Triggers sharing an index find the API and resources created before."""
+    client = boto3.return_value
+    client.create_rest_api.return_value = {'id': 'new_api'}
+    client.create_resource.return_value = {'id': 'new_resource'}
+    rules = {'api_name': 'api', 'method': 'PUT', 'resource': '/path'}
+    index = APIGatewayIndex(env='dev', region='us-east-1')
+
+    first = APIGateway(env='dev', region='us-east-1', rules=rules, api_index=index)
+    first.create_resource(first.parent_id)
+    second = APIGateway(env='dev', region='us-east-1', rules=dict(rules, method='GET'), api_index=index)
+
+    assert second.api_id == 'new_api'
+    assert second.resource_id == 'new_resource'
+    assert client.create_rest_api.call_count == 1
@@ -0,0 +1,32 @@
+"""Shared test fixtures."""
+from unittest import mock
+
+import pytest
+
+from foremast.utils import GATE_CACHE, HOSTED_ZONE_CACHE, LAMBDA_ARN_CACHE, SNS_TOPIC_CACHE, boto_clients
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test without cached Gate responses or AWS lookups."""
+    caches = (GATE_CACHE, HOSTED_ZONE_CACHE, LAMBDA_ARN_CACHE, SNS_TOPIC_CACHE)
+    for cache in caches:
+        cache.invalidate()
+    yield
+    for cache in caches:
+        cache.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def clear_gitlab_server():
+    """Create a new GitLab client in every test, so mocks apply."""
+    with mock.patch('foremast.utils.lookups.GITLAB_SERVER', None):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_boto_clients():
+    """Create new boto3 clients in every test, so mocks apply."""
+    boto_clients.clear_boto_clients()
+    yield
+    boto_clients.clear_boto_clients()
@@ -20,7 +20,7 @@ TEST_PROPERTIES = {
 }
 
 
-@mock.patch('foremast.datapipeline.datapipeline.boto3.Session.client')
+@mock.patch('foremast.datapipeline.datapipeline.get_boto_client')
 @mock.patch('foremast.datapipeline.datapipeline.get_details')
 @mock.patch('foremast.datapipeline.datapipeline.get_properties')
 def test_create_datapipeline(mock_get_properties, mock_get_details, mock_boto3):
@@ -36,7 +36,7 @@ def test_create_datapipeline(mock_get_properties, mock_get_details, mock_boto3):
     assert dp.pipeline_id == '1234'
 
 
-@mock.patch('foremast.datapipeline.datapipeline.boto3.Session.client')
+@mock.patch('foremast.datapipeline.datapipeline.get_boto_client')
 @mock.patch('foremast.datapipeline.datapipeline.get_details')
 @mock.patch('foremast.datapipeline.datapipeline.get_properties')
 def test_good_set_pipeline_definition(mock_get_properties, mock_get_details, mock_boto3):
@@ -51,7 +51,7 @@ def test_good_set_pipeline_definition(mock_get_properties, mock_get_details, moc
     assert good_dp.set_pipeline_definition()
 
 
-@mock.patch('foremast.datapipeline.datapipeline.boto3.Session.client')
+@mock.patch('foremast.datapipeline.datapipeline.get_boto_client')
 @mock.patch('foremast.datapipeline.datapipeline.get_details')
 @mock.patch('foremast.datapipeline.datapipeline.get_properties')
 def test_bad_set_pipeline_definition(mock_get_properties, mock_get_details, mock_boto3):
@@ -68,7 +68,7 @@ def test_bad_set_pipeline_definition(mock_get_properties, mock_get_details, mock
         bad_dp.set_pipeline_definition()
 
 
-@mock.patch('foremast.datapipeline.datapipeline.boto3.Session.client')
+@mock.patch('foremast.datapipeline.datapipeline.get_boto_client')
 @mock.patch('foremast.datapipeline.datapipeline.get_details')
 @mock.patch('foremast.datapipeline.datapipeline.get_properties')
 def test_get_pipeline_id(mock_get_properties, mock_get_details, mock_boto3):
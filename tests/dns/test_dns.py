@@ -16,16 +16,20 @@
 
 from unittest.mock import MagicMock, patch
 
+from boto3.exceptions import botocore
+
 from foremast import dns
+from foremast.utils import dns as dns_utils
 
 
+@patch('foremast.dns.create_dns.DnsChangePlan')
 @patch('foremast.dns.create_dns.update_dns_zone_record')
 @patch('foremast.dns.create_dns.get_dns_zone_ids')
 @patch('foremast.dns.create_dns.find_elb')
 @patch('foremast.dns.create_dns.get_properties')
 @patch('foremast.dns.create_dns.DOMAIN', 'example.com')
 @patch('foremast.dns.create_dns.get_details')
-def test_dns_creation(mock_get_details, mock_properties, mock_find_elb, mock_dns_zones, mock_update_dns):
+def test_dns_creation(mock_get_details, mock_properties, mock_find_elb, mock_dns_zones, mock_update_dns, mock_plan):
     # mocked data
     hosted_zones = [500, 501]
     dns_elb = {'elb': 'myapp.dev1.example.com'}
@@ -52,5 +56,56 @@ def test_dns_creation(mock_get_details, mock_properties, mock_find_elb, mock_dns
         'dns_ttl': mock_properties.return_value['dns']['ttl']
     }
 
-    mock_update_dns.assert_called_with('dev1', 501, **sent_update_data)
+    mock_update_dns.assert_called_with('dev1', 501, plan=mock_plan.return_value, **sent_update_data)
     assert mock_update_dns.call_count == 2
+    mock_plan.return_value.apply.assert_called_once_with()
+
+
+@patch('foremast.utils.dns.get_boto_client')
+def test_dns_change_plan(mock_client):
+    """Changes are sent once per Hosted Zone, replacing repeats of a record."""
+    client = mock_client.return_value
+    client.get_hosted_zone.return_value = {'HostedZone': {'Name': 'dev1.example.com.'}}
+    cname = {'Name': 'myapp.dev1.example.com.', 'Type': 'CNAME'}
+    dns_kwargs = {'dns_name': 'myapp.dev1.example.com', 'dns_name_aws': 'elb.example.com', 'dns_ttl': 60}
+
+    plan = dns_utils.DnsChangePlan(env='dev1')
+    for zone_id in ('zone1', 'zone2'):
+        dns_utils.update_dns_zone_record('dev1', zone_id, plan=plan, **dns_kwargs)
+    dns_utils.update_dns_zone_record('dev1', 'zone1', plan=plan, **dict(dns_kwargs, dns_ttl=30))
+    plan.delete('zone1', cname)
+    client.change_resource_record_sets.assert_not_called()
+
+    responses = plan.apply()
+
+    assert sorted(responses) == ['zone1', 'zone2']
+    assert client.change_resource_record_sets.call_count == 2
+    assert client.get_hosted_zone.call_count == 2
+    zone1_changes = client.change_resource_record_sets.call_args_list[0][1]['ChangeBatch']['Changes']
+    assert [change['Action'] for change in zone1_changes] == ['DELETE']
+    assert zone1_changes[0]['ResourceRecordSet'] == cname
+
+    plan.apply()
+    assert client.change_resource_record_sets.call_count == 2
+
+
+@patch('foremast.utils.dns.delete_existing_cname')
+@patch('foremast.utils.dns.get_boto_client')
+def test_failover_dns_record_lookup_error(mock_client, mock_delete_cname):
+    """Route 53 errors looking up the old CNAME are logged, not raised."""
+    mock_client.return_value.get_hosted_zone.return_value = {'HostedZone': {'Name': 'dev1.example.com.'}}
+    mock_delete_cname.side_effect = botocore.exceptions.ClientError({'Error': {}}, 'ListResourceRecordSets')
+    plan = dns_utils.DnsChangePlan(env='dev1')
+
+    dns_utils.update_failover_dns_record(
+        'dev1',
+        'zone1',
+        plan=plan,
+        dns_name='myapp.dev1.example.com',
+        dns_ttl=60,
+        elb_aws_dns='elb.example.com',
+        elb_dns_zone_id='elbzone',
+        failover_state='primary',
+        primary_region='us-east-1')
+
+    assert not plan.apply()
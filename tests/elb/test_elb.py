@@ -163,7 +163,7 @@ def test_elb_format_cert_name():
     compiled_cert = 'arn:aws:iam::123456789012:server-certificate/mycert1'
     assert compiled_cert == format_cert_name(account='123456789012', certificate='mycert1')
 
-@mock.patch("foremast.elb.format_listeners.get_template")
+@mock.patch("foremast.utils.templates.get_template")
 def test_elb_cert_name_v1(rendered_template):
     """Tests the format_cert_name method when used with v1 template"""
     rendered_template.return_value = SAMPLE_TLSCERT_V1_JSON
@@ -178,7 +178,7 @@ def test_elb_cert_name_v1(rendered_template):
     assert acm_region_cert == format_cert_name(env='prod', account='210987654321', region='us-west-2', certificate='wildcard.us-west-2.prod.example.com')
 
 
-@mock.patch("foremast.elb.format_listeners.get_template")
+@mock.patch("foremast.utils.templates.get_template")
 def test_elb_cert_name_v2(rendered_template):
     """Tests the format_cert_name method when used with v2 template"""
     rendered_template.return_value = SAMPLE_TLSCERT_V2_JSON
@@ -249,7 +249,7 @@ def test_elb_make_elb_json(mock_get_properties, mock_get_subnets, mock_format_li
     assert not elb_json['job'][0]['isInternal']
 
 
-@mock.patch('foremast.elb.create_elb.boto3.session.Session')
+@mock.patch('foremast.elb.create_elb.get_boto_client')
 @mock.patch('foremast.elb.create_elb.get_properties')
 def test_elb_add_listener_policy(mock_get_properties, mock_boto3_session):
     test_app = 'myapp'
@@ -266,7 +266,7 @@ def test_elb_add_listener_policy(mock_get_properties, mock_boto3_session):
             ],
         }],
     }
-    client = mock_boto3_session.return_value.client.return_value
+    client = mock_boto3_session.return_value
 
     elb = SpinnakerELB(app='myapp', env='dev', region='us-east-1')
     elb.add_listener_policy(json.dumps(json_data))
@@ -274,7 +274,7 @@ def test_elb_add_listener_policy(mock_get_properties, mock_boto3_session):
         LoadBalancerName=test_app, LoadBalancerPort=test_port, PolicyNames=test_policy_list)
 
 
-@mock.patch('foremast.elb.create_elb.boto3.session.Session')
+@mock.patch('foremast.elb.create_elb.get_boto_client')
 @mock.patch('foremast.elb.create_elb.get_properties')
 def test_elb_add_backend_policy(mock_get_properties, mock_boto3_session):
     test_app = 'myapp'
@@ -291,7 +291,7 @@ def test_elb_add_backend_policy(mock_get_properties, mock_boto3_session):
             ],
         }],
     }
-    client = mock_boto3_session.return_value.client.return_value
+    client = mock_boto3_session.return_value
 
     elb = SpinnakerELB(app='myapp', env='dev', region='us-east-1')
     elb.add_backend_policy(json.dumps(json_data))
@@ -25,7 +25,7 @@ LAMBDA_TEMPLATE_NAME = 'infrastructure/iam/trust/lambda_role.json.j2'
 
 
 @mock.patch('foremast.iam.create_iam.attach_profile_to_role')
-@mock.patch('foremast.iam.create_iam.boto3.session.Session')
+@mock.patch('foremast.iam.create_iam.get_boto_client')
 @mock.patch('foremast.iam.create_iam.construct_policy')
 @mock.patch('foremast.iam.create_iam.get_details')
 @mock.patch('foremast.iam.create_iam.get_properties')
@@ -39,7 +39,7 @@ def test_create_iam_resources(resource_action, get_properties, get_details, cons
     assert create_iam_resources(env='narnia', app='lion/aslan')
 
     assert resource_action.call_count == 6
-    session.assert_called_with(profile_name='narnia')
+    session.assert_called_with('iam', profile='narnia')
     get_details.assert_called_with(env='narnia', app='lion/aslan')
     get_properties.assert_called_with(env='pipeline')
     construct_policy.assert_called_with(
@@ -47,7 +47,7 @@ def test_create_iam_resources(resource_action, get_properties, get_details, cons
 
 
 @mock.patch('foremast.iam.create_iam.attach_profile_to_role')
-@mock.patch('foremast.iam.create_iam.boto3.session.Session')
+@mock.patch('foremast.iam.create_iam.get_boto_client')
 @mock.patch('foremast.iam.create_iam.construct_policy')
 @mock.patch('foremast.iam.create_iam.get_details')
 @mock.patch('foremast.iam.create_iam.get_properties')
@@ -24,7 +24,7 @@ GENERATED_IAM = {
 }
 
 
-@mock.patch('foremast.awslambda.awslambda.boto3')
+@mock.patch('foremast.awslambda.awslambda.get_boto_client')
 @mock.patch('foremast.awslambda.awslambda.get_details')
 @mock.patch('foremast.awslambda.awslambda.get_properties')
 @mock.patch('foremast.awslambda.awslambda.get_role_arn')
@@ -40,7 +40,7 @@ def test_role_arn(mock_get_role_arn, mock_get_properties, mock_get_details, mock
     mock_get_role_arn.assert_called_with(generated['lambda_role'], mock.ANY, mock.ANY)
 
 
-@mock.patch('foremast.awslambda.awslambda.boto3')
+@mock.patch('foremast.awslambda.awslambda.get_boto_client')
 @mock.patch('foremast.awslambda.awslambda.get_details')
 @mock.patch('foremast.awslambda.awslambda.get_properties')
 @mock.patch('foremast.awslambda.awslambda.get_role_arn')
@@ -57,7 +57,7 @@ def test_role_arn_none(mock_get_role_arn, mock_get_properties, mock_get_details,
     mock_get_role_arn.assert_called_with(GENERATED_IAM['lambda_role'], mock.ANY, mock.ANY)
 
 
-@mock.patch('foremast.awslambda.awslambda.boto3')
+@mock.patch('foremast.awslambda.awslambda.get_boto_client')
 @mock.patch('foremast.awslambda.awslambda.get_details')
 @mock.patch('foremast.awslambda.awslambda.get_properties')
 @mock.patch('foremast.awslambda.awslambda.get_role_arn')
@@ -2,7 +2,10 @@
 import copy
 from unittest import mock
 
+import pytest
+
 from foremast.awslambda.awslambdaevent import LambdaEvent
+from foremast.exceptions import LambdaEventCreationFailed
 
 TRIGGERS_MULTIPLE_FILTER = [
     {
@@ -61,8 +64,8 @@ def get_properties_with_triggers(triggers):
 
 @mock.patch('foremast.awslambda.s3_event.s3_event.add_lambda_permissions')
 @mock.patch('foremast.awslambda.s3_event.s3_event.get_lambda_alias_arn')
-@mock.patch('foremast.awslambda.s3_event.s3_event.boto3')
-@mock.patch('foremast.awslambda.awslambdaevent.remove_all_lambda_permissions')
+@mock.patch('foremast.awslambda.s3_event.s3_event.get_boto_client')
+@mock.patch('foremast.awslambda.awslambdaevent.LambdaPermissions')
 @mock.patch('foremast.awslambda.awslambdaevent.create_s3_event')
 @mock.patch('foremast.awslambda.awslambdaevent.get_properties')
 def test_create_s3_event_multiple_filters(mock_get_properties, mock_create_s3_event, mock_remove_perms, mock_boto3, mock_arn, mock_perms):
@@ -75,12 +78,13 @@ def test_create_s3_event_multiple_filters(mock_get_properties, mock_create_s3_ev
     events = LambdaEvent(app='test_app', env='test_env', region='us-east-1', prop_path='other')
     events.create_lambda_events()
 
-    mock_create_s3_event.assert_called_with(app_name='test_app', env='test_env', region='us-east-1', bucket='my.shared.bucket', triggers=triggers)
+    mock_create_s3_event.assert_called_with(app_name='test_app', env='test_env', region='us-east-1', bucket='my.shared.bucket', triggers=triggers, permissions=mock_remove_perms.return_value)
+    mock_remove_perms.return_value.remove_unused.assert_called_once_with()
 
 @mock.patch('foremast.awslambda.s3_event.s3_event.add_lambda_permissions')
 @mock.patch('foremast.awslambda.s3_event.s3_event.get_lambda_alias_arn')
-@mock.patch('foremast.awslambda.s3_event.s3_event.boto3')
-@mock.patch('foremast.awslambda.awslambdaevent.remove_all_lambda_permissions')
+@mock.patch('foremast.awslambda.s3_event.s3_event.get_boto_client')
+@mock.patch('foremast.awslambda.awslambdaevent.LambdaPermissions')
 @mock.patch('foremast.awslambda.awslambdaevent.create_s3_event')
 @mock.patch('foremast.awslambda.awslambdaevent.get_properties')
 def test_create_s3_event_multiple_buckets(mock_get_properties, mock_create_s3_event, mock_remove_perms, mock_boto3, mock_arn, mock_perms):
@@ -95,8 +99,52 @@ def test_create_s3_event_multiple_buckets(mock_get_properties, mock_create_s3_ev
     events.create_lambda_events()
 
     s3_calls = [
-        mock.call(app_name='test_app', env='test_env', region='us-east-1', bucket='my.shared.bucket', triggers=TRIGGERS_BUCKET_A),
-        mock.call(app_name='test_app', env='test_env', region='us-east-1', bucket='my.other.shared.bucket', triggers=TRIGGERS_BUCKET_B)
+        mock.call(app_name='test_app', env='test_env', region='us-east-1', bucket='my.shared.bucket', triggers=TRIGGERS_BUCKET_A, permissions=mock_remove_perms.return_value),
+        mock.call(app_name='test_app', env='test_env', region='us-east-1', bucket='my.other.shared.bucket', triggers=TRIGGERS_BUCKET_B, permissions=mock_remove_perms.return_value)
     ]
 
     mock_create_s3_event.assert_has_calls(s3_calls, any_order=True)
+
+
+@mock.patch('foremast.awslambda.awslambdaevent.create_sns_event')
+@mock.patch('foremast.awslambda.awslambdaevent.LambdaPermissions')
+@mock.patch('foremast.awslambda.awslambdaevent.create_s3_event')
+@mock.patch('foremast.awslambda.awslambdaevent.get_properties')
+def test_create_events_collects_errors(mock_get_properties, mock_create_s3_event, mock_permissions,
+                                       mock_create_sns_event):
+    """Failed triggers are reported together and keep existing permissions."""
+    triggers = TRIGGERS_BUCKET_A + TRIGGERS_BUCKET_B + [{'type': 'sns', 'topic': 'my_topic'}]
+    mock_get_properties.return_value = get_properties_with_triggers(triggers)
+    mock_create_s3_event.side_effect = [ValueError('bucket broken'), None]
+
+    events = LambdaEvent(app='test_app', env='test_env', region='us-east-1', prop_path='other')
+    with pytest.raises(LambdaEventCreationFailed, match='bucket broken'):
+        events.create_lambda_events()
+
+    assert mock_create_s3_event.call_count == 2
+    mock_create_sns_event.assert_called_once_with(
+        app_name='test_app', env='test_env', region='us-east-1', rules=triggers[2],
+        permissions=mock_permissions.return_value)
+    mock_permissions.return_value.remove_unused.assert_not_called()
+
+
+@mock.patch('foremast.awslambda.awslambdaevent.APIGatewayIndex')
+@mock.patch('foremast.awslambda.awslambdaevent.APIGateway')
+@mock.patch('foremast.awslambda.awslambdaevent.LambdaPermissions')
+@mock.patch('foremast.awslambda.awslambdaevent.get_properties')
+def test_create_api_gateway_events_deploy_once(mock_get_properties, mock_permissions, mock_apigateway, mock_index):
+    """Triggers on the same REST API deploy it once."""
+    triggers = [{'type': 'api-gateway', 'api_name': 'api', 'method': method} for method in ('GET', 'PUT')]
+    mock_get_properties.return_value = get_properties_with_triggers(triggers)
+    gateways = [mock.Mock(api_id='api_id'), mock.Mock(api_id='api_id')]
+    mock_apigateway.side_effect = gateways
+
+    events = LambdaEvent(app='test_app', env='test_env', region='us-east-1', prop_path='other')
+    events.create_lambda_events()
+
+    for gateway in gateways:
+        gateway.setup_lambda_api.assert_called_once_with(deploy=False)
+    gateways[0].deploy_api.assert_called_once_with()
+    gateways[1].deploy_api.assert_not_called()
+    for call in mock_apigateway.call_args_list:
+        assert call[1]['api_index'] is mock_index.return_value
@@ -17,7 +17,9 @@
 from unittest import mock
 
 import pytest
+from foremast.exceptions import SpinnakerPipelineCreationFailed
 from foremast.pipeline import SpinnakerPipeline
+from foremast.utils.pipelines import PipelineIndex
 
 TEST_FORMAT_GENERATOR = mock.Mock()
 TEST_SETTINGS = {
@@ -64,14 +66,15 @@ def spinnaker_pipeline(mock_os, mock_get_details, mock_get_prop):
     return pipelineObj
 
 
+@mock.patch.object(SpinnakerPipeline, 'get_existing_pipelines')
 @mock.patch('foremast.pipeline.create_pipeline.clean_pipelines')
 @mock.patch.object(SpinnakerPipeline, 'render_wrapper')
-@mock.patch('foremast.pipeline.create_pipeline.get_subnets')
+@mock.patch('foremast.pipeline.create_pipeline.get_subnet_index')
 @mock.patch('foremast.pipeline.create_pipeline.construct_pipeline_block')
 @mock.patch('foremast.pipeline.create_pipeline.renumerate_stages')
 @mock.patch.object(SpinnakerPipeline, 'post_pipeline')
 def test_create_pipeline_ec2(mock_post, mock_renumerate, mock_construct, mock_subnets, mock_wrapper, mock_clean,
-                             spinnaker_pipeline):
+                             mock_existing, spinnaker_pipeline):
     """test pipeline creation if ec2 pipeline."""
     test_block_data = {
         "env": "dev",
@@ -84,8 +87,8 @@ def test_create_pipeline_ec2(mock_post, mock_renumerate, mock_construct, mock_su
             'us-east-1': ['us-east-1d', 'us-east-1a', 'us-east-1e']
         }
     }
-    mock_subnets.return_value = {'dev': {'us-east-1': ['us-east-1d', 'us-east-1a', 'us-east-1e']}}
-    mock_construct.return_value = '{"test": "stuff"}'
+    mock_subnets.return_value.azs.return_value = ['us-east-1d', 'us-east-1a', 'us-east-1e']
+    mock_construct.return_value = {"test": "stuff"}
     mock_wrapper.return_value = {'stages': []}
     created = spinnaker_pipeline.create_pipeline()
 
@@ -93,3 +96,70 @@ def test_create_pipeline_ec2(mock_post, mock_renumerate, mock_construct, mock_su
     mock_post.assert_called_with({'stages': ['test']})
 
     assert created == True
+
+
+@mock.patch.object(SpinnakerPipeline, 'get_existing_pipelines')
+@mock.patch('foremast.pipeline.create_pipeline.clean_pipelines')
+@mock.patch.object(SpinnakerPipeline, 'render_wrapper')
+@mock.patch('foremast.pipeline.create_pipeline.get_subnet_index')
+@mock.patch('foremast.pipeline.create_pipeline.construct_pipeline_block')
+@mock.patch('foremast.pipeline.create_pipeline.renumerate_stages')
+@mock.patch.object(SpinnakerPipeline, 'post_pipeline')
+def test_create_pipeline_concurrent(mock_post, mock_renumerate, mock_construct, mock_subnets, mock_wrapper,
+                                    mock_clean, mock_existing, spinnaker_pipeline):
+    """Regions render and post in parallel, reporting every failed Region."""
+    settings = dict(TEST_SETTINGS, dev=dict(TEST_SETTINGS['dev'], regions=['us-east-1', 'us-west-2']))
+    settings['dev']['us-west-2'] = settings['dev']['us-east-1']
+    spinnaker_pipeline.settings = settings
+    spinnaker_pipeline.generated = mock.Mock(data={})
+    spinnaker_pipeline.workers = 2
+
+    mock_construct.return_value = {"test": "stuff"}
+    mock_wrapper.side_effect = lambda region, generated: {'name': generated.data['region'], 'stages': []}
+
+    assert spinnaker_pipeline.create_pipeline()
+    assert mock_post.call_count == 2
+    assert {call[0][0]['name'] for call in mock_post.call_args_list} == {'us-east-1', 'us-west-2'}
+    regions = {call[1]['generated'].data['region'] for call in mock_construct.call_args_list}
+    assert regions == {'us-east-1', 'us-west-2'}
+    assert spinnaker_pipeline.generated.data == {}
+
+    def post(pipeline):
+        if pipeline['name'] == 'us-west-2':
+            raise ValueError('Gate rejected Pipeline')
+
+    mock_post.side_effect = post
+    with pytest.raises(SpinnakerPipelineCreationFailed, match='us-west-2'):
+        spinnaker_pipeline.create_pipeline()
+    assert mock_post.call_count == 4
+
+
+@mock.patch('foremast.pipeline.create_pipeline.get_pipeline_index')
+def test_compare_with_existing_snapshot(mock_index, spinnaker_pipeline):
+    """Existing Pipelines are fetched once for every Region."""
+    mock_index.return_value = PipelineIndex([
+        {'application': 'appgroup', 'name': 'appgroup [us-east-1]', 'id': 'east'},
+        {'application': 'appgroup', 'name': 'appgroup [us-west-2]', 'id': 'west'},
+    ])
+
+    assert spinnaker_pipeline.compare_with_existing(region='us-east-1') == 'east'
+    assert spinnaker_pipeline.compare_with_existing(region='us-west-2') == 'west'
+    assert spinnaker_pipeline.compare_with_existing(region='eu-west-1') is None
+    mock_index.assert_called_once_with(app='appgroup')
+
+
+@mock.patch('foremast.pipeline.create_pipeline.gate_request')
+@mock.patch('foremast.pipeline.create_pipeline.get_pipeline_index')
+def test_post_pipeline_unchanged(mock_index, mock_gate_request, spinnaker_pipeline):
+    """Pipelines matching the stored config are not posted."""
+    stored = {'application': 'appgroup', 'name': 'appgroup [us-east-1]', 'id': 'east', 'stages': [], 'updateTs': '1'}
+    mock_index.return_value = PipelineIndex([stored])
+
+    assert not spinnaker_pipeline.post_pipeline(
+        {'application': 'appgroup', 'name': 'appgroup [us-east-1]', 'id': 'east', 'stages': []})
+    assert spinnaker_pipeline.skipped_pipelines == 1
+    assert not mock_gate_request.called
+
+    assert spinnaker_pipeline.post_pipeline(
+        {'application': 'appgroup', 'name': 'appgroup [us-east-1]', 'id': 'east', 'stages': [{'refId': '1'}]})
+    assert mock_gate_request.called
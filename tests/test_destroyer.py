@@ -0,0 +1,64 @@
+"""Test full Application destroy."""
+from unittest import mock
+
+import pytest
+from boto3.exceptions import botocore
+
+from foremast import destroyer
+from foremast.exceptions import DestroyFailed, SpinnakerError
+from foremast.utils.dag import Step
+
+
+def test_destroy_plan_scopes():
+    """Region independent Resources are destroyed once per environment."""
+    steps = destroyer.destroy_plan('app', envs=['dev', 'prod'], regions=['us-east-1', 'us-west-2'])
+    names = [step.name for step in steps]
+
+    assert len(names) == len(set(names)) == 14
+    assert names.count('iam:dev') == 1
+    assert 'sg:prod:us-west-2' in names
+
+    by_name = {step.name: step for step in steps}
+    assert by_name['elb:dev:us-west-2'].depends == ['dns:dev']
+    assert by_name['sg:dev:us-west-2'].depends == ['elb:dev:us-west-2']
+    assert names.index('dns:dev') < names.index('elb:dev:us-east-1') < names.index('sg:dev:us-east-1')
+
+
+@mock.patch.multiple(
+    destroyer,
+    destroy_dns=mock.DEFAULT,
+    destroy_elb=mock.DEFAULT,
+    destroy_iam=mock.DEFAULT,
+    destroy_s3=mock.DEFAULT,
+    destroy_sg=mock.DEFAULT)
+def test_destroy_all(**mocks):
+    """Expected errors are logged and the rest of the plan still runs."""
+    mocks['destroy_dns'].side_effect = botocore.exceptions.ClientError({'Error': {}}, 'ChangeResourceRecordSets')
+    mocks['destroy_elb'].side_effect = SpinnakerError('gone')
+
+    steps = destroyer.destroy_all('app', envs=['dev'], regions=['us-east-1', 'us-west-2'], workers=3)
+
+    assert all(step.status == Step.DONE for step in steps)
+    mocks['destroy_iam'].assert_called_once_with(app='app', env='dev')
+    mocks['destroy_s3'].assert_called_once_with(app='app', env='dev')
+    assert mocks['destroy_sg'].call_count == 2
+
+
+@mock.patch.multiple(
+    destroyer,
+    destroy_dns=mock.DEFAULT,
+    destroy_elb=mock.DEFAULT,
+    destroy_iam=mock.DEFAULT,
+    destroy_s3=mock.DEFAULT,
+    destroy_sg=mock.DEFAULT)
+def test_destroy_all_failures(**mocks):
+    """Unexpected errors are reported after independent Resources finish."""
+    mocks['destroy_elb'].side_effect = ValueError('broken')
+
+    with pytest.raises(DestroyFailed) as error:
+        destroyer.destroy_all('app', envs=['dev'], regions=['us-east-1'])
+
+    assert 'elb:dev:us-east-1 (broken)' in str(error.value)
+    assert 'sg:dev:us-east-1 (skipped)' in str(error.value)
+    mocks['destroy_iam'].assert_called_once_with(app='app', env='dev')
+    mocks['destroy_sg'].assert_not_called()
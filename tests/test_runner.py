@@ -18,9 +18,14 @@ import os
 from unittest import mock
 
 import pytest
+import requests
 
-from foremast.runner import ForemastRunner
+from foremast.runner import (ForemastRunner, infrastructure_steps, merge_rebuild_results, prepare_infrastructure,
+                             rebuild_app, rebuild_app_with_retries, rebuild_pipelines, write_rebuild_results)
+from foremast.__main__ import main
+from foremast.exceptions import ForemastTemplateNotFound, InfrastructureStepFailed, SpinnakerPipelineCreationFailed
 from foremast.pipeline import SpinnakerPipeline
+from foremast.utils import RebuildCheckpoint, RebuildState, select_steps
 
 CONFIGS = {
     'pipeline': {
@@ -58,3 +63,224 @@ def test_runner_create_pipeline_onetime(mock_pipelines):
     runner.configs = CONFIGS
     runner.configs['pipeline']['type'] = 'manual'
     runner.create_pipeline(onetime=True)
+
+
+@mock.patch('foremast.runner.rebuild_app')
+@mock.patch('foremast.runner.utils.get_all_apps')
+def test_runner_rebuild_pipelines_jobs(mock_get_all_apps, mock_rebuild_app, tmpdir):
+    """Applications rebuild in parallel and failures are summarized."""
+    mock_get_all_apps.return_value = [
+        {'name': 'noproject'},
+        {'name': 'app1', 'repoProjectKey': 'group1', 'repoSlug': 'app1'},
+        {'name': 'app2', 'repoProjectKey': 'group1', 'repoSlug': 'app2'},
+        {'name': 'app3', 'repoProjectKey': 'group2', 'repoSlug': 'app3'},
+    ]
+
+    def rebuild(project, repo, **_):
+        if repo == 'app2':
+            raise ValueError('bad configs')
+        return True
+
+    mock_rebuild_app.side_effect = rebuild
+    parsed = mock.Mock(
+        all=False,
+        project='group1',
+        jobs=4,
+        shard=None,
+        weighted=False,
+        results=None,
+        incremental=False,
+        force=False,
+        checkpoint=str(tmpdir.join('checkpoint.json')),
+        resume=False,
+        attempts=2,
+        retry_wait=0)
+
+    succeeded, failed, _skipped = rebuild_pipelines(mock.Mock(parsed=parsed))
+
+    assert succeeded == ['group1/app1']
+    assert list(failed) == ['group1/app2']
+    assert mock_rebuild_app.call_count == 2
+
+    checkpoint = RebuildCheckpoint(parsed.checkpoint, resume=True)
+    assert checkpoint.status('group1/app1') == checkpoint.DONE
+    assert checkpoint.apps['group1/app2']['status'] == checkpoint.FAILED
+    assert checkpoint.apps['group1/app2']['attempts'] == 1
+    assert 'bad configs' in checkpoint.apps['group1/app2']['error']
+
+    mock_rebuild_app.reset_mock()
+    parsed.resume = True
+    rebuild_pipelines(mock.Mock(parsed=parsed))
+    mock_rebuild_app.assert_called_once_with(project='group1', repo='app2', state=None, force=False)
+
+
+@mock.patch('foremast.runner.rebuild_app')
+def test_runner_rebuild_app_retries_transient(mock_rebuild_app):
+    """Only Gate and AWS errors are retried."""
+    mock_rebuild_app.side_effect = [requests.exceptions.ConnectionError('reset'), True]
+    assert rebuild_app_with_retries(project='group1', repo='app1', attempts=3)
+    assert mock_rebuild_app.call_count == 2
+
+    for error in (ForemastTemplateNotFound('pipeline.json'), SpinnakerPipelineCreationFailed('Gate rejected')):
+        mock_rebuild_app.reset_mock()
+        mock_rebuild_app.side_effect = error
+        with pytest.raises(type(error)):
+            rebuild_app_with_retries(project='group1', repo='app1', attempts=3)
+        assert mock_rebuild_app.call_count == 1
+
+
+@mock.patch('foremast.runner.rebuild_app_with_retries')
+@mock.patch('foremast.runner.utils.get_all_apps')
+def test_runner_rebuild_checkpoint_optional(mock_get_all_apps, mock_rebuild, tmpdir):
+    """Progress is only saved with --checkpoint or --resume, per shard."""
+    mock_get_all_apps.return_value = [{'name': 'app1', 'repoProjectKey': 'group1', 'repoSlug': 'app1'}]
+    parsed = mock.Mock(
+        all=False,
+        project='group1',
+        jobs=1,
+        shard=None,
+        weighted=False,
+        results=None,
+        incremental=False,
+        force=False,
+        checkpoint=None,
+        resume=False,
+        attempts=1,
+        retry_wait=0)
+
+    rebuild_pipelines(mock.Mock(parsed=parsed))
+    assert mock_rebuild.call_args[1]['checkpoint'] is None
+    assert not tmpdir.listdir()
+
+    default_path = str(tmpdir.join('checkpoint.json'))
+    parsed.resume = True
+    parsed.shard = (1, 4)
+    with mock.patch('foremast.runner.consts.REBUILD_CHECKPOINT_FILE', default_path):
+        rebuild_pipelines(mock.Mock(parsed=parsed))
+
+    assert [path.basename for path in tmpdir.listdir()] == ['checkpoint.shard-1-of-4.json']
+
+
+@mock.patch.object(ForemastRunner, 'create_pipeline')
+@mock.patch.object(ForemastRunner, 'write_configs', autospec=True)
+def test_runner_rebuild_app_isolated(mock_write_configs, mock_create_pipeline):
+    """Each rebuilt application gets its own project and working directory."""
+    assert rebuild_app(project='group2', repo='repo2')
+
+    runner = mock_write_configs.call_args[0][0]
+    assert runner.group == 'group2'
+    assert runner.repo == 'repo2'
+    assert runner.raw_path != './raw.properties'
+    assert not os.path.exists(runner.raw_path)
+    assert os.environ['PROJECT'] == 'group1'
+    mock_create_pipeline.assert_called_once_with()
+
+
+def test_runner_rebuild_results_merge(tmpdir):
+    """Shard results merge into one report noting missing shards."""
+    first = str(tmpdir.join('shard0.json'))
+    second = str(tmpdir.join('shard1.json'))
+    write_rebuild_results(first, succeeded=['group/b', 'group/a'], shard=(0, 3))
+    write_rebuild_results(second, succeeded=['group/c'], failed={'group/d': ValueError('bad')}, shard=(1, 3))
+
+    report = merge_rebuild_results([first, second])
+
+    assert report['succeeded'] == ['group/a', 'group/b', 'group/c']
+    assert report['failed'] == {'group/d': 'bad'}
+    assert report['missing_shards'] == [2]
+
+
+@mock.patch.dict(os.environ, {'RUNWAY_DIR': ''})
+@mock.patch('foremast.runner.configs.get_config_commit')
+@mock.patch.object(ForemastRunner, 'create_pipeline')
+@mock.patch.object(ForemastRunner, 'write_configs')
+def test_runner_rebuild_app_incremental(mock_write_configs, mock_create_pipeline, mock_commit, tmpdir):
+    """Applications rebuild only when the config commit changes, or forced."""
+    state = RebuildState(str(tmpdir.join('state', 'rebuild.json')))
+    mock_commit.return_value = 'abc'
+
+    assert rebuild_app(project='group2', repo='repo2', state=state)
+    assert not rebuild_app(project='group2', repo='repo2', state=RebuildState(state.path))
+    assert rebuild_app(project='group2', repo='repo2', state=state, force=True)
+
+    mock_commit.return_value = 'def'
+    assert rebuild_app(project='group2', repo='repo2', state=state)
+    assert mock_create_pipeline.call_count == 3
+
+
+def infra_runner(deploy_type='ec2', archaius=True, eureka=False):
+    """Runner with infrastructure configs and mocked steps."""
+    runner = mock.Mock(env='dev')
+    runner.configs = {
+        'pipeline': {
+            'type': deploy_type,
+        },
+        'dev': {
+            'app': {
+                'archaius_enabled': archaius,
+                'eureka_enabled': eureka,
+            },
+        },
+    }
+    return runner
+
+
+def test_runner_infrastructure_steps():
+    """Independent steps have no dependencies between them."""
+    steps = {step.name: step.depends for step in infrastructure_steps(infra_runner())}
+
+    assert steps['app'] == steps['iam'] == steps['archaius'] == []
+    assert steps['secgroups'] == ['app']
+    assert steps['elb'] == ['app', 'secgroups']
+    assert steps['dns'] == ['elb']
+    assert set(steps['slack']) == {'app', 'iam', 'archaius', 'secgroups', 'elb', 'dns'}
+
+    steps = [step.name for step in infrastructure_steps(infra_runner(deploy_type='s3', archaius=False))]
+    assert steps == ['app', 's3app', 'slack']
+
+    steps = [step.name for step in infrastructure_steps(infra_runner(deploy_type='lambda', eureka=True))]
+    assert 'awslambda' not in steps
+
+
+def test_runner_infrastructure_select():
+    """Steps can be picked by name, dropping dependencies on the rest."""
+    steps = select_steps(infrastructure_steps(infra_runner()), only=['secgroups', 'elb', 'dns'], skip=['dns'])
+
+    assert [(step.name, step.depends) for step in steps] == [('secgroups', []), ('elb', ['secgroups'])]
+
+    with pytest.raises(ValueError):
+        select_steps(infrastructure_steps(infra_runner()), skip=['lambda'])
+
+
+@mock.patch('foremast.runner.ForemastRunner')
+def test_runner_prepare_infrastructure_fail_fast(mock_runner):
+    """The first failed step stops the rest and skips cleanup."""
+    runner = mock_runner.return_value = infra_runner()
+    runner.create_secgroups.side_effect = ValueError('no VPC')
+    args = mock.Mock()
+    args.parsed.only = None
+    args.parsed.skip = ['archaius']
+    args.parsed.jobs = 1
+
+    with pytest.raises(InfrastructureStepFailed) as error:
+        prepare_infrastructure(args)
+
+    assert isinstance(error.value.__cause__, ValueError)
+    runner.create_iam.assert_called_once_with()
+    runner.create_archaius.assert_not_called()
+    runner.create_elb.assert_not_called()
+    runner.slack_notify.assert_not_called()
+    runner.cleanup.assert_not_called()
+
+
+@mock.patch('foremast.runner.ForemastRunner')
+def test_runner_prepare_infrastructure_cli_type_error(mock_runner):
+    """A TypeError in a step does not make the CLI run every step again."""
+    runner = mock_runner.return_value = infra_runner()
+    runner.create_elb.side_effect = TypeError('bad listener')
+
+    with pytest.raises(InfrastructureStepFailed):
+        main(['infra', '--only', 'elb'])
+
+    assert mock_runner.call_count == 1
+    runner.create_app.assert_not_called()
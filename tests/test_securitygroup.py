@@ -53,14 +53,15 @@ DEFAULT_SG_RULES = {
 }
 
 
-@mock.patch('foremast.securitygroup.create_securitygroup.boto3')
+@mock.patch('foremast.securitygroup.create_securitygroup.get_boto_client')
+@mock.patch('foremast.securitygroup.create_securitygroup.get_boto_resource')
 @mock.patch('foremast.securitygroup.create_securitygroup.get_security_group_id')
 @mock.patch('foremast.securitygroup.create_securitygroup.get_vpc_id')
 @mock.patch('foremast.securitygroup.create_securitygroup.wait_for_task')
 @mock.patch("foremast.securitygroup.create_securitygroup.get_properties")
 @mock.patch("foremast.securitygroup.create_securitygroup.get_details")
 def test_create_crossaccount_securitygroup(get_details, pipeline_config, wait_for_task, get_vpc_id,
-                                           get_security_group_id, boto3):
+                                           get_security_group_id, boto3_resource, boto3_client):
     """Should create SG with cross account true"""
     pipeline_config.return_value = json.loads(SAMPLE_JSON)
 
@@ -110,11 +111,11 @@ def test_misconfiguration(get_details, get_properties, get_sec_id):
         security_group.create_security_group()
 
 
-@mock.patch('foremast.securitygroup.create_securitygroup.boto3')
+@mock.patch('foremast.securitygroup.create_securitygroup.get_boto_resource')
 @mock.patch('foremast.securitygroup.create_securitygroup.get_properties')
 @mock.patch('foremast.securitygroup.create_securitygroup.get_security_group_id')
 @mock.patch("foremast.securitygroup.create_securitygroup.get_details")
-def test_tags(get_details, get_security_group_id, get_properties, boto3):
+def test_tags(get_details, get_security_group_id, get_properties, boto3_resource):
     """Make bad Security Group definitions more apparent."""
     get_properties.return_value = {'security_group': {}}
     get_security_group_id.return_value = 'SGID'
@@ -76,10 +76,10 @@ def test_utils_pipeline_check_managed():
             check_managed_pipeline(name=name, app_name='app')
 
 
-@mock.patch('requests.get')
+@mock.patch('foremast.utils.pipelines.gate_request')
 @mock.patch('foremast.utils.pipelines.murl')
-def test_utils_pipeline_get_all_pipelines(mock_murl, mock_requests_get):
-    mock_requests_get.return_value.json.return_value = {}
+def test_utils_pipeline_get_all_pipelines(mock_murl, mock_gate_request):
+    mock_gate_request.return_value.json.return_value = {}
     result = get_all_pipelines(app='app')
     assert result == {}
 
@@ -109,10 +109,10 @@ def test_utils_generate_packer_filename():
     assert a == 'aws_us-east-1_chroot.json'
 
 
-@mock.patch('requests.get')
-def test_utils_find_elb(requests_get_mock):
+@mock.patch('foremast.utils.elb.gate_request')
+def test_utils_find_elb(mock_gate_request):
     results = [{'account': 'dev', 'region': 'us-east-1', 'dnsname': 'appdns'}]
-    requests_get_mock.return_value.json.return_value = results
+    mock_gate_request.return_value.json.return_value = results
     a = find_elb('app', 'dev', 'us-east-1')
     assert a == 'appdns'
 
@@ -128,38 +128,43 @@ def test_utils_post_slack_message(mock_slack):
     mock_slack.called
 
 
-@mock.patch('requests.get')
+@mock.patch('foremast.utils.apps.gate_request')
 @mock.patch('foremast.utils.pipelines.murl')
 @mock.patch('foremast.utils.apps.API_URL', 'http://test.com')
-def test_utils_apps_get_details(mock_murl, mock_requests_get):
+def test_utils_apps_get_details(mock_murl, mock_gate_request):
     data = {'attributes': {'repoProjectKey': 'group', 'repoSlug': 'repo1'}}
-    mock_requests_get.return_value.json.return_value = data
+    mock_gate_request.return_value.json.return_value = data
 
     result = get_details(app='repo1group', env='dev')
     assert result.app_name() == 'repo1group'
 
     with pytest.raises(SpinnakerAppNotFound):
-        mock_requests_get.return_value.ok = False
+        mock_gate_request.return_value.ok = False
         result = get_details(app='repo1group', env='dev')
         assert result.app_name() == 'repo1group'
 
 
-@mock.patch('requests.get')
+@mock.patch('foremast.utils.apps.gate_request')
 @mock.patch('foremast.utils.pipelines.murl')
 @mock.patch('foremast.utils.apps.API_URL', 'http://test.com')
-def test_utils_apps_get_all_apps(mock_murl, mock_requests_get):
+def test_utils_apps_get_all_apps(mock_murl, mock_gate_request):
     data = []
-    mock_requests_get.return_value.json.return_value = data
+    mock_gate_request.return_value.json.return_value = data
 
     result = get_all_apps()
     assert result == []
 
+    result.append({'name': 'changed'})
+    assert get_all_apps() == []
+    assert mock_gate_request.call_count == 1
+
     with pytest.raises(AssertionError):
-        mock_requests_get.return_value.ok = False
+        GATE_CACHE.invalidate()
+        mock_gate_request.return_value.ok = False
         result = get_all_apps()
 
 
-@mock.patch('foremast.utils.dns.boto3.Session')
+@mock.patch('foremast.utils.dns.get_boto_client')
 @mock.patch('foremast.utils.dns.DOMAIN', 'test')
 def test_utils_dns_get_zone_ids(mock_boto3):
     data = {
@@ -200,7 +205,7 @@ def test_utils_dns_get_zone_ids(mock_boto3):
         ]
     }
 
-    mock_boto3.return_value.client.return_value.list_hosted_zones_by_name.return_value = data
+    mock_boto3.return_value.list_hosted_zones_by_name.return_value = data
 
     # default case
     result = get_dns_zone_ids()
@@ -218,8 +223,12 @@ def test_utils_dns_get_zone_ids(mock_boto3):
     result = get_dns_zone_ids(facing='wrong_param')
     assert result == [100]
 
+    # zones are listed once
+    assert mock_boto3.return_value.list_hosted_zones_by_name.call_count == 1
+
     # no internal zones
-    mock_boto3.return_value.client.return_value.list_hosted_zones_by_name.return_value = data_external
+    mock_boto3.return_value.list_hosted_zones_by_name.return_value = data_external
+    HOSTED_ZONE_CACHE.invalidate()
     result = get_dns_zone_ids(facing='internal')
     assert result == []
 
@@ -228,49 +237,114 @@ def test_utils_dns_get_zone_ids(mock_boto3):
     assert result == []
 
 
-@mock.patch('foremast.utils.dns.boto3.Session')
+@mock.patch('foremast.utils.dns.get_boto_client')
+def test_utils_dns_zone_names_from_listing(mock_boto3):
+    """Listing Hosted Zones also caches their names."""
+    client = mock_boto3.return_value
+    client.list_hosted_zones_by_name.return_value = {
+        'HostedZones': [{
+            'Name': 'dev.example.com.',
+            'Id': '/hostedzone/100',
+            'Config': {
+                'PrivateZone': True
+            }
+        }]
+    }
+
+    assert get_dns_zone_ids(env='dev') == ['/hostedzone/100']
+    assert get_dns_zone_ids(env='dev', facing='external') == ['/hostedzone/100']
+    assert get_hosted_zone_name('dev', '/hostedzone/100') == 'dev.example.com'
+    assert client.list_hosted_zones_by_name.call_count == 1
+    client.get_hosted_zone.assert_not_called()
+
+
+ZONE_RECORDS = [
+    {
+        'Name': 'a.example.com.',
+        'Type': 'A'
+    },
+    {
+        'Name': 'test.example.com.',
+        'Type': 'A',
+        'Failover': 'PRIMARY'
+    },
+    {
+        'Name': 'test.example.com.',
+        'Type': 'CNAME'
+    },
+    {
+        'Name': 'zzz.example.com.',
+        'Type': 'CNAME'
+    },
+]
+
+
+def list_zone_records(HostedZoneId, StartRecordName, StartRecordType=None, **_):
+    """Return one record per page, seeking like Route 53."""
+    for position, record in enumerate(ZONE_RECORDS):
+        if (record['Name'].rstrip('.'), record['Type']) >= (StartRecordName, StartRecordType or ''):
+            break
+    else:
+        return {'ResourceRecordSets': [], 'IsTruncated': False}
+
+    response = {'ResourceRecordSets': [record], 'IsTruncated': position + 1 < len(ZONE_RECORDS)}
+    if response['IsTruncated']:
+        next_record = ZONE_RECORDS[position + 1]
+        response.update({'NextRecordName': next_record['Name'].rstrip('.'), 'NextRecordType': next_record['Type']})
+    return response
+
+
+@mock.patch('foremast.utils.dns.get_boto_client')
 def test_find_existing_record(mock_session):
     """Check that a record is found correctly"""
-
     dns_values = {'env': 'dev', 'zone_id': '/hostedzone/TESTTESTS279', 'dns_name': 'test.example.com'}
-    test_records = [{
-        'ResourceRecordSets': [{
-            'Name': 'test.example.com.',
-            'Type': 'CNAME'
-        }]
-    }, {
-        'ResourceRecordSets': [{
-            'Name': 'test.example.com.',
-            'Failover': 'PRIMARY'
-        }]
-    }, {
-        'ResourceRecordSets': [{
-            'Name': 'test.example.com.',
-            'Type': 'A'
-        }]
-    }]
-    client = mock_session.return_value.client.return_value
-    client.get_paginator.return_value.paginate.return_value = test_records
+    client = mock_session.return_value
+    client.list_resource_record_sets.side_effect = list_zone_records
+
     assert find_existing_record(
-        dns_values['env'], dns_values['zone_id'], dns_values['dns_name'], check_key='Type', check_value='CNAME') == {
-            'Name': 'test.example.com.',
-            'Type': 'CNAME'
-        }
+        dns_values['env'], dns_values['zone_id'], dns_values['dns_name'], check_key='Type',
+        check_value='CNAME') == ZONE_RECORDS[2]
+    assert client.list_resource_record_sets.call_args_list[0] == mock.call(
+        HostedZoneId=dns_values['zone_id'], StartRecordName='test.example.com', StartRecordType='CNAME')
+
     assert find_existing_record(
         dns_values['env'], dns_values['zone_id'], dns_values['dns_name'], check_key='Failover',
-        check_value='PRIMARY') == {
-            'Name': 'test.example.com.',
-            'Failover': 'PRIMARY'
-        }
+        check_value='PRIMARY') == ZONE_RECORDS[1]
     assert find_existing_record(
-        dns_values['env'], dns_values['zone_id'], 'bad.example.com', check_key='Type', check_value='CNAME') == None
+        dns_values['env'], dns_values['zone_id'], 'bad.example.com', check_key='Type', check_value='CNAME') is None
+
+    # Listing stops at the first record with another name
+    client.list_resource_record_sets.reset_mock()
+    assert len(list_dns_records(dns_values['env'], dns_values['zone_id'], dns_values['dns_name'])) == 2
+    assert client.list_resource_record_sets.call_count == 3
 
 
-@mock.patch('requests.get')
+@mock.patch('foremast.utils.dns.get_boto_client')
+def test_find_existing_record_index(mock_session):
+    """Records for a name are listed once per run with an index."""
+    client = mock_session.return_value
+    client.list_resource_record_sets.side_effect = list_zone_records
+    record_index = ZoneRecordIndex()
+
+    assert find_existing_record(
+        'dev', 'zone', 'test.example.com', check_key='Failover', check_value='PRIMARY',
+        record_index=record_index) == ZONE_RECORDS[1]
+    calls = client.list_resource_record_sets.call_count
+    assert find_existing_record(
+        'dev', 'zone', 'test.example.com.', check_key='Type', check_value='CNAME',
+        record_index=record_index) == ZONE_RECORDS[2]
+    assert client.list_resource_record_sets.call_count == calls
+
+    record_index.invalidate('zone', 'test.example.com')
+    record_index.get('dev', 'zone', 'test.example.com')
+    assert client.list_resource_record_sets.call_count == calls * 2
+
+
+@mock.patch('foremast.utils.security_group.gate_request')
 @mock.patch('foremast.utils.security_group.get_vpc_id')
-def test_utils_sg_get_security_group_id(mock_vpc_id, mock_requests_get):
+def test_utils_sg_get_security_group_id(mock_vpc_id, mock_gate_request):
     data = {'id': 100}
-    mock_requests_get.return_value.json.return_value = data
+    mock_gate_request.return_value.json.return_value = data
 
     # default - happy path
     result = get_security_group_id()
@@ -278,17 +352,17 @@ def test_utils_sg_get_security_group_id(mock_vpc_id, mock_requests_get):
 
     # security group not found
     with pytest.raises(SpinnakerSecurityGroupError):
-        mock_requests_get.return_value.json.return_value = {}
+        mock_gate_request.return_value.json.return_value = {}
         result = get_security_group_id()
 
     # error getting details
     with pytest.raises(AssertionError):
-        mock_requests_get.return_value.ok = False
+        mock_gate_request.return_value.ok = False
         result = get_security_group_id()
 
 
-@mock.patch('requests.get')
-def test_utils_vpc_get_vpc_id(mock_requests_get):
+@mock.patch('foremast.utils.vpc.gate_request')
+def test_utils_vpc_get_vpc_id(mock_gate_request):
     data = [
         {
             'id': 100,
@@ -297,7 +371,7 @@ def test_utils_vpc_get_vpc_id(mock_requests_get):
             'region': 'us-east-1'
         },
     ]
-    mock_requests_get.return_value.json.return_value = data
+    mock_gate_request.return_value.json.return_value = data
 
     # default - happy path
     result = get_vpc_id(account='dev', region='us-east-1')
@@ -310,10 +384,24 @@ def test_utils_vpc_get_vpc_id(mock_requests_get):
 
     # error getting details
     with pytest.raises(SpinnakerVPCNotFound):
-        mock_requests_get.return_value.ok = False
+        GATE_CACHE.invalidate()
+        mock_gate_request.return_value.ok = False
         result = get_vpc_id(account='dev', region='us-east-1')
 
 
+@mock.patch('foremast.utils.vpc.gate_request')
+def test_utils_vpc_cached(mock_gate_request):
+    """VPC list is fetched once for many lookups."""
+    mock_gate_request.return_value.json.return_value = [
+        {'id': 100, 'name': 'vpc', 'account': 'dev', 'region': 'us-east-1'},
+        {'id': 200, 'name': 'vpc', 'account': 'dev', 'region': 'us-west-2'},
+    ]
+
+    assert get_vpc_id(account='dev', region='us-east-1') == 100
+    assert get_vpc_id(account='dev', region='us-west-2') == 200
+    assert mock_gate_request.call_count == 1
+
+
 SUBNET_DATA = [
     {
         'vpcId': 100,
@@ -336,10 +424,10 @@ SUBNET_DATA = [
 ]
 
 
-@mock.patch('foremast.utils.subnets.requests.get')
-def test_utils_subnets_get_subnets(mock_requests_get):
+@mock.patch('foremast.utils.subnets.gate_request')
+def test_utils_subnets_get_subnets(mock_gate_request):
     """Find one subnet."""
-    mock_requests_get.return_value.json.return_value = SUBNET_DATA
+    mock_gate_request.return_value.json.return_value = SUBNET_DATA
 
     # default - happy path
     result = get_subnets(env='dev', region='us-east-1')
@@ -351,20 +439,20 @@ def test_utils_subnets_get_subnets(mock_requests_get):
     }
 
 
-@mock.patch('foremast.utils.subnets.requests.get')
-def test_utils_subnets_get_subnets_multiple_az(mock_requests_get):
+@mock.patch('foremast.utils.subnets.gate_request')
+def test_utils_subnets_get_subnets_multiple_az(mock_gate_request):
     """Find multiple Availability Zones."""
-    mock_requests_get.return_value.json.return_value = SUBNET_DATA
+    mock_gate_request.return_value.json.return_value = SUBNET_DATA
 
     # default - happy path w/multiple az
     result = get_subnets(env='dev', region='')
     assert result == {'dev': {'us-west-2': [['us-west-2a', 'us-west-2b']], 'us-east-1': [[]]}}
 
 
-@mock.patch('foremast.utils.subnets.requests.get')
-def test_utils_subnets_get_subnets_subnet_not_found(mock_requests_get):
+@mock.patch('foremast.utils.subnets.gate_request')
+def test_utils_subnets_get_subnets_subnet_not_found(mock_gate_request):
     """Trigger SpinnakerSubnetError when no subnets found."""
-    mock_requests_get.return_value.json.return_value = SUBNET_DATA
+    mock_gate_request.return_value.json.return_value = SUBNET_DATA
 
     # subnet not found
     with pytest.raises(SpinnakerSubnetError):
@@ -372,14 +460,43 @@ def test_utils_subnets_get_subnets_subnet_not_found(mock_requests_get):
         assert result == {'us-west-1': [[]]}
 
 
-@mock.patch('foremast.utils.subnets.requests.get')
-def test_utils_subnets_get_subnets_api_error(mock_requests_get):
+def test_utils_subnets_index():
+    """Subnet index answers Availability Zone and ID lookups by key."""
+    subnet_index = SubnetIndex([
+        {'vpcId': 100, 'account': 'dev', 'id': 1, 'purpose': 'internal', 'region': 'us-east-1', 'target': 'ec2',
+         'availabilityZone': 'us-east-1a'},
+        {'vpcId': 100, 'account': 'dev', 'id': 2, 'purpose': 'external', 'region': 'us-east-1', 'target': 'ec2',
+         'availabilityZone': 'us-east-1b'},
+        {'vpcId': 100, 'account': 'dev', 'id': 3, 'purpose': 'internal', 'region': 'us-east-1', 'target': 'ec2',
+         'availabilityZone': 'us-east-1a'},
+    ])
+
+    assert subnet_index.azs('dev', 'us-east-1') == ['us-east-1a', 'us-east-1b']
+    assert subnet_index.azs('dev', 'us-east-1', purpose='internal') == ['us-east-1a']
+    assert subnet_index.ids('dev', 'us-east-1') == [1, 3]
+    assert subnet_index.az_dict() == {'dev': {'us-east-1': ['us-east-1a', 'us-east-1b']}}
+    with pytest.raises(KeyError):
+        subnet_index.ids('dev', 'us-east-1', target='elb')
+
+
+@mock.patch('foremast.utils.subnets.gate_request')
+def test_utils_subnets_index_reused(mock_gate_request):
+    """Subnet list is fetched and indexed once."""
+    mock_gate_request.return_value.json.return_value = SUBNET_DATA
+
+    assert get_subnet_index() is get_subnet_index()
+    get_subnets(env='dev', region='us-east-1')
+    assert mock_gate_request.call_count == 1
+
+
+@mock.patch('foremast.utils.subnets.gate_request')
+def test_utils_subnets_get_subnets_api_error(mock_gate_request):
     """Trigger SpinnakerTimeout when API has error."""
-    mock_requests_get.return_value.json.return_value = SUBNET_DATA
+    mock_gate_request.return_value.json.return_value = SUBNET_DATA
 
     # error getting details
     with pytest.raises(SpinnakerTimeout):
-        mock_requests_get.return_value.ok = False
+        mock_gate_request.return_value.ok = False
         result = get_subnets()
 
 
@@ -406,3 +523,76 @@ def test_utils_default_timeout(mock_check_task, mock_requests_post, mock_timeout
     mock_timeouts.side_effect = {"dev": {"fake_task": "240"}}
     tasks.wait_for_task(task_data)
     assert mock_check_task.called_with("really_fake_task", tasks.DEFAULT_TASK_TIMEOUT)
+
+
+def test_utils_template_environment_reused():
+    """Templates share one Jinja2 Environment and its cache."""
+    first = get_template_object('infrastructure/iam/wrapper.json.j2')
+    second = get_template_object('infrastructure/iam/wrapper.json.j2')
+
+    assert first.environment is second.environment
+    assert first is second
+
+
+def test_utils_decode_json_values():
+    """Comma separated JSON values decode in one pass."""
+    assert decode_json_values('{"a": 1}') == [{'a': 1}]
+    assert decode_json_values(' {"a": 1},\n{"b": [2]} ') == [{'a': 1}, {'b': [2]}]
+
+    with pytest.raises(ValueError):
+        decode_json_values('{"a": 1} {"b": 2}')
+
+
+@mock.patch('foremast.utils.templates.get_template')
+def test_utils_get_template_data(mock_get_template):
+    """Rendered templates become Python objects."""
+    mock_get_template.return_value = '{"Effect": "Allow"}'
+    assert get_template_data('infrastructure/iam/s3.json.j2') == {'Effect': 'Allow'}
+
+    mock_get_template.return_value = '{"Effect": "Allow"}, {"Effect": "Deny"}'
+    assert get_template_data('infrastructure/iam/s3.json.j2') == [{'Effect': 'Allow'}, {'Effect': 'Deny'}]
+
+
+@mock.patch('foremast.utils.templates.get_template')
+def test_utils_get_template_data_empty(mock_get_template):
+    """Templates rendering only whitespace have no values."""
+    assert decode_json_values(' \n ') == []
+
+    mock_get_template.return_value = '\n    \n'
+    assert get_template_data('infrastructure/iam/s3.json.j2') == []
+
+
+def test_utils_pipeline_index():
+    """Managed Pipelines are found by Application, Region and onetime Environment."""
+    pipelines = PipelineIndex([
+        {'application': 'app', 'name': 'app [us-east-1] (onetime-dev)', 'id': 1},
+        {'application': 'app', 'name': 'app [us-east-1]', 'id': 2},
+        {'application': 'app', 'name': 'app [us-east-1]', 'id': 3},
+        {'application': 'app', 'name': 'custom', 'id': 4},
+    ])
+
+    assert len(pipelines) == 4
+    assert pipelines.find('app', 'us-east-1')['id'] == 2
+    assert pipelines.find('app', 'us-east-1', onetime_env='dev')['id'] == 1
+    assert pipelines.find('app', 'us-west-2') is None
+    assert pipelines.get_id('custom') == 4
+    assert get_pipeline_id(name='custom', pipelines=pipelines) == 4
+
+
+def test_utils_pipeline_digest():
+    """Volatile keys and key order do not change the digest."""
+    rendered = {'name': 'app [us-east-1]', 'stages': [{'refId': '1'}], 'id': 'abc'}
+    stored = {'id': 'abc', 'stages': [{'refId': '1'}], 'name': 'app [us-east-1]', 'updateTs': '1', 'index': 0}
+
+    assert pipeline_digest(rendered) == pipeline_digest(stored)
+    assert pipeline_digest(rendered) != pipeline_digest(dict(rendered, stages=[]))
+
+
+def test_utils_templates_digest(tmpdir):
+    """Template digest changes with any template file."""
+    tmpdir.join('pipeline.json.j2').write('{}')
+    first = get_templates_digest((str(tmpdir), ))
+
+    tmpdir.mkdir('infrastructure').join('elb.json.j2').write('{}')
+    assert get_templates_digest.__wrapped__((str(tmpdir), )) != first
+    assert get_templates_digest((str(tmpdir), )) == first
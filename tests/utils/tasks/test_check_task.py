@@ -1,10 +1,11 @@
 """Verify :func:`foremsat.utils.tasks.check_task` functionality."""
+import itertools
 from unittest import mock
 
 import pytest
 
 from foremast.exceptions import SpinnakerTaskError, SpinnakerTaskInconclusiveError
-from foremast.utils.tasks import _check_task, check_task
+from foremast.utils.tasks import _check_task, check_task, poll_intervals
 
 FAIL_MESSAGE = 'TERMINAL'
 SUCCESS_MESSAGE = 'SUCCEEDED'
@@ -20,20 +21,20 @@ def test_utils_retry_task(mock_check_task):
     assert mock_check_task.call_count == 2
 
 
-@mock.patch('foremast.utils.tasks.requests')
-def test_task_success(mock_requests):
+@mock.patch('foremast.utils.tasks.gate_request')
+def test_task_success(mock_gate_request):
     """Successful Task."""
-    mock_requests.get.return_value.json.return_value = {'status': SUCCESS_MESSAGE}
+    mock_gate_request.return_value.json.return_value = {'status': SUCCESS_MESSAGE}
 
     result = _check_task(taskid='')
 
     assert result == SUCCESS_MESSAGE
 
 
-@mock.patch('foremast.utils.tasks.requests')
-def test_task_failure(mock_requests):
+@mock.patch('foremast.utils.tasks.gate_request')
+def test_task_failure(mock_gate_request):
     """Failed Task."""
-    mock_requests.get.return_value.json.return_value = {
+    mock_gate_request.return_value.json.return_value = {
         'status': FAIL_MESSAGE,
         'execution': {
             'stages': [],
@@ -44,10 +45,37 @@ def test_task_failure(mock_requests):
         _check_task(taskid='')
 
 
-@mock.patch('foremast.utils.tasks.requests')
-def test_task_unknown(mock_requests):
+@mock.patch('foremast.utils.tasks.gate_request')
+def test_task_unknown(mock_gate_request):
     """Unknown Task status raises exception to keep polling."""
-    mock_requests.get.return_value.json.return_value = {'status': ''}
+    mock_gate_request.return_value.json.return_value = {'status': ''}
 
     with pytest.raises(ValueError):
         _check_task(taskid='')
+
+
+def test_poll_intervals_fixed():
+    """Fixed wait keeps timeout / wait polls."""
+    assert list(poll_intervals(timeout=6, wait=2)) == [2, 2]
+
+
+@mock.patch('foremast.utils.tasks.TASK_POLL_MAX', 4)
+@mock.patch('foremast.utils.tasks.TASK_POLL_INITIAL', 0.5)
+@mock.patch('foremast.utils.tasks.time.monotonic')
+def test_poll_intervals_backoff(mock_monotonic):
+    """Adaptive polling starts fast and backs off to the cap."""
+    mock_monotonic.return_value = 0
+
+    pauses = list(itertools.islice(poll_intervals(timeout=120), 6))
+
+    assert 0.25 <= pauses[0] <= 0.5
+    assert 0.5 <= pauses[1] <= 1
+    assert all(2 <= pause <= 4 for pause in pauses[3:])
+
+
+@mock.patch('foremast.utils.tasks.time.monotonic')
+def test_poll_intervals_timeout(mock_monotonic):
+    """Adaptive polling stops once timeout is spent."""
+    mock_monotonic.side_effect = [0, 1.8, 5]
+
+    assert list(poll_intervals(timeout=2)) == [pytest.approx(0.2)]
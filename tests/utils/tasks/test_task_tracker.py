@@ -0,0 +1,68 @@
+"""Verify :class:`foremast.utils.tasks.TaskTracker` functionality."""
+from unittest import mock
+
+import pytest
+
+from foremast.exceptions import SpinnakerTaskError, SpinnakerTaskInconclusiveError
+from foremast.utils.tasks import TaskTracker
+
+SUCCESS_MESSAGE = 'SUCCEEDED'
+
+
+@mock.patch('foremast.utils.tasks._check_task')
+def test_tracker_polls_all_tasks(mock_check_task):
+    """Many Tasks resolve from one poller."""
+    attempts = {'task1': [ValueError, ValueError, SUCCESS_MESSAGE], 'task2': [ValueError, SUCCESS_MESSAGE]}
+
+    def check(taskid):
+        result = attempts[taskid].pop(0)
+        if result is ValueError:
+            raise ValueError
+        return result
+
+    mock_check_task.side_effect = check
+
+    tracker = TaskTracker(wait=0.01)
+    futures = [tracker.track('task1'), tracker.track('task2')]
+
+    assert tracker.wait_all(futures) == [SUCCESS_MESSAGE, SUCCESS_MESSAGE]
+    assert mock_check_task.call_count == 5
+    assert not tracker.pending
+
+
+@mock.patch('foremast.utils.tasks._check_task')
+def test_tracker_task_failure(mock_check_task):
+    """Failed Task raises from its Future only."""
+    mock_check_task.side_effect = SpinnakerTaskError({'execution': {'stages': []}})
+
+    tracker = TaskTracker(wait=0.01)
+    future = tracker.track('task1')
+
+    with pytest.raises(SpinnakerTaskError):
+        future.result(timeout=5)
+
+
+@mock.patch('foremast.utils.tasks._check_task')
+def test_tracker_task_timeout(mock_check_task):
+    """Task still running after timeout is inconclusive."""
+    mock_check_task.side_effect = ValueError
+
+    tracker = TaskTracker(wait=0.01)
+    future = tracker.track('task1', timeout=0)
+
+    with pytest.raises(SpinnakerTaskInconclusiveError):
+        future.result(timeout=5)
+
+
+@mock.patch('foremast.utils.tasks._check_task')
+@mock.patch('foremast.utils.tasks.post_task')
+def test_tracker_submit(mock_post_task, mock_check_task):
+    """Submitted Tasks are tracked by returned reference."""
+    mock_post_task.return_value = '/tasks/abc'
+    mock_check_task.return_value = SUCCESS_MESSAGE
+
+    tracker = TaskTracker(wait=0.01)
+    future = tracker.submit({'job': [{'credentials': 'dev', 'type': 'fake_task'}]})
+
+    assert future.result(timeout=5) == SUCCESS_MESSAGE
+    mock_check_task.assert_called_with('/tasks/abc')
@@ -1,38 +1,22 @@
 """Test AWS Lambda Utilities."""
+import json
 from unittest import mock
 
 import boto3
 import pytest
 
-from foremast.exceptions import LambdaAliasDoesNotExist
-from foremast.utils.awslambda import add_lambda_permissions, get_lambda_alias_arn
+from foremast.exceptions import LambdaAliasDoesNotExist, LambdaFunctionDoesNotExist
+from foremast.utils.awslambda import LambdaPermissions, add_lambda_permissions, get_lambda_alias_arn, get_lambda_arn
 
 ERROR_RESPONSE = {'Error': {}}
 
 
-def lambda_alias_list_mock():
-    return_dict = {
-        'Aliases': [{
-            'Description': '',
-            'AliasArn': 'arn:aws:lambda:us-east-1:222572804561:function:lambdatest2:stage',
-            'FunctionVersion': '$LATEST',
-            'Name': 'stage'
-        }, {
-            'Description': '',
-            'AliasArn': 'arn:aws:lambda:us-east-1:222572804561:function:lambdatest2:dev',
-            'FunctionVersion': '$LATEST',
-            'Name': 'dev'
-        }]
-    }
-    return return_dict
-
-
-def lambda_no_alias_list_mock():
-    return_dict = {'Aliases': []}
-    return return_dict
+ALIAS_ARN = 'arn:aws:lambda:us-east-1:222572804561:function:lambdatest2:dev'
+FUNCTION_ARN = 'arn:aws:lambda:us-east-1:222572804561:function:lambdatest2'
+NOT_FOUND_RESPONSE = {'Error': {'Code': 'ResourceNotFoundException'}}
 
 
-@mock.patch('foremast.utils.awslambda.boto3')
+@mock.patch('foremast.utils.awslambda.get_boto_client')
 @mock.patch('foremast.utils.awslambda.LOG')
 def test_add_lambda_permission_success(LOG, mock_boto3):
     """Check lambda permssion add successful."""
@@ -42,11 +26,11 @@ def test_add_lambda_permission_success(LOG, mock_boto3):
     assert args[0].startswith('Add permission')
 
 
-@mock.patch('foremast.utils.awslambda.boto3.Session')
+@mock.patch('foremast.utils.awslambda.get_boto_client')
 @mock.patch('foremast.utils.awslambda.LOG')
 def test_add_lambda_permission_failure(LOG, session):
     """Check lambda permssion add failure."""
-    client = session.return_value.client.return_value
+    client = session.return_value
     client.add_permission.side_effect = boto3.exceptions.botocore.exceptions.ClientError(
         ERROR_RESPONSE, 'operation_name')
 
@@ -56,26 +40,133 @@ def test_add_lambda_permission_failure(LOG, session):
     assert args[0].startswith('Did not add')
 
 
-@mock.patch('foremast.utils.awslambda.boto3.Session')
+@mock.patch('foremast.utils.awslambda.get_boto_client')
 @mock.patch('foremast.utils.awslambda.LOG')
 def test_get_lambda_alias_arn_success(LOG, mock_boto3):
     """Check get lambda alias arn."""
-    client = mock_boto3.return_value.client.return_value
-    client.list_aliases.return_value = lambda_alias_list_mock()
+    client = mock_boto3.return_value
+    client.get_alias.return_value = {'AliasArn': ALIAS_ARN, 'Name': 'dev'}
 
     rv = get_lambda_alias_arn('lambdatest', 'dev', 'us-east-1')
 
     args, _ = LOG.info.call_args
 
-    assert rv == 'arn:aws:lambda:us-east-1:222572804561:function:lambdatest2:dev'
+    assert rv == ALIAS_ARN
     assert args[0].startswith('Found ARN for alias')
+    client.get_alias.assert_called_once_with(FunctionName='lambdatest', Name='dev')
 
 
-@mock.patch('foremast.utils.awslambda.boto3.Session')
+@mock.patch('foremast.utils.awslambda.get_boto_client')
 def test_get_lambda_alias_arn_failure(mock_boto3):
     """Check get lambda alias arn failure."""
-    client = mock_boto3.return_value.client.return_value
-    client.list_aliases.return_value = lambda_no_alias_list_mock()
+    client = mock_boto3.return_value
+    client.get_alias.side_effect = boto3.exceptions.botocore.exceptions.ClientError(NOT_FOUND_RESPONSE, 'GetAlias')
 
     with pytest.raises(LambdaAliasDoesNotExist):
         get_lambda_alias_arn('lambdatest', 'dev', 'us-east-1')
+
+
+@mock.patch('foremast.utils.awslambda.get_boto_client')
+def test_get_lambda_arn_cached(mock_boto3):
+    """Function ARN is looked up directly once per run."""
+    client = mock_boto3.return_value
+    client.get_function.return_value = {'Configuration': {'FunctionArn': FUNCTION_ARN}}
+
+    assert get_lambda_arn('lambdatest2', 'dev', 'us-east-1') == FUNCTION_ARN
+    assert get_lambda_arn('lambdatest2', 'dev', 'us-east-1') == FUNCTION_ARN
+
+    client.get_function.assert_called_once_with(FunctionName='lambdatest2')
+    client.get_paginator.assert_not_called()
+
+
+@mock.patch('foremast.utils.awslambda.get_boto_client')
+def test_get_lambda_arn_failure(mock_boto3):
+    """Missing function is not cached."""
+    client = mock_boto3.return_value
+    client.get_function.side_effect = boto3.exceptions.botocore.exceptions.ClientError(
+        NOT_FOUND_RESPONSE, 'GetFunction')
+
+    for _ in range(2):
+        with pytest.raises(LambdaFunctionDoesNotExist):
+            get_lambda_arn('lambdatest2', 'dev', 'us-east-1')
+    assert client.get_function.call_count == 2
+
+
+@mock.patch('foremast.utils.awslambda.get_lambda_alias_arn')
+@mock.patch('foremast.utils.awslambda.get_lambda_arn')
+@mock.patch('foremast.utils.awslambda.get_boto_client')
+def test_lambda_permissions_reconcile(mock_boto3, mock_arn, mock_alias_arn):
+    """Only missing or changed permissions are added, unused ones removed."""
+    mock_arn.return_value = FUNCTION_ARN
+    mock_alias_arn.return_value = ALIAS_ARN
+    topic = 'arn:aws:sns:us-east-1:222572804561:topic'
+    policy = {
+        'Statement': [
+            {
+                'Sid': 'foremast-sns',
+                'Action': 'lambda:InvokeFunction',
+                'Principal': {
+                    'Service': 'sns.amazonaws.com'
+                },
+                'Condition': {
+                    'ArnLike': {
+                        'AWS:SourceArn': topic
+                    }
+                },
+            },
+            {
+                'Sid': 'foremast-events',
+                'Action': 'lambda:InvokeFunction',
+                'Principal': {
+                    'Service': 'events.amazonaws.com'
+                },
+                'Condition': {
+                    'ArnLike': {
+                        'AWS:SourceArn': 'old_rule'
+                    }
+                },
+            },
+            {
+                'Sid': 'foremast-old_trigger',
+                'Action': 'lambda:InvokeFunction',
+                'Principal': {
+                    'Service': 's3.amazonaws.com'
+                },
+            },
+            {
+                'Sid': 'manual',
+                'Action': 'lambda:InvokeFunction',
+                'Principal': {
+                    'Service': 's3.amazonaws.com'
+                },
+            },
+        ]
+    }
+    client = mock_boto3.return_value
+
+    def get_policy(FunctionName):
+        if FunctionName == ALIAS_ARN:
+            return {'Policy': json.dumps(policy)}
+        raise boto3.exceptions.botocore.exceptions.ClientError(NOT_FOUND_RESPONSE, 'GetPolicy')
+
+    client.get_policy.side_effect = get_policy
+
+    permissions = LambdaPermissions(app_name='lambdatest2', env='dev', region='us-east-1')
+    add_lambda_permissions(
+        function=ALIAS_ARN, statement_id='sns', principal='sns.amazonaws.com', source_arn=topic,
+        permissions=permissions)
+    add_lambda_permissions(
+        function=ALIAS_ARN, statement_id='events', principal='events.amazonaws.com', source_arn='new_rule',
+        permissions=permissions)
+    add_lambda_permissions(
+        function=FUNCTION_ARN, statement_id='events', principal='events.amazonaws.com', source_arn='new_rule',
+        permissions=permissions)
+
+    assert permissions.remove_unused() == [(ALIAS_ARN, 'foremast-old_trigger')]
+    assert client.get_policy.call_count == 2
+    assert client.add_permission.call_count == 2
+    client.remove_permission.assert_has_calls([
+        mock.call(FunctionName=ALIAS_ARN, StatementId='foremast-events'),
+        mock.call(FunctionName=ALIAS_ARN, StatementId='foremast-old_trigger'),
+    ])
+    assert client.remove_permission.call_count == 2
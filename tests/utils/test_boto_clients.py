@@ -0,0 +1,53 @@
+"""Verify shared boto3 Sessions and clients."""
+from unittest import mock
+
+from foremast.utils import boto_clients
+from foremast.utils.boto_clients import clear_boto_clients, get_boto_client, get_boto_resource, get_boto_session
+
+
+@mock.patch('foremast.utils.boto_clients.boto3.Session')
+def test_boto_client_reused(mock_session):
+    """One client per profile, Region, and service."""
+    client = get_boto_client('route53', profile='dev')
+
+    assert get_boto_client('route53', profile='dev') is client
+    mock_session.assert_called_once_with(profile_name='dev', region_name=None, botocore_session=mock.ANY)
+    mock_session.return_value.client.assert_called_once_with('route53')
+
+    get_boto_client('route53', profile='prod')
+    get_boto_client('lambda', profile='dev', region='us-east-1')
+    assert mock_session.call_count == 3
+
+
+@mock.patch('foremast.utils.boto_clients.boto3.Session')
+def test_boto_resource_not_reused(mock_session):
+    """Resources share the Session, but each caller gets a new one."""
+    get_boto_resource('s3', profile='dev')
+    get_boto_resource('s3', profile='dev')
+
+    assert mock_session.call_count == 1
+    assert mock_session.return_value.resource.call_count == 2
+
+
+@mock.patch('foremast.utils.boto_clients.boto3.Session')
+def test_clear_boto_clients(mock_session):
+    """Cleared clients are created again."""
+    get_boto_client('iam', profile='dev')
+    clear_boto_clients()
+    get_boto_client('iam', profile='dev')
+
+    assert mock_session.return_value.client.call_count == 2
+
+
+@mock.patch('foremast.utils.boto_clients.BOTO_LOADER', {'loader': None})
+@mock.patch('foremast.utils.boto_clients.BOTO_SHARE_LOADER', True)
+@mock.patch('foremast.utils.boto_clients.boto3.Session')
+def test_boto_share_loader(mock_session):
+    """Sessions share one botocore loader when enabled."""
+    get_boto_session(profile='dev')
+    get_boto_session(profile='prod')
+
+    first = mock_session.call_args_list[0][1]['botocore_session']
+    second = mock_session.call_args_list[1][1]['botocore_session']
+    assert first.get_component('data_loader') is second.get_component('data_loader')
+    assert boto_clients.BOTO_LOADER['loader'] is first.get_component('data_loader')
@@ -0,0 +1,49 @@
+"""Test time limited cache."""
+from unittest import mock
+
+from foremast.utils.cache import TTLCache
+
+
+def test_cache_loads_once():
+    """Fresh values are not loaded again."""
+    loader = mock.Mock(return_value=['vpc'])
+    cache = TTLCache(ttl=60)
+
+    assert cache.get('/vpcs', loader) == ['vpc']
+    assert cache.get('/vpcs', loader) == ['vpc']
+    assert loader.call_count == 1
+
+
+@mock.patch('foremast.utils.cache.time.time')
+def test_cache_expires(mock_time):
+    """Expired values are loaded again."""
+    loader = mock.Mock(side_effect=[1, 2])
+    cache = TTLCache(ttl=60)
+
+    mock_time.return_value = 0
+    assert cache.get('key', loader) == 1
+    mock_time.return_value = 61
+    assert cache.get('key', loader) == 2
+
+
+def test_cache_invalidate():
+    """Invalidated values are loaded again."""
+    loader = mock.Mock(side_effect=[1, 2, 3])
+    cache = TTLCache(ttl=60)
+
+    cache.get('key', loader)
+    cache.invalidate('key')
+    assert cache.get('key', loader) == 2
+    cache.invalidate()
+    assert cache.get('key', loader) == 3
+
+
+def test_cache_file(tmpdir):
+    """Values persist to file for other processes."""
+    path = str(tmpdir.join('cache.json'))
+
+    TTLCache(ttl=60, path=path).get('key', lambda: {'value': 1})
+    loader = mock.Mock()
+
+    assert TTLCache(ttl=60, path=path).get('key', loader) == {'value': 1}
+    assert not loader.called
@@ -0,0 +1,62 @@
+"""Test dependency ordered Steps."""
+import threading
+
+import pytest
+
+from foremast.utils.dag import Step, order_steps, run_steps
+
+
+def test_order_steps():
+    """Steps follow their dependencies and otherwise keep their order."""
+    steps = [Step('elb', None, depends=['sg']), Step('iam', None), Step('sg', None)]
+
+    assert [step.name for step in order_steps(steps)] == ['iam', 'sg', 'elb']
+
+    with pytest.raises(ValueError):
+        order_steps([Step('a', None, depends=['b']), Step('b', None, depends=['a'])])
+
+    with pytest.raises(ValueError):
+        order_steps([Step('a', None, depends=['missing'])])
+
+
+def test_run_steps_parallel():
+    """Independent Steps run at the same time."""
+    barrier = threading.Barrier(2, timeout=5)
+    calls = []
+
+    steps = [
+        Step('iam', barrier.wait),
+        Step('sg', barrier.wait),
+        Step('elb', lambda: calls.append('elb'), depends=['sg']),
+    ]
+    run_steps(steps, workers=2)
+
+    assert calls == ['elb']
+    assert all(step.status == Step.DONE and step.duration is not None for step in steps)
+
+
+def test_run_steps_fail_fast():
+    """First error is raised and later Steps are skipped."""
+
+    def fail():
+        raise RuntimeError('boom')
+
+    steps = [Step('app', fail), Step('iam', lambda: None, depends=['app']), Step('sg', lambda: None)]
+
+    with pytest.raises(RuntimeError):
+        run_steps(steps)
+
+    assert [step.status for step in steps] == [Step.FAILED, Step.SKIPPED, Step.SKIPPED]
+
+
+def test_run_steps_keep_going():
+    """Without fail fast, only dependents of a failed Step are skipped."""
+
+    def fail():
+        raise RuntimeError('boom')
+
+    steps = [Step('app', fail), Step('iam', lambda: None, depends=['app']), Step('sg', lambda: None)]
+    run_steps(steps, fail_fast=False)
+
+    assert [step.status for step in steps] == [Step.FAILED, Step.SKIPPED, Step.DONE]
+    assert str(steps[0].error) == 'boom'
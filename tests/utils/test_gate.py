@@ -0,0 +1,32 @@
+"""Test shared Gate API Session."""
+from unittest import mock
+
+from foremast.utils import gate
+from foremast.utils.gate import gate_request, gate_session
+
+
+@mock.patch('foremast.utils.gate.GATE_SESSION', None)
+def test_gate_session_reused():
+    """One Session is shared by all Gate requests."""
+    session = gate_session()
+
+    assert session is gate_session()
+    assert session.get_adapter('https://gate.example.com').max_retries.total == gate.GATE_RETRIES
+
+
+@mock.patch('foremast.utils.gate.API_URL', 'http://gate.example.com')
+@mock.patch('foremast.utils.gate.gate_session')
+def test_gate_request_relative_path(mock_session):
+    """Paths are prefixed with API_URL and use default timeout."""
+    gate_request(uri='/applications')
+
+    mock_session.return_value.request.assert_called_with(
+        'get', 'http://gate.example.com/applications', timeout=gate.GATE_TIMEOUT)
+
+
+@mock.patch('foremast.utils.gate.gate_session')
+def test_gate_request_full_url(mock_session):
+    """Full URLs are passed through untouched."""
+    gate_request('post', 'https://other.example.com/tasks', data='{}', timeout=5)
+
+    mock_session.return_value.request.assert_called_with('post', 'https://other.example.com/tasks', data='{}', timeout=5)
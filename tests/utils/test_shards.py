@@ -0,0 +1,34 @@
+"""Test splitting work into shards."""
+import pytest
+
+from foremast.utils.shards import parse_shard, select_shard
+
+APPS = ['group/app{0}'.format(number) for number in range(20)]
+
+
+def test_parse_shard():
+    """Shards are INDEX/COUNT counting from 0."""
+    assert parse_shard('0/4') == (0, 4)
+    assert parse_shard('3/4') == (3, 4)
+
+    for bad_shard in ('4/4', '1', '-1/2', 'a/b', '0/0'):
+        with pytest.raises(ValueError):
+            parse_shard(bad_shard)
+
+
+def test_select_shard_disjoint():
+    """Every item lands in exactly one shard, regardless of order."""
+    shards = [select_shard(APPS, index, 3, key=str) for index in range(3)]
+
+    assert sorted(sum(shards, [])) == sorted(APPS)
+    assert select_shard(list(reversed(APPS)), 1, 3, key=str) == list(reversed(shards[1]))
+
+
+def test_select_shard_weighted():
+    """Weighted shards balance total weight."""
+    weights = {app: (5 if app.endswith(('0', '1')) else 1) for app in APPS}
+    shards = [select_shard(APPS, index, 2, key=str, weight=weights.get) for index in range(2)]
+
+    assert sorted(sum(shards, [])) == sorted(APPS)
+    totals = [sum(weights[app] for app in shard) for shard in shards]
+    assert abs(totals[0] - totals[1]) <= 1
@@ -0,0 +1,158 @@
+"""Test SNS topic and subscription lookups."""
+import json
+from unittest import mock
+
+import pytest
+
+from foremast.awslambda.sns_event.destroy_sns_event import destroy_sns_event
+from foremast.exceptions import SNSTopicNotFound
+from foremast.utils import get_lambda_sns_topics, get_sns_subscriptions, get_sns_topic_arn
+
+ALIAS_ARN = 'arn:aws:lambda:us-east-1:222572804561:function:lambdatest:dev'
+TOPIC_ARN = 'arn:aws:sns:us-east-1:222572804561:{0}'
+
+
+@mock.patch('foremast.utils.get_sns_topic_arn.get_boto_client')
+def test_get_sns_topic_arn_paginated(mock_client):
+    """Topics past the first page are found and indexed once."""
+    paginate = mock_client.return_value.get_paginator.return_value.paginate
+    paginate.return_value = [
+        {'Topics': [{'TopicArn': TOPIC_ARN.format('first')}]},
+        {'Topics': [{'TopicArn': TOPIC_ARN.format('second')}]},
+    ]
+
+    assert get_sns_topic_arn('second', 'dev', 'us-east-1') == TOPIC_ARN.format('second')
+    assert get_sns_topic_arn('first', 'dev', 'us-east-1') == TOPIC_ARN.format('first')
+    assert get_sns_topic_arn(TOPIC_ARN.format('any'), 'dev', 'us-east-1') == TOPIC_ARN.format('any')
+    assert paginate.call_count == 1
+
+
+@mock.patch('foremast.utils.get_sns_topic_arn.get_boto_client')
+def test_get_sns_topic_arn_refresh(mock_client):
+    """Unknown topics refresh the index once before failing."""
+    paginate = mock_client.return_value.get_paginator.return_value.paginate
+    paginate.return_value = [{'Topics': []}]
+    get_sns_topic_arn(TOPIC_ARN.format('any'), 'dev', 'us-east-1')
+
+    with pytest.raises(SNSTopicNotFound):
+        get_sns_topic_arn('new', 'dev', 'us-east-1')
+    assert paginate.call_count == 2
+
+    paginate.return_value = [{'Topics': [{'TopicArn': TOPIC_ARN.format('new')}]}]
+    assert get_sns_topic_arn('new', 'dev', 'us-east-1') == TOPIC_ARN.format('new')
+
+
+@mock.patch('foremast.utils.get_sns_subscriptions.get_lambda_alias_arn')
+@mock.patch('foremast.utils.get_sns_subscriptions.get_boto_client')
+def test_get_sns_subscriptions_all_pages(mock_client, mock_alias_arn):
+    """Without topics, every page of account subscriptions is checked."""
+    mock_alias_arn.return_value = ALIAS_ARN
+    client = mock_client.return_value
+    client.get_paginator.return_value.paginate.return_value = [{
+        'Subscriptions': [{
+            'Protocol': 'lambda',
+            'Endpoint': 'other',
+            'SubscriptionArn': 'other:1'
+        }]
+    }, {
+        'Subscriptions': [{
+            'Protocol': 'lambda',
+            'Endpoint': ALIAS_ARN,
+            'SubscriptionArn': 'removed:1'
+        }]
+    }]
+
+    assert get_sns_subscriptions('lambdatest', 'dev', 'us-east-1') == ['removed:1']
+    client.get_paginator.assert_called_once_with('list_subscriptions')
+    client.get_policy.assert_not_called()
+
+
+@mock.patch('foremast.utils.get_sns_subscriptions.get_lambda_alias_arn')
+@mock.patch('foremast.utils.get_sns_subscriptions.get_boto_client')
+def test_get_sns_subscriptions_by_topic(mock_client, mock_alias_arn):
+    """Only the given topics are checked."""
+    mock_alias_arn.return_value = ALIAS_ARN
+    client = mock_client.return_value
+    client.get_paginator.return_value.paginate.return_value = [{
+        'Subscriptions': [{
+            'Protocol': 'lambda',
+            'Endpoint': ALIAS_ARN,
+            'SubscriptionArn': 'mine:1'
+        }, {
+            'Protocol': 'lambda',
+            'Endpoint': 'other',
+            'SubscriptionArn': 'mine:2'
+        }]
+    }]
+
+    topics = [TOPIC_ARN.format('mine')]
+    assert get_sns_subscriptions('lambdatest', 'dev', 'us-east-1', topics=topics) == ['mine:1']
+    client.get_paginator.assert_called_with('list_subscriptions_by_topic')
+    client.get_paginator.return_value.paginate.assert_called_once_with(TopicArn=TOPIC_ARN.format('mine'))
+
+
+@mock.patch('foremast.utils.get_sns_topic_arn.get_boto_client')
+@mock.patch('foremast.utils.get_sns_subscriptions.get_lambda_alias_arn')
+@mock.patch('foremast.utils.get_sns_subscriptions.get_boto_client')
+def test_get_sns_subscriptions_missing_topic(mock_client, mock_alias_arn, mock_topic_client):
+    """Topics that no longer exist are skipped."""
+    mock_alias_arn.return_value = ALIAS_ARN
+    mock_topic_client.return_value.get_paginator.return_value.paginate.return_value = [{'Topics': []}]
+    client = mock_client.return_value
+    client.get_paginator.return_value.paginate.return_value = [{
+        'Subscriptions': [{
+            'Protocol': 'lambda',
+            'Endpoint': ALIAS_ARN,
+            'SubscriptionArn': 'mine:1'
+        }]
+    }]
+
+    topics = ['deleted', TOPIC_ARN.format('mine'), TOPIC_ARN.format('mine')]
+    assert get_sns_subscriptions('lambdatest', 'dev', 'us-east-1', topics=topics) == ['mine:1']
+    client.get_paginator.return_value.paginate.assert_called_once_with(TopicArn=TOPIC_ARN.format('mine'))
+
+
+@mock.patch('foremast.utils.get_sns_subscriptions.get_boto_client')
+def test_get_lambda_sns_topics(mock_client):
+    """Topics come from SNS statements in the alias policy."""
+    mock_client.return_value.get_policy.return_value = {
+        'Policy':
+        json.dumps({
+            'Statement': [{
+                'Principal': {
+                    'Service': 'sns.amazonaws.com'
+                },
+                'Condition': {
+                    'ArnLike': {
+                        'AWS:SourceArn': TOPIC_ARN.format('orphan')
+                    }
+                }
+            }, {
+                'Principal': {
+                    'Service': 's3.amazonaws.com'
+                }
+            }]
+        })
+    }
+
+    assert get_lambda_sns_topics(ALIAS_ARN, 'dev', 'us-east-1') == [TOPIC_ARN.format('orphan')]
+
+
+@mock.patch('foremast.awslambda.sns_event.destroy_sns_event.destroy_sns_event.get_sns_subscriptions')
+@mock.patch('foremast.awslambda.sns_event.destroy_sns_event.destroy_sns_event.get_lambda_sns_topics')
+@mock.patch('foremast.awslambda.sns_event.destroy_sns_event.destroy_sns_event.get_lambda_alias_arn')
+@mock.patch('foremast.awslambda.sns_event.destroy_sns_event.destroy_sns_event.get_boto_client')
+def test_destroy_sns_event_topics(mock_client, mock_alias_arn, mock_policy_topics, mock_subscriptions):
+    """Configured and policy topics are checked, or all with scan_all."""
+    mock_alias_arn.return_value = ALIAS_ARN
+    mock_policy_topics.return_value = [TOPIC_ARN.format('orphan')]
+    mock_subscriptions.return_value = ['mine:1', 'orphan:1']
+    triggers = [{'type': 'sns', 'topic': 'mine'}, {'type': 's3', 'bucket': 'bucket'}]
+
+    assert destroy_sns_event('lambdatest', 'dev', 'us-east-1', triggers=triggers)
+    mock_subscriptions.assert_called_once_with(
+        app_name='lambdatest', env='dev', region='us-east-1', topics=['mine', TOPIC_ARN.format('orphan')])
+    assert mock_client.return_value.unsubscribe.call_count == 2
+
+    destroy_sns_event('lambdatest', 'dev', 'us-east-1', scan_all=True)
+    assert mock_subscriptions.call_args[1]['topics'] is None